@@ -0,0 +1,245 @@
+"""
+' @file load_test.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Load test for the SyrServer transliteration server
+'
+' @description: This file sends lines of a synthetic corpus to a running
+'               SyrServer over several connections at once, or to a server
+'               it starts itself with --spawn, and reports the throughput,
+'               the latency seen by the clients and the statistics of the
+'               server as JSON.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f"{script_dir}/../src/"
+
+sys.path.insert(1, src_dir)
+
+from SyrServer import TransliterationServer, percentile
+from syriac_corpus import generate_corpus
+
+
+async def open_connection(args: Any) -> Any:
+    """
+    Connect to the server.
+
+    Parameters:
+        args (Any): The parsed command-line arguments.
+
+    Returns:
+        Any: The reader and writer of the connection.
+    """
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def run_client(
+    args: Any, texts: List[str], latencies: List[float]
+) -> int:
+    """
+    Send texts on one connection with at most args.pipeline requests
+    awaiting a response.
+
+    Parameters:
+        args (Any): The parsed command-line arguments.
+        texts (List[str]): The texts to send.
+        latencies (List[float]): Receives the latency of each request, in
+        seconds.
+
+    Returns:
+        int: Number of error responses.
+    """
+    reader, writer = await open_connection(args)
+    window = asyncio.Semaphore(args.pipeline)
+    sent: List[float] = []
+
+    async def send() -> None:
+        for index, text in enumerate(texts):
+            await window.acquire()
+            request: Dict[str, Any] = {"id": index, "text": text}
+            if args.dialect:
+                request["dialect"] = args.dialect
+            if args.ipa:
+                request["ipa"] = args.ipa
+            sent.append(time.perf_counter())
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+
+    sender = asyncio.ensure_future(send())
+    errors: int = 0
+    for index in range(len(texts)):
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent[index])
+        window.release()
+        if "error" in response:
+            errors += 1
+    await sender
+    writer.close()
+    return errors
+
+
+async def fetch_stats(args: Any) -> Dict[str, Any]:
+    """
+    Ask the server for its statistics.
+
+    Parameters:
+        args (Any): The parsed command-line arguments.
+
+    Returns:
+        Dict[str, Any]: The statistics.
+    """
+    reader, writer = await open_connection(args)
+    writer.write(b'{"op": "stats"}\n')
+    stats: Dict[str, Any] = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+
+async def load_test(args: Any) -> Dict[str, Any]:
+    """
+    Run the load test, starting a server first if args.spawn is set.
+
+    Parameters:
+        args (Any): The parsed command-line arguments.
+
+    Returns:
+        Dict[str, Any]: The settings, client-side results and server
+        statistics.
+    """
+    server: Optional[TransliterationServer] = None
+    listener: Optional[asyncio.AbstractServer] = None
+    if args.spawn:
+        server = TransliterationServer(
+            workers=args.workers,
+            batch_size=args.batch_size,
+            batch_window=args.batch_window / 1e3,
+            preload=[(args.dialect, args.ipa)],
+        )
+        await server.start()
+        if args.unix:
+            listener = await server.listen_unix(args.unix)
+        else:
+            listener = await server.listen_tcp(args.host, args.port)
+            args.port = listener.sockets[0].getsockname()[1]
+
+    try:
+        corpus: List[str] = generate_corpus(args.requests, seed=args.seed)
+        shares: List[List[str]] = [
+            corpus[index :: args.connections]
+            for index in range(args.connections)
+        ]
+        latencies: List[float] = []
+        start: float = time.perf_counter()
+        errors: List[int] = await asyncio.gather(
+            *(run_client(args, share, latencies) for share in shares)
+        )
+        elapsed: float = time.perf_counter() - start
+        stats: Dict[str, Any] = await fetch_stats(args)
+    finally:
+        if listener is not None:
+            listener.close()
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    return {
+        "settings": {
+            "requests": args.requests,
+            "connections": args.connections,
+            "pipeline": args.pipeline,
+            "dialect": args.dialect,
+            "ipa": args.ipa,
+            "spawned": bool(args.spawn),
+        },
+        "client": {
+            "seconds": elapsed,
+            "requests_per_s": len(latencies) / elapsed if elapsed else 0.0,
+            "errors": sum(errors),
+            "latency_ms": {
+                "p50": percentile(latencies, 0.5) * 1e3,
+                "p90": percentile(latencies, 0.9) * 1e3,
+                "p99": percentile(latencies, 0.99) * 1e3,
+                "max": (latencies[-1] if latencies else 0.0) * 1e3,
+            },
+        },
+        "server": stats,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the load test from the command line.
+
+    Parameters:
+        argv (Optional[List[str]]): The arguments, without the program
+        name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        description="Send a synthetic corpus to SyrServer and report the "
+        "throughput and latency."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="connect to this Unix socket")
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="start a server in this process, on a free port unless "
+        "--unix is given",
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument(
+        "--pipeline",
+        type=int,
+        default=16,
+        help="requests awaiting a response per connection",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dialect", default="")
+    parser.add_argument("--ipa", default="")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="workers of a spawned server"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=64, help="of a spawned server"
+    )
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=2.0,
+        help="milliseconds, of a spawned server",
+    )
+    args = parser.parse_args(argv)
+    if args.spawn and not args.unix:
+        args.port = 0
+    if args.requests < 1 or args.connections < 1 or args.pipeline < 1:
+        parser.error(
+            "--requests, --connections and --pipeline must be positive"
+        )
+
+    print(json.dumps(asyncio.run(load_test(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
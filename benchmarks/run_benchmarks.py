@@ -0,0 +1,266 @@
+"""
+' @file run_benchmarks.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Timing benchmarks for SyrTransliterator and SyrTools
+'
+' @description: This file times each transliteration stage, the SyrTools
+'               predicates and engine construction separately on a
+'               synthetic corpus, and writes the results as JSON so that
+'               runs on different commits can be compared.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f"{script_dir}/../src/"
+
+sys.path.insert(1, src_dir)
+
+from SyrTools import SyrTools
+from SyrTransliterator import SyrTransliterator
+from syriac_corpus import generate_corpus
+
+
+def time_stage(
+    func: Callable[[str], Any], inputs: List[str], repeat: int
+) -> Dict[str, float]:
+    """
+    Time a function over every input, several times.
+
+    Parameters:
+        func (Callable[[str], Any]): The function to time.
+        inputs (List[str]): The arguments, one call each.
+        repeat (int): Number of timed passes over the inputs.
+
+    Returns:
+        Dict[str, float]: The best and median pass in seconds, and the
+        microseconds per call and characters per second of the best pass.
+    """
+    passes: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for text in inputs:
+            func(text)
+        passes.append(time.perf_counter() - start)
+    best: float = min(passes)
+    chars: int = sum(len(text) for text in inputs)
+    return {
+        "best_s": best,
+        "median_s": statistics.median(passes),
+        "us_per_call": best / max(len(inputs), 1) * 1e6,
+        "chars_per_s": chars / best if best else 0.0,
+    }
+
+
+def time_construction(
+    build: Callable[[], Any], count: int, repeat: int
+) -> Dict[str, float]:
+    """
+    Time building an object.
+
+    Parameters:
+        build (Callable[[], Any]): Builds one object.
+        count (int): Number of objects built per pass.
+        repeat (int): Number of timed passes.
+
+    Returns:
+        Dict[str, float]: The best and median milliseconds per object.
+    """
+    passes: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for _ in range(count):
+            build()
+        passes.append((time.perf_counter() - start) / count * 1e3)
+    return {"best_ms": min(passes), "median_ms": statistics.median(passes)}
+
+
+def git_revision() -> Optional[str]:
+    """
+    Return the commit of the working tree, if it is a git checkout.
+
+    Returns:
+        Optional[str]: The commit hash, or None.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=script_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    lines: int = 2000,
+    seed: int = 0,
+    repeat: int = 5,
+    dialect: str = "koine",
+    ipa: str = "intermediate",
+) -> Dict[str, Any]:
+    """
+    Run every benchmark.
+
+    Parameters:
+        lines (int): Number of corpus lines.
+        seed (int): Corpus random seed.
+        repeat (int): Number of timed passes per benchmark.
+        dialect (str): Bundled dialect of the engine.
+        ipa (str): Bundled IPA mapping of the engine.
+
+    Returns:
+        Dict[str, Any]: The run metadata and the results of each benchmark.
+    """
+    corpus: List[str] = generate_corpus(lines, seed=seed)
+    dialect_file: str = os.path.join(
+        SyrTransliterator.DIALECTS_DIR, f"{dialect}.json"
+    )
+    ipa_file: str = os.path.join(SyrTransliterator.IPA_MAPS_DIR, f"{ipa}.json")
+    engine = SyrTransliterator(dialect_file, ipa_file)
+    tools = SyrTools()
+
+    # The input of each stage is the output of the stage before it.
+    ipa_texts: List[str] = [
+        engine.remove_siyame(engine.encode_ipa(text)) for text in corpus
+    ]
+    natural_texts: List[str] = [
+        engine.naturalize_ipa(text) for text in ipa_texts
+    ]
+
+    results: Dict[str, Dict[str, float]] = {
+        "encode_ipa": time_stage(engine.encode_ipa, corpus, repeat),
+        "naturalize_ipa": time_stage(
+            engine.naturalize_ipa, ipa_texts, repeat
+        ),
+        "ipa_to_roman": time_stage(engine.ipa_to_roman, natural_texts, repeat),
+        "reverse_transliterate": time_stage(
+            engine.reverse_transliterate, ipa_texts, repeat
+        ),
+        "transliterate": time_stage(engine.transliterate, corpus, repeat),
+    }
+    for name in (
+        "ratio",
+        "isSyr",
+        "containsSyr",
+        "eastern",
+        "western",
+        "contains_vowels",
+        "contains_garshuni",
+    ):
+        results[f"SyrTools.{name}"] = time_stage(
+            getattr(tools, name), corpus, repeat
+        )
+
+    results["construct.default"] = time_construction(
+        SyrTransliterator, 20, repeat
+    )
+    results["construct.dialect"] = time_construction(
+        lambda: SyrTransliterator(dialect_file, ipa_file), 20, repeat
+    )
+    results["construct.for_dialect"] = time_construction(
+        lambda: SyrTransliterator.for_dialect(dialect, ipa), 1000, repeat
+    )
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "lines": lines,
+            "chars": sum(len(text) for text in corpus),
+            "seed": seed,
+            "repeat": repeat,
+            "dialect": dialect,
+            "ipa": ipa,
+        },
+        "results": results,
+    }
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> str:
+    """
+    Describe the change of each benchmark between two runs.
+
+    Parameters:
+        previous (Dict[str, Any]): An earlier output of run_benchmarks().
+        current (Dict[str, Any]): A later output of run_benchmarks().
+
+    Returns:
+        str: One line per benchmark present in both runs, giving the ratio
+        of the current to the previous best time.
+    """
+    rows: List[str] = []
+    for name, result in current["results"].items():
+        old = previous["results"].get(name)
+        if old is None:
+            continue
+        key: str = "best_s" if "best_s" in result else "best_ms"
+        ratio: float = result[key] / old[key] if old[key] else 0.0
+        rows.append(f"{name:32} {ratio:7.2f}x")
+    return "\n".join(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    Parameters:
+        argv (Optional[List[str]]): The arguments, without the program
+        name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        description="Time the transliteration stages on a synthetic corpus."
+    )
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dialect", default="koine")
+    parser.add_argument("--ipa", default="intermediate")
+    parser.add_argument(
+        "-o", "--output", help="write the JSON results to this file"
+    )
+    parser.add_argument(
+        "--compare",
+        help="JSON results of an earlier run to compare against",
+    )
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = run_benchmarks(
+        args.lines, args.seed, args.repeat, args.dialect, args.ipa
+    )
+    text: str = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print(compare(json.load(f), report), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+' @file syriac_corpus.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Synthetic Syriac corpus generator for benchmarks
+'
+' @description: This file builds reproducible Syriac text out of the
+'               letters, vowels and marks defined in SyrTools. Words are
+'               drawn from a synthetic vocabulary with a Zipfian
+'               distribution, so that common words repeat as in real text.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import itertools
+import os
+import random
+import sys
+from typing import List
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f"{script_dir}/../src/"
+
+sys.path.insert(1, src_dir)
+
+from SyrTools import SyrTools
+
+T = SyrTools
+
+# Letters that take rukakha or qushshaya.
+BGDKPT: str = "ܒܓܕܟܦܬ"
+
+# Letters used to build words, without the rare and Garshuni forms.
+WORD_LETTERS: str = "ܐܒܓܕܗܘܙܚܛܝܟܠܡܢܣܥܦܨܩܪܫܬ"
+
+# Vowel-bearing letter combinations.
+MATRES_LECTIONIS: List[str] = ["ܘܼ", "ܘܿ", "ܝܼ"]
+
+# Eastern and Western vowel points.
+EASTERN_VOWELS: List[str] = list(T.EASTERN_VOWELS)
+WESTERN_VOWELS: List[str] = list(T.WESTERN_VOWELS)
+
+# Words with special readings and abbreviations.
+SPECIAL_WORDS: List[str] = [
+    "ܗ̇ܘ",
+    "ܗ̇ܝ",
+    "ܝܠܹܗ",
+    "ܝܠܵܗ̇",
+    "ܡ̣ܢ",
+    "ܟܠ",
+    "ܩܫ܊",
+]
+
+# Sentence-ending punctuation.
+SENTENCE_ENDS: List[str] = [".", ".", ".", "؟", "!", T.END_OF_PARAGRAPH]
+
+
+def make_word(
+    rnd: random.Random, vocalized: bool, western: bool = False
+) -> str:
+    """
+    Build one synthetic Syriac word.
+
+    Parameters:
+        rnd (random.Random): The random source.
+        vocalized (bool): Whether to add vowel points.
+        western (bool): Whether to use Western instead of Eastern vowels.
+
+    Returns:
+        str: The word.
+    """
+    vowels: List[str] = WESTERN_VOWELS if western else EASTERN_VOWELS
+    parts: List[str] = []
+    # Prefixed bdol letters.
+    if rnd.random() < 0.2:
+        parts.append(rnd.choice("ܒܕܘܠ"))
+    for _ in range(rnd.randint(2, 6)):
+        if vocalized and rnd.random() < 0.12:
+            parts.append(rnd.choice(MATRES_LECTIONIS))
+            continue
+        letter: str = rnd.choice(WORD_LETTERS)
+        parts.append(letter)
+        if letter in BGDKPT and rnd.random() < 0.25:
+            parts.append(rnd.choice((T.RUKKAKHA, T.QUSHSHAYA)))
+        if vocalized and rnd.random() < 0.6:
+            parts.append(rnd.choice(vowels))
+    if rnd.random() < 0.05:
+        parts.append(T.COMBINING_DIAERESIS)
+    if rnd.random() < 0.03:
+        parts.append(T.COMBINING_MACRON_BELOW)
+    return "".join(parts)
+
+
+def make_vocabulary(
+    size: int,
+    seed: int = 0,
+    vocalized_ratio: float = 0.7,
+    western_ratio: float = 0.0,
+) -> List[str]:
+    """
+    Build a vocabulary of distinct synthetic words, most frequent first.
+
+    Parameters:
+        size (int): Number of words.
+        seed (int): Random seed.
+        vocalized_ratio (float): Share of words with vowel points.
+        western_ratio (float): Share of vocalized words with Western vowels.
+
+    Returns:
+        List[str]: The words. Words with special readings lead the list, as
+        they are among the most frequent in real text.
+    """
+    rnd = random.Random(seed)
+    words: List[str] = list(SPECIAL_WORDS[:size])
+    seen = set(words)
+    while len(words) < size:
+        vocalized: bool = rnd.random() < vocalized_ratio
+        word: str = make_word(
+            rnd, vocalized, vocalized and rnd.random() < western_ratio
+        )
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def generate_corpus(
+    lines: int,
+    words_per_line: int = 12,
+    seed: int = 0,
+    vocabulary_size: int = 5000,
+    zipf_exponent: float = 1.07,
+    vocalized_ratio: float = 0.7,
+    western_ratio: float = 0.0,
+) -> List[str]:
+    """
+    Generate reproducible lines of Syriac text.
+
+    Parameters:
+        lines (int): Number of lines.
+        words_per_line (int): Average number of words per line.
+        seed (int): Random seed; equal arguments give equal corpora.
+        vocabulary_size (int): Number of distinct words.
+        zipf_exponent (float): Exponent s of the Zipfian word distribution,
+        where the word of rank r has weight 1 / r**s.
+        vocalized_ratio (float): Share of vocabulary words with vowel
+        points.
+        western_ratio (float): Share of vocalized words with Western
+        vowels.
+
+    Returns:
+        List[str]: The lines, without line breaks.
+    """
+    vocabulary: List[str] = make_vocabulary(
+        vocabulary_size, seed, vocalized_ratio, western_ratio
+    )
+    cumulative: List[float] = list(
+        itertools.accumulate(
+            1.0 / rank**zipf_exponent
+            for rank in range(1, len(vocabulary) + 1)
+        )
+    )
+    rnd = random.Random(seed + 1)
+    corpus: List[str] = []
+    for _ in range(lines):
+        count: int = max(1, round(rnd.gauss(words_per_line, 3)))
+        words: List[str] = rnd.choices(
+            vocabulary, cum_weights=cumulative, k=count
+        )
+        line: str = ""
+        for index, word in enumerate(words):
+            line += word
+            if index == len(words) - 1:
+                line += rnd.choice(SENTENCE_ENDS)
+            elif rnd.random() < 0.08:
+                line += rnd.choice(SENTENCE_ENDS) + " "
+            else:
+                line += " "
+        corpus.append(line)
+    return corpus
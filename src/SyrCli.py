@@ -0,0 +1,432 @@
+"""
+' @file SyrCli.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Command-line transliteration of Syriac text
+'
+' @description: This file contains the command-line entry point that
+'               streams Syriac text from files or standard input through
+'               SyrTransliterator, for use in shell pipelines. Run it with
+'               `python -m SyrCli` from the src directory, or
+'               `python src/SyrCli.py`.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+from SyrTransliterator import SyrTransliterator
+
+# Size of the read and write buffers, in bytes.
+IO_BUFFER_SIZE: int = 1 << 20
+
+# Output fields, in the order they are written.
+FIELDS: Tuple[str, ...] = SyrTransliterator.OUTPUTS
+
+# An input record: its id (None outside of JSONL mode) and its text.
+Record = Tuple[Any, str]
+
+# Escapes of the text output fields in line mode, so that a field never
+# holds a field or record separator. Paragraph mode keeps the newlines of
+# its records.
+LINE_ESCAPES: Dict[int, str] = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\r": "\\r", "\n": "\\n"}
+)
+PARAGRAPH_ESCAPES: Dict[int, str] = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\r": "\\r"}
+)
+
+
+def resolve_map_file(value: str, directory: str) -> str:
+    """
+    Turn a --dialect or --ipa-map value into a mapping file path.
+
+    Parameters:
+        value (str): The name of a bundled mapping, a path to a JSON file,
+        or "" for the default mapping.
+        directory (str): The directory of the bundled mappings.
+
+    Returns:
+        str: The path of the mapping file, or "" for the default mapping.
+
+    Raises:
+        ValueError: If the value is neither a bundled name nor a file.
+    """
+    if value == "" or os.path.isfile(value):
+        return value
+    path: str = os.path.join(directory, f"{value}.json")
+    if os.path.isfile(path):
+        return path
+    available: List[str] = sorted(
+        name[: -len(".json")]
+        for name in os.listdir(directory)
+        if name.endswith(".json")
+    )
+    raise ValueError(
+        f"{value!r} is not a file or one of {', '.join(available)}"
+    )
+
+
+def open_text(name: str, mode: str) -> TextIO:
+    """
+    Open a UTF-8 text file with a large buffer.
+
+    Parameters:
+        name (str): The file name; "-" is standard input or output.
+        mode (str): "r" or "w".
+
+    Returns:
+        TextIO: The open file. Closing it leaves standard input and output
+        open.
+    """
+    if name == "-":
+        fd: int = sys.stdin.fileno() if mode == "r" else sys.stdout.fileno()
+        return open(
+            fd,
+            mode,
+            encoding="utf-8",
+            buffering=IO_BUFFER_SIZE,
+            closefd=False,
+        )
+    return open(name, mode, encoding="utf-8", buffering=IO_BUFFER_SIZE)
+
+
+def close_output(outfile: TextIO) -> None:
+    """
+    Close an output file, ignoring a reader that went away.
+
+    Parameters:
+        outfile (TextIO): The output file.
+    """
+    try:
+        outfile.close()
+    except BrokenPipeError:
+        pass
+
+
+def read_records(
+    infile: TextIO, mode: str, text_field: str, id_field: str
+) -> Iterator[Record]:
+    """
+    Split an input file into records.
+
+    Parameters:
+        infile (TextIO): The input, opened in text mode.
+        mode (str): "line" for one record per line, "paragraph" for records
+        separated by blank lines, or "jsonl" for one JSON object per line.
+        text_field (str): Key of the text in JSONL objects.
+        id_field (str): Key of the id in JSONL objects, passed through to
+        the output.
+
+    Returns:
+        Iterator[Record]: The id and text of each record.
+
+    Raises:
+        ValueError: If a JSONL line is not an object with a text field.
+    """
+    if mode == "line":
+        for line in infile:
+            yield None, line.rstrip("\r\n")
+    elif mode == "paragraph":
+        paragraph: List[str] = []
+        for line in infile:
+            if line.strip():
+                paragraph.append(line)
+            elif paragraph:
+                yield None, "".join(paragraph).rstrip("\r\n")
+                paragraph = []
+        if paragraph:
+            yield None, "".join(paragraph).rstrip("\r\n")
+    else:
+        for number, line in enumerate(infile, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+                text = obj[text_field]
+            except (ValueError, TypeError, KeyError) as error:
+                raise ValueError(
+                    f"line {number}: expected a JSON object with a "
+                    f"{text_field!r} string ({error})"
+                ) from None
+            if not isinstance(text, str):
+                raise ValueError(f"line {number}: {text_field!r} is not text")
+            yield obj.get(id_field), text
+
+
+def format_record(
+    record_id: Any,
+    result: Dict[str, str],
+    mode: str,
+    fields: List[str],
+    id_field: str,
+) -> str:
+    """
+    Format the transliteration of a record for output.
+
+    Parameters:
+        record_id (Any): The id of the record, or None.
+        result (Dict[str, str]): The output of transliterate().
+        mode (str): The input mode, see read_records().
+        fields (List[str]): The fields to write.
+        id_field (str): Key of the id in JSONL output.
+
+    Returns:
+        str: One JSON object per line in JSONL mode; otherwise the fields
+        separated by tabs, followed by a newline, or by a blank line in
+        paragraph mode. Backslashes, tabs and carriage returns in the
+        fields are escaped with a backslash as in C string literals, and so
+        are newlines in line mode.
+    """
+    if mode == "jsonl":
+        out: Dict[str, Any] = {}
+        if record_id is not None:
+            out[id_field] = record_id
+        for field in fields:
+            out[field] = result[field]
+        return json.dumps(out, ensure_ascii=False) + "\n"
+    escapes: Dict[int, str] = LINE_ESCAPES
+    end: str = "\n"
+    if mode == "paragraph":
+        escapes = PARAGRAPH_ESCAPES
+        end = "\n\n"
+    return (
+        "\t".join(result[field].translate(escapes) for field in fields) + end
+    )
+
+
+def transliterate_records(
+    engine: SyrTransliterator,
+    records: Iterator[Record],
+    jobs: int,
+    chunksize: int,
+    fields: List[str],
+    vowel_system: str = "auto",
+) -> Iterator[Tuple[Any, Dict[str, str]]]:
+    """
+    Transliterate records in input order, on worker processes if jobs > 1.
+
+    Parameters:
+        engine (SyrTransliterator): The engine to use.
+        records (Iterator[Record]): The input records.
+        jobs (int): Number of worker processes.
+        chunksize (int): Number of records sent to a worker at a time.
+        fields (List[str]): The forms to compute.
+        vowel_system (str): The vowel system of the records, see
+        SyrTransliterator.transliterate().
+
+    Returns:
+        Iterator[Tuple[Any, Dict[str, str]]]: The id and transliteration of
+        each record.
+    """
+    if jobs <= 1:
+        for record_id, text in records:
+            yield record_id, engine.transliterate(text, fields, vowel_system)
+        return
+
+    # Ids of the records handed to the workers and not yet written.
+    pending_ids: Deque[Any] = deque()
+
+    def texts() -> Iterator[str]:
+        for record_id, text in records:
+            pending_ids.append(record_id)
+            yield text
+
+    for result in engine.transliterate_many(
+        texts(), jobs, chunksize, fields, vowel_system
+    ):
+        yield pending_ids.popleft(), result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="SyrCli",
+        description="Transliterate Syriac text into IPA and Roman script.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="input files; - or none reads standard input",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="output file; - writes standard output (default)",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=("line", "paragraph", "jsonl"),
+        default="line",
+        help="one record per line (default), per blank-line separated "
+        "paragraph, or per JSON object line",
+    )
+    parser.add_argument(
+        "-d",
+        "--dialect",
+        default="",
+        help="bundled dialect name or dialect JSON file",
+    )
+    parser.add_argument(
+        "-i",
+        "--ipa-map",
+        default="",
+        help="bundled IPA mapping name or IPA mapping JSON file",
+    )
+    parser.add_argument(
+        "-f",
+        "--fields",
+        default="romanized",
+        help="comma-separated fields to write, from "
+        f"{','.join(FIELDS)} (default: romanized)",
+    )
+    parser.add_argument(
+        "-V",
+        "--vowel-system",
+        choices=SyrTransliterator.VOWEL_SYSTEMS,
+        default="auto",
+        help="vowel system of the input; eastern or western skips its "
+        "detection (default: auto)",
+    )
+    parser.add_argument(
+        "--text-field",
+        default="text",
+        help="key of the text in JSONL input (default: text)",
+    )
+    parser.add_argument(
+        "--id-field",
+        default="id",
+        help="key of the id passed through in JSONL mode (default: id)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes; output stays in input order",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=256,
+        help="records sent to a worker at a time (default: 256)",
+    )
+    parser.add_argument(
+        "--word-cache",
+        type=int,
+        default=1 << 16,
+        help="words memoized per process; 0 disables (default: 65536)",
+    )
+    parser.add_argument(
+        "--table-cache",
+        metavar="DIR",
+        help="load the compiled tables from DIR, building them there on "
+        "first use; DIR must only be writable by you (default: no cache)",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Parameters:
+        argv (Optional[List[str]]): The arguments, without the program
+        name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    fields: List[str] = [f.strip() for f in args.fields.split(",") if f]
+    unknown: List[str] = [f for f in fields if f not in FIELDS]
+    if not fields or unknown:
+        parser.error(
+            f"--fields must name some of {', '.join(FIELDS)}"
+            + (f"; unknown: {', '.join(unknown)}" if unknown else "")
+        )
+    if args.jobs < 1 or args.chunksize < 1 or args.word_cache < 0:
+        parser.error(
+            "--jobs and --chunksize must be positive and --word-cache must "
+            "not be negative"
+        )
+
+    try:
+        dialect_file: str = resolve_map_file(
+            args.dialect, SyrTransliterator.DIALECTS_DIR
+        )
+        ipa_file: str = resolve_map_file(
+            args.ipa_map, SyrTransliterator.IPA_MAPS_DIR
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    engine = SyrTransliterator.load_cached(
+        dialect_map_filename=dialect_file,
+        ipa_mapping_filename=ipa_file,
+        word_cache_size=args.word_cache,
+        cache_dir=args.table_cache,
+    )
+
+    # The stack closes every file opened so far, also when opening a later
+    # one fails.
+    with contextlib.ExitStack() as files:
+        try:
+            infiles: List[TextIO] = [
+                files.enter_context(open_text(name, "r"))
+                for name in args.inputs
+            ]
+            outfile: TextIO = open_text(args.output, "w")
+            files.callback(close_output, outfile)
+        except OSError as error:
+            parser.error(str(error))
+
+        records: Iterator[Record] = itertools.chain.from_iterable(
+            read_records(infile, args.mode, args.text_field, args.id_field)
+            for infile in infiles
+        )
+        try:
+            for record_id, result in transliterate_records(
+                engine,
+                records,
+                args.jobs,
+                args.chunksize,
+                fields,
+                args.vowel_system,
+            ):
+                outfile.write(
+                    format_record(
+                        record_id, result, args.mode, fields, args.id_field
+                    )
+                )
+        except ValueError as error:
+            print(f"{parser.prog}: error: {error}", file=sys.stderr)
+            return 1
+        except BrokenPipeError:
+            # The reader went away, e.g. `| head`; stop quietly.
+            sys.stderr.close()
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
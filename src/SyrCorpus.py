@@ -0,0 +1,512 @@
+"""
+' @file SyrCorpus.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Memory-mapped corpus transliteration with an output offset index
+'
+' @description: This file transliterates a UTF-8 corpus file record by
+'               record without reading it into memory, through a memory
+'               map. Each output form is appended to its own file, and a
+'               binary index records the byte range of every record in
+'               every output file, so that any record can be read back in
+'               constant time. Run it with `python -m SyrCorpus` from the
+'               src directory, or `python src/SyrCorpus.py`.
+'
+'               Index layout (little-endian):
+'                   header: magic b"SYRIDX01", uint32 number of fields F,
+'                           uint32 length of the unpadded names, uint64
+'                           number of records N, uint32 length of the
+'                           separator, uint32 reserved
+'                   names:  the field names joined by "\n", then the
+'                           separator, in UTF-8; zero bytes pad them to
+'                           a multiple of 8 bytes
+'                   rows:   N + 1 rows of F uint64 byte offsets; row i
+'                           holds where record i starts in each output
+'                           file, and row N the file sizes
+'               Record i of a field spans from its offset in row i to its
+'               offset in row i + 1, less the separator written after it.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import argparse
+import codecs
+import mmap
+import os
+import struct
+import sys
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+from SyrCli import resolve_map_file
+from SyrTransliterator import SyrTransliterator
+
+INDEX_MAGIC: bytes = b"SYRIDX01"
+
+# Magic, field count, length of the names, record count, length of the
+# separator and a reserved word.
+INDEX_HEADER: struct.Struct = struct.Struct("<8sIIQII")
+
+# Size of the write buffers, in bytes.
+IO_BUFFER_SIZE: int = 1 << 20
+
+
+def index_path(prefix: str) -> str:
+    """
+    Return the index file of a transliterated corpus.
+
+    Parameters:
+        prefix (str): The output prefix of the corpus.
+
+    Returns:
+        str: The path of the index file.
+    """
+    return f"{prefix}.idx"
+
+
+def output_path(prefix: str, field: str) -> str:
+    """
+    Return the output file of one form of a transliterated corpus.
+
+    Parameters:
+        prefix (str): The output prefix of the corpus.
+        field (str): A name from SyrTransliterator.OUTPUTS.
+
+    Returns:
+        str: The path of the output file.
+    """
+    return f"{prefix}.{field}"
+
+
+def iter_records(path: str, delimiter: str = "\n") -> Iterator[str]:
+    """
+    Walk a UTF-8 file record by record through a memory map.
+
+    Parameters:
+        path (str): The input file.
+        delimiter (str): The text that ends each record; the last record
+        needs no delimiter.
+
+    Returns:
+        Iterator[str]: The records, without their delimiters.
+
+    Raises:
+        ValueError: If the delimiter is empty.
+        UnicodeDecodeError: If a record is not valid UTF-8.
+    """
+    if not delimiter:
+        raise ValueError("The record delimiter must not be empty")
+    separator: bytes = delimiter.encode("utf-8")
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start: int = 0
+            size: int = len(data)
+            while start < size:
+                end: int = data.find(separator, start)
+                if end == -1:
+                    end = size
+                yield data[start:end].decode("utf-8")
+                start = end + len(separator)
+
+
+def transliterate_corpus(
+    engine: SyrTransliterator,
+    path: str,
+    prefix: str,
+    fields: Sequence[str] = SyrTransliterator.OUTPUTS,
+    delimiter: str = "\n",
+    jobs: int = 1,
+    chunksize: int = 256,
+    vowel_system: str = "auto",
+) -> int:
+    """
+    Transliterate a corpus file into one output file per form and an
+    offset index.
+
+    Parameters:
+        engine (SyrTransliterator): The engine to use.
+        path (str): The UTF-8 input file.
+        prefix (str): The output prefix; the forms are written to
+        output_path(prefix, field) and the index to index_path(prefix).
+        fields (Sequence[str]): The forms to write, from
+        SyrTransliterator.OUTPUTS.
+        delimiter (str): The text that ends each input record. It is also
+        written after each output record.
+        jobs (int): Number of worker processes, see
+        SyrTransliterator.transliterate_many().
+        chunksize (int): Number of records sent to a worker at a time.
+        vowel_system (str): The vowel system of the corpus, see
+        SyrTransliterator.transliterate().
+
+    Returns:
+        int: The number of records.
+
+    Raises:
+        ValueError: If fields is empty or names an unknown form, or the
+        delimiter is empty.
+    """
+    fields = list(fields)
+    if not fields or not set(fields) <= SyrTransliterator.OUTPUT_SET:
+        raise ValueError(
+            f"Fields must be some of {', '.join(SyrTransliterator.OUTPUTS)}"
+        )
+    separator: bytes = delimiter.encode("utf-8")
+    names: bytes = "\n".join(fields).encode("utf-8") + separator
+
+    outfiles = [
+        open(output_path(prefix, field), "wb", buffering=IO_BUFFER_SIZE)
+        for field in fields
+    ]
+    count: int = 0
+    try:
+        with open(index_path(prefix), "wb", buffering=IO_BUFFER_SIZE) as index:
+            # The record count is filled in at the end.
+            index.write(
+                INDEX_HEADER.pack(
+                    INDEX_MAGIC, len(fields), len(names), 0, len(separator), 0
+                )
+            )
+            index.write(names + b"\0" * (-len(names) % 8))
+            row: struct.Struct = struct.Struct(f"<{len(fields)}Q")
+            offsets: List[int] = [0] * len(fields)
+            for result in engine.transliterate_many(
+                iter_records(path, delimiter),
+                jobs,
+                chunksize,
+                fields,
+                vowel_system,
+            ):
+                index.write(row.pack(*offsets))
+                for column, (field, outfile) in enumerate(
+                    zip(fields, outfiles)
+                ):
+                    data: bytes = result[field].encode("utf-8") + separator
+                    outfile.write(data)
+                    offsets[column] += len(data)
+                count += 1
+            index.write(row.pack(*offsets))
+            index.seek(0)
+            index.write(
+                INDEX_HEADER.pack(
+                    INDEX_MAGIC,
+                    len(fields),
+                    len(names),
+                    count,
+                    len(separator),
+                    0,
+                )
+            )
+    finally:
+        for outfile in outfiles:
+            outfile.close()
+    return count
+
+
+class CorpusReader:
+    """
+    Random access to the records of a corpus written by
+    transliterate_corpus(), through memory maps of its index and output
+    files.
+    """
+
+    __slots__ = (
+        "fields",
+        "separator",
+        "count",
+        "rows_start",
+        "row",
+        "files",
+        "maps",
+        "index_file",
+        "index",
+    )
+
+    def __init__(self, prefix: str) -> None:
+        """
+        Open a transliterated corpus.
+
+        Parameters:
+            prefix (str): The output prefix passed to transliterate_corpus().
+
+        Raises:
+            ValueError: If the index is not a corpus index or does not match
+            its output files.
+        """
+        self.index_file: BinaryIO = open(index_path(prefix), "rb")
+        self.files: List[BinaryIO] = []
+        self.maps: List[Optional[mmap.mmap]] = []
+        try:
+            self.index: mmap.mmap = mmap.mmap(
+                self.index_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            if len(self.index) < INDEX_HEADER.size:
+                raise ValueError(f"{index_path(prefix)} is not an index")
+            magic, field_count, names_size, count, separator_size, _ = (
+                INDEX_HEADER.unpack_from(self.index)
+            )
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"{index_path(prefix)} is not an index")
+            names: bytes = self.index[
+                INDEX_HEADER.size : INDEX_HEADER.size + names_size
+            ]
+            self.fields: List[str] = (
+                names[: len(names) - separator_size]
+                .decode("utf-8")
+                .split("\n")
+            )
+            self.separator: bytes = names[len(names) - separator_size :]
+            self.count: int = count
+            self.rows_start: int = INDEX_HEADER.size + names_size
+            self.rows_start += -self.rows_start % 8
+            self.row: struct.Struct = struct.Struct(f"<{field_count}Q")
+            if (
+                len(self.fields) != field_count
+                or len(self.index)
+                != self.rows_start + (count + 1) * self.row.size
+            ):
+                raise ValueError(f"{index_path(prefix)} is truncated")
+
+            sizes: Tuple[int, ...] = self.row.unpack_from(
+                self.index, self.rows_start + count * self.row.size
+            )
+            for field, size in zip(self.fields, sizes):
+                f = open(output_path(prefix, field), "rb")
+                self.files.append(f)
+                if os.fstat(f.fileno()).st_size != size:
+                    raise ValueError(
+                        f"{output_path(prefix, field)} does not match "
+                        f"{index_path(prefix)}"
+                    )
+                self.maps.append(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size
+                    else None
+                )
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        """
+        Return the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.count
+
+    def span(self, record: int, field: str) -> Tuple[int, int]:
+        """
+        Return the byte range of a record in the output file of a form.
+
+        Parameters:
+            record (int): The record number, from 0; negative numbers count
+            from the end.
+            field (str): One of the fields of the corpus.
+
+        Returns:
+            Tuple[int, int]: The start and end byte offsets, without the
+            separator.
+
+        Raises:
+            IndexError: If there is no such record.
+            ValueError: If the corpus has no such field.
+        """
+        if record < 0:
+            record += self.count
+        if not 0 <= record < self.count:
+            raise IndexError(f"Record {record} of {self.count}")
+        column: int = self.fields.index(field)
+        offset: int = self.rows_start + record * self.row.size + column * 8
+        start, end = struct.unpack_from(
+            "<Q", self.index, offset
+        ) + struct.unpack_from("<Q", self.index, offset + self.row.size)
+        return start, end - len(self.separator)
+
+    def get(self, record: int, field: str = "romanized") -> str:
+        """
+        Read one form of one record.
+
+        Parameters:
+            record (int): The record number, see span().
+            field (str): One of the fields of the corpus.
+
+        Returns:
+            str: The transliteration of the record.
+
+        Raises:
+            IndexError: If there is no such record.
+            ValueError: If the corpus has no such field.
+        """
+        start, end = self.span(record, field)
+        data: Optional[mmap.mmap] = self.maps[self.fields.index(field)]
+        return data[start:end].decode("utf-8") if data is not None else ""
+
+    def close(self) -> None:
+        """
+        Close the memory maps and files.
+        """
+        for data in self.maps:
+            if data is not None:
+                data.close()
+        for f in self.files:
+            f.close()
+        if getattr(self, "index", None) is not None:
+            self.index.close()
+        self.index_file.close()
+
+    def __enter__(self) -> "CorpusReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def parse_delimiter(value: str) -> str:
+    """
+    Parse a --delimiter value, in which backslash escapes such as \\n and
+    \\t are expanded.
+
+    Parameters:
+        value (str): The command-line value.
+
+    Returns:
+        str: The delimiter.
+    """
+    return (
+        codecs.decode(value.encode("utf-8"), "unicode_escape")
+        .encode("latin-1")
+        .decode("utf-8")
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="SyrCorpus",
+        description="Transliterate a corpus file into indexed output files, "
+        "or read records back from them.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build", help="transliterate a corpus and write its index"
+    )
+    build.add_argument("input", help="UTF-8 corpus file")
+    build.add_argument(
+        "prefix", help="output prefix: PREFIX.<field> and PREFIX.idx"
+    )
+    build.add_argument(
+        "--delimiter",
+        type=parse_delimiter,
+        default="\n",
+        help="record delimiter, with backslash escapes (default: \\n)",
+    )
+    build.add_argument("-d", "--dialect", default="")
+    build.add_argument("-i", "--ipa-map", default="")
+    build.add_argument(
+        "-f",
+        "--fields",
+        default=",".join(SyrTransliterator.OUTPUTS),
+        help="comma-separated forms to write (default: all)",
+    )
+    build.add_argument("-j", "--jobs", type=int, default=1)
+    build.add_argument("--chunksize", type=int, default=256)
+    build.add_argument(
+        "--word-cache",
+        type=int,
+        default=1 << 16,
+        help="words memoized per process; 0 disables (default: 65536)",
+    )
+    build.add_argument(
+        "--table-cache",
+        metavar="DIR",
+        help="load the compiled tables from DIR, building them there on "
+        "first use; DIR must only be writable by you (default: no cache)",
+    )
+    build.add_argument(
+        "-V",
+        "--vowel-system",
+        choices=SyrTransliterator.VOWEL_SYSTEMS,
+        default="auto",
+    )
+
+    get = commands.add_parser("get", help="print records of a corpus")
+    get.add_argument("prefix", help="output prefix given to build")
+    get.add_argument("records", type=int, nargs="+", help="record numbers")
+    get.add_argument("-f", "--field", default="romanized")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Parameters:
+        argv (Optional[List[str]]): The arguments, without the program
+        name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "get":
+        try:
+            with CorpusReader(args.prefix) as reader:
+                for record in args.records:
+                    print(reader.get(record, args.field))
+        except (OSError, ValueError, IndexError) as error:
+            print(f"{parser.prog}: error: {error}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.jobs < 1 or args.chunksize < 1 or args.word_cache < 0:
+        parser.error(
+            "--jobs and --chunksize must be positive and --word-cache must "
+            "not be negative"
+        )
+    try:
+        engine = SyrTransliterator.load_cached(
+            dialect_map_filename=resolve_map_file(
+                args.dialect, SyrTransliterator.DIALECTS_DIR
+            ),
+            ipa_mapping_filename=resolve_map_file(
+                args.ipa_map, SyrTransliterator.IPA_MAPS_DIR
+            ),
+            word_cache_size=args.word_cache,
+            cache_dir=args.table_cache,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    fields: List[str] = [f.strip() for f in args.fields.split(",") if f]
+    try:
+        count: int = transliterate_corpus(
+            engine,
+            args.input,
+            args.prefix,
+            fields,
+            args.delimiter,
+            args.jobs,
+            args.chunksize,
+            args.vowel_system,
+        )
+    except (OSError, ValueError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    print(f"{count} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
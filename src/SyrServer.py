@@ -0,0 +1,656 @@
+"""
+' @file SyrServer.py
+'
+' @author The Assyrian Digital Language Consortium
+' @date 1 Feb 2025
+'
+' @brief Local transliteration server speaking line-delimited JSON
+'
+' @description: This file contains an asyncio server that keeps compiled
+'               SyrTransliterator engines for each dialect and answers
+'               line-delimited JSON requests over a TCP or Unix socket.
+'               Concurrent requests are collected into small batches that
+'               run on a worker pool. Run it with `python -m SyrServer`
+'               from the src directory, or `python src/SyrServer.py`.
+'
+'               Each request is one JSON object per line:
+'                   {"id": 1, "text": "...", "dialect": "urmi",
+'                    "ipa": "intermediate", "outputs": ["romanized"],
+'                    "vowel_system": "auto"}
+'               Only "text" is required. The response line holds the "id"
+'               and the requested forms, or an "error". The request
+'               {"op": "stats"} returns the server statistics. Responses
+'               are written in request order on each connection.
+'
+' @license MIT License
+' @copyright Assyrian Digital Language Consortium
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from SyrTransliterator import SyrTransliterator
+
+# Longest request line accepted, in bytes.
+MAX_LINE: int = 1 << 24
+
+# Requests read ahead of their responses on one connection.
+MAX_PIPELINE: int = 1024
+
+# A request as sent to a worker: dialect, IPA mapping, text, outputs and
+# vowel system.
+Job = Tuple[str, str, str, Optional[Tuple[str, ...]], str]
+
+# A queued request: the job, the future of its response and the time it
+# was queued.
+QueuedJob = Tuple[Job, "asyncio.Future[Dict[str, Any]]", float]
+
+# Engines of the current process, keyed by dialect and IPA mapping, and
+# the size of their word caches.
+worker_engines: Dict[Tuple[str, str], SyrTransliterator] = {}
+worker_cache_size: int = 0
+
+
+def init_server_worker(
+    word_cache_size: int, preload: List[Tuple[str, str]]
+) -> None:
+    """
+    Prepare a worker of the server pool and build its first engines.
+
+    Parameters:
+        word_cache_size (int): Word cache size of the worker's engines.
+        preload (List[Tuple[str, str]]): Dialect and IPA mapping names of
+        the engines to build now rather than on first use.
+    """
+    global worker_cache_size
+    worker_cache_size = word_cache_size
+    for dialect, ipa in preload:
+        server_engine(dialect, ipa)
+
+
+def server_engine(dialect: str, ipa: str) -> SyrTransliterator:
+    """
+    Return the engine of this worker for a bundled dialect and IPA mapping.
+
+    Parameters:
+        dialect (str): A name from available_dialects(), or "".
+        ipa (str): A name from available_ipa_maps(), or "".
+
+    Returns:
+        SyrTransliterator: The engine, built on first use.
+
+    Raises:
+        ValueError: If the dialect or IPA mapping is not bundled.
+    """
+    engine = worker_engines.get((dialect, ipa))
+    if engine is None:
+        config = SyrTransliterator.for_dialect(dialect, ipa).engine_config()
+        engine = SyrTransliterator.from_config(
+            config._replace(word_cache_size=worker_cache_size)
+        )
+        worker_engines[(dialect, ipa)] = engine
+    return engine
+
+
+def run_jobs(jobs: List[Job]) -> List[Dict[str, Any]]:
+    """
+    Transliterate a batch of requests on a worker.
+
+    Parameters:
+        jobs (List[Job]): The requests.
+
+    Returns:
+        List[Dict[str, Any]]: The forms requested by each job, or an
+        "error" for jobs with an unknown dialect, IPA mapping, output or
+        vowel system.
+    """
+    results: List[Dict[str, Any]] = []
+    for dialect, ipa, text, outputs, vowel_system in jobs:
+        try:
+            results.append(
+                server_engine(dialect, ipa).transliterate(
+                    text, outputs, vowel_system
+                )
+            )
+        except ValueError as error:
+            results.append({"error": str(error)})
+    return results
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Return a percentile of some values by the nearest-rank method.
+
+    Parameters:
+        values (List[float]): The values, in ascending order.
+        fraction (float): The percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The value, or 0.0 if there are none.
+    """
+    if not values:
+        return 0.0
+    rank: int = max(1, math.ceil(fraction * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class TransliterationServer:
+    """
+    An asyncio server that transliterates line-delimited JSON requests in
+    batches on a worker pool.
+
+    With one worker the batches run on a single thread next to the event
+    loop; with more they run on worker processes, each with its own
+    engines.
+    """
+
+    __slots__ = (
+        "workers",
+        "batch_size",
+        "batch_window",
+        "word_cache_size",
+        "preload",
+        "executor",
+        "queue",
+        "batch_slots",
+        "batcher",
+        "latencies",
+        "requests",
+        "errors",
+        "batches",
+        "in_flight",
+        "started",
+        "connections",
+    )
+
+    def __init__(
+        self,
+        workers: int = 1,
+        batch_size: int = 64,
+        batch_window: float = 0.002,
+        word_cache_size: int = 1 << 16,
+        preload: Optional[List[Tuple[str, str]]] = None,
+        latency_window: int = 10000,
+    ) -> None:
+        """
+        Initialize the server. Call start() from a running event loop.
+
+        Parameters:
+            workers (int): Number of worker threads or processes, see the
+            class description.
+            batch_size (int): Largest number of requests in a batch.
+            batch_window (float): Seconds to wait for more requests after
+            the first request of a batch arrives; 0 sends at once what is
+            queued.
+            word_cache_size (int): Word cache size of each worker engine.
+            preload (Optional[List[Tuple[str, str]]]): Dialect and IPA
+            mapping names of the engines each worker builds at start.
+            Defaults to the default engine.
+            latency_window (int): Number of recent requests the latency
+            percentiles are computed over.
+
+        Raises:
+            ValueError: If a preloaded dialect or IPA mapping is not
+            bundled, or a size is not positive.
+        """
+        if workers < 1 or batch_size < 1 or latency_window < 1:
+            raise ValueError(
+                "workers, batch_size and latency_window must be positive"
+            )
+        if preload is None:
+            preload = [("", "")]
+        for dialect, ipa in preload:
+            SyrTransliterator.for_dialect(dialect, ipa)
+
+        self.workers: int = workers
+        self.batch_size: int = batch_size
+        self.batch_window: float = batch_window
+        self.word_cache_size: int = word_cache_size
+        self.preload: List[Tuple[str, str]] = list(preload)
+        self.executor: Optional[Executor] = None
+        self.queue: Optional["asyncio.Queue[QueuedJob]"] = None
+        self.batch_slots: Optional[asyncio.Semaphore] = None
+        self.batcher: Optional["asyncio.Task[None]"] = None
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+        self.requests: int = 0
+        self.errors: int = 0
+        self.batches: int = 0
+        self.in_flight: int = 0
+        self.started: float = time.perf_counter()
+        self.connections: Set["asyncio.Task[Any]"] = set()
+
+    async def start(self) -> None:
+        """
+        Start the worker pool and the batching task.
+        """
+        initargs = (self.word_cache_size, self.preload)
+        if self.workers == 1:
+            self.executor = ThreadPoolExecutor(
+                1, initializer=init_server_worker, initargs=initargs
+            )
+        else:
+            self.executor = ProcessPoolExecutor(
+                self.workers,
+                initializer=init_server_worker,
+                initargs=initargs,
+            )
+        self.queue = asyncio.Queue()
+        # Two batches per worker keep the workers busy while results are
+        # sent back.
+        self.batch_slots = asyncio.Semaphore(2 * self.workers)
+        self.batcher = asyncio.ensure_future(self.collect_batches())
+
+    async def close(self, timeout: float = 1.0) -> None:
+        """
+        Finish the open connections, stop the batching task and shut the
+        worker pool down. Close the listening servers first.
+
+        Parameters:
+            timeout (float): Seconds to wait for clients to disconnect
+            before their connections are cancelled.
+        """
+        if self.connections:
+            _, unfinished = await asyncio.wait(
+                set(self.connections), timeout=timeout
+            )
+            for connection in unfinished:
+                connection.cancel()
+            if unfinished:
+                await asyncio.wait(unfinished)
+        if self.batcher is not None:
+            self.batcher.cancel()
+            try:
+                await self.batcher
+            except asyncio.CancelledError:
+                pass
+            self.batcher = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def listen_tcp(
+        self, host: str = "127.0.0.1", port: int = 8765
+    ) -> asyncio.AbstractServer:
+        """
+        Accept connections on a TCP socket.
+
+        Parameters:
+            host (str): The address to bind; localhost by default.
+            port (int): The port, or 0 for any free port.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE
+        )
+
+    async def listen_unix(self, path: str) -> asyncio.AbstractServer:
+        """
+        Accept connections on a Unix socket.
+
+        Parameters:
+            path (str): The socket file.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        return await asyncio.start_unix_server(
+            self.handle_connection, path, limit=MAX_LINE
+        )
+
+    async def submit(self, job: Job) -> Dict[str, Any]:
+        """
+        Queue a request for the next batch and wait for its response.
+
+        Parameters:
+            job (Job): The request.
+
+        Returns:
+            Dict[str, Any]: The requested forms, or an "error".
+        """
+        assert self.queue is not None, "start() was not called"
+        future: "asyncio.Future[Dict[str, Any]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.queue.put_nowait((job, future, time.perf_counter()))
+        return await future
+
+    async def collect_batches(self) -> None:
+        """
+        Collect queued requests into batches and hand them to the workers,
+        keeping at most two batches per worker in flight.
+        """
+        assert self.queue is not None and self.batch_slots is not None
+        queue = self.queue
+        while True:
+            batch: List[QueuedJob] = [await queue.get()]
+            if self.batch_window > 0 and queue.qsize() < self.batch_size - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            await self.batch_slots.acquire()
+            asyncio.ensure_future(self.run_batch(batch))
+
+    async def run_batch(self, batch: List[QueuedJob]) -> None:
+        """
+        Transliterate a batch on the worker pool and resolve its futures.
+
+        Parameters:
+            batch (List[QueuedJob]): The queued requests.
+        """
+        assert self.batch_slots is not None
+        self.in_flight += 1
+        try:
+            results: List[
+                Dict[str, Any]
+            ] = await asyncio.get_running_loop().run_in_executor(
+                self.executor, run_jobs, [job for job, _, _ in batch]
+            )
+        except Exception as error:
+            # A worker died or the pool was shut down.
+            results = [{"error": f"worker failed: {error}"}] * len(batch)
+        finally:
+            self.in_flight -= 1
+            self.batch_slots.release()
+
+        now: float = time.perf_counter()
+        self.batches += 1
+        for (_, future, queued), result in zip(batch, results):
+            self.requests += 1
+            if "error" in result:
+                self.errors += 1
+            self.latencies.append(now - queued)
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the load and latency of the server.
+
+        Returns:
+            Dict[str, Any]: The number of queued requests and batches in
+            flight, the totals of requests, errors and batches, the mean
+            batch size, and the 50th, 90th and 99th percentile and maximum
+            latency in milliseconds over the latest requests, from queueing
+            to response.
+        """
+        latencies: List[float] = sorted(self.latencies)
+        return {
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+            "batches_in_flight": self.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": (
+                self.requests / self.batches if self.batches else 0.0
+            ),
+            "latency_ms": {
+                "p50": percentile(latencies, 0.5) * 1e3,
+                "p90": percentile(latencies, 0.9) * 1e3,
+                "p99": percentile(latencies, 0.99) * 1e3,
+                "max": (latencies[-1] if latencies else 0.0) * 1e3,
+            },
+            "workers": self.workers,
+            "uptime_s": time.perf_counter() - self.started,
+        }
+
+    def parse_request(self, line: bytes) -> Tuple[Any, Any]:
+        """
+        Turn a request line into its id and either a job or a response.
+
+        Parameters:
+            line (bytes): One line of JSON.
+
+        Returns:
+            Tuple[Any, Any]: The id of the request (None if absent) and a
+            Job, None for a statistics request, which is answered when its
+            turn comes, or the response itself for bad requests.
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            return None, {"error": f"invalid JSON: {error}"}
+        if not isinstance(request, dict):
+            return None, {"error": "expected a JSON object"}
+        record_id = request.get("id")
+        if request.get("op") == "stats":
+            return record_id, None
+
+        text = request.get("text")
+        dialect = request.get("dialect", "")
+        ipa = request.get("ipa", "")
+        outputs = request.get("outputs")
+        vowel_system = request.get("vowel_system", "auto")
+        if not isinstance(text, str):
+            return record_id, {"error": "'text' must be a string"}
+        if not all(isinstance(v, str) for v in (dialect, ipa, vowel_system)):
+            return record_id, {
+                "error": "'dialect', 'ipa' and 'vowel_system' must be strings"
+            }
+        if outputs is not None:
+            if not isinstance(outputs, list) or not all(
+                isinstance(name, str) for name in outputs
+            ):
+                return record_id, {"error": "'outputs' must be a list"}
+            outputs = tuple(outputs)
+        return record_id, (dialect, ipa, text, outputs, vowel_system)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the requests of one client connection, in order.
+
+        Parameters:
+            reader (asyncio.StreamReader): The client's requests.
+            writer (asyncio.StreamWriter): The client's responses.
+        """
+        connection = asyncio.current_task()
+        if connection is not None:
+            self.connections.add(connection)
+        pending: "asyncio.Queue[Optional[Tuple[Any, Any]]]" = asyncio.Queue(
+            MAX_PIPELINE
+        )
+        responder = asyncio.ensure_future(
+            self.write_responses(pending, writer)
+        )
+        try:
+            while True:
+                try:
+                    line: bytes = await reader.readline()
+                except ValueError:
+                    await pending.put((None, {"error": "request too long"}))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                record_id, request = self.parse_request(line)
+                if isinstance(request, tuple):
+                    request = asyncio.ensure_future(self.submit(request))
+                await pending.put((record_id, request))
+            await pending.put(None)
+            await responder
+        except asyncio.CancelledError:
+            responder.cancel()
+            raise
+        finally:
+            writer.close()
+            self.connections.discard(connection)
+
+    async def write_responses(
+        self,
+        pending: "asyncio.Queue[Optional[Tuple[Any, Any]]]",
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Write the responses of a connection in request order.
+
+        Parameters:
+            pending (asyncio.Queue[Optional[Tuple[Any, Any]]]): The id and
+            response, future of the response, or None for statistics, of
+            each request, ended by None.
+            writer (asyncio.StreamWriter): The client's responses.
+        """
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            record_id, response = item
+            if response is None:
+                response = self.stats()
+            elif isinstance(response, asyncio.Future):
+                response = await response
+            if record_id is not None:
+                response = {"id": record_id, **response}
+            try:
+                writer.write(
+                    json.dumps(response, ensure_ascii=False).encode() + b"\n"
+                )
+                if pending.empty():
+                    await writer.drain()
+            except ConnectionError:
+                # The client went away; keep draining its responses.
+                pass
+
+
+def parse_engine(value: str) -> Tuple[str, str]:
+    """
+    Parse a --preload value.
+
+    Parameters:
+        value (str): "DIALECT" or "DIALECT:IPA"; either may be empty.
+
+    Returns:
+        Tuple[str, str]: The dialect and IPA mapping names.
+    """
+    dialect, _, ipa = value.partition(":")
+    return dialect, ipa
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="SyrServer",
+        description="Serve transliteration requests as line-delimited JSON "
+        "over a local TCP or Unix socket.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="TCP address to bind (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port", type=int, default=8765, help="TCP port (default: 8765)"
+    )
+    parser.add_argument(
+        "--unix", help="listen on this Unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes; 1 runs batches on a thread (default: 1)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="largest number of requests per batch (default: 64)",
+    )
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=2.0,
+        help="milliseconds to wait for a batch to fill (default: 2)",
+    )
+    parser.add_argument(
+        "--word-cache",
+        type=int,
+        default=1 << 16,
+        help="words memoized per engine; 0 disables (default: 65536)",
+    )
+    parser.add_argument(
+        "--preload",
+        action="append",
+        type=parse_engine,
+        metavar="DIALECT[:IPA]",
+        help="engine to build at start; may be repeated (default: the "
+        "default engine)",
+    )
+    return parser
+
+
+async def serve(server: TransliterationServer, args: Any) -> None:
+    """
+    Run the server until it is cancelled.
+
+    Parameters:
+        server (TransliterationServer): The server.
+        args (Any): The parsed command-line arguments.
+    """
+    await server.start()
+    try:
+        if args.unix:
+            listener = await server.listen_unix(args.unix)
+        else:
+            listener = await server.listen_tcp(args.host, args.port)
+        for sock in listener.sockets:
+            print(f"listening on {sock.getsockname()}", file=sys.stderr)
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the server from the command line.
+
+    Parameters:
+        argv (Optional[List[str]]): The arguments, without the program
+        name. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        server = TransliterationServer(
+            workers=args.workers,
+            batch_size=args.batch_size,
+            batch_window=args.batch_window / 1e3,
+            word_cache_size=args.word_cache,
+            preload=args.preload,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        asyncio.run(serve(server, args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
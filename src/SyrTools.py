@@ -14,383 +14,561 @@
 ' @copyright Assyrian Digital Language Consortium
 """
 
+import re
 import unicodedata
-from typing import Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple
 
 
-class SyrTools:
-    """
-    A class providing various utilities and mappings for
-    processing Syriac text.
+def build_char_class_mask(
+    block: Iterable[int],
+    block_flag: int,
+    classes: Iterable[Tuple[int, Iterable[str]]],
+) -> Dict[str, int]:
     """
+    Build the character class bitmask table used by SyrTools.classify().
 
-    def __init__(self) -> None:
-        """
-        Initialize the SyrTools class with constants for Syriac punctuation,
-        letters, vowels, diacritics, and various mappings.
-        """
-        self.SYR_BLOCK_START: int = 0x0700
-        self.SYR_BLOCK_END: int = 0x074F
-
-        # ---------------------------------------------------------------------
-        # 1) Punctuation and Special Marks
-        # ---------------------------------------------------------------------
-        self.END_OF_PARAGRAPH: str = "\u0700"  # ܀
-        self.SUPRALINEAR_FULL_STOP: str = "\u0701"  # ܁
-        self.SUBLINEAR_FULL_STOP: str = "\u0702"  # ܂
-        self.SUPRALINEAR_COLON: str = "\u0703"  # ܃
-        self.SUBLINEAR_COLON: str = "\u0704"  # ܄
-        self.HORIZONTAL_COLON: str = "\u0705"  # ܅
-        self.COLON_SKEWED_LEFT: str = "\u0706"  # ܆
-        self.COLON_SKEWED_RIGHT: str = "\u0707"  # ܇
-        self.SUPRALINEAR_COLON_SKEWED_LEFT: str = "\u0708"  # ܈
-        self.SUBLINEAR_COLON_SKEWED_RIGHT: str = "\u0709"  # ܉
-        self.CONTRACTION: str = "\u070a"  # ܊
-        self.HARKLEAN_OBELUS: str = "\u070b"  # ܋
-        self.HARKLEAN_METOBELUS: str = "\u070c"  # ܌
-        self.HARKLEAN_ASTERISCUS: str = "\u070d"  # ܍
-        self.ABBREVIATION_MARK: str = "\u070f"  # ܏
-        self.BARREKH: str = "\u074a"  # ݊
-        self.MUSIC: str = "\u0749"  # ݉
-
-        # ---------------------------------------------------------------------
-        # 2) Letters
-        # ---------------------------------------------------------------------
-        self.LETTER_ALAPH: str = "\u0710"  # ܐ
-        self.LETTER_SUPERSCRIPT_ALAPH: str = "\u0711"  # ܑ
-        self.LETTER_BETH: str = "\u0712"  # ܒ
-        self.LETTER_GAMAL: str = "\u0713"  # ܓ
-        self.LETTER_GAMAL_GARSHUNI: str = "\u0714"  # ܔ
-        self.LETTER_DALATH: str = "\u0715"  # ܕ
-        self.LETTER_DOTLESS_DALATH_RISH: str = "\u0716"  # ܖ
-        self.LETTER_HE: str = "\u0717"  # ܗ
-        self.LETTER_WAW: str = "\u0718"  # ܘ
-        self.LETTER_ZAIN: str = "\u0719"  # ܙ
-        self.LETTER_HETH: str = "\u071a"  # ܚ
-        self.LETTER_TETH: str = "\u071b"  # ܛ
-        self.LETTER_TETH_GARSHUNI: str = "\u071c"  # ܜ
-        self.LETTER_YUDH: str = "\u071d"  # ܝ
-        self.LETTER_YUDH_HE: str = "\u071e"  # ܞ
-        self.LETTER_KAPH: str = "\u071f"  # ܟ
-        self.LETTER_LAMADH: str = "\u0720"  # ܠ
-        self.LETTER_MIM: str = "\u0721"  # ܡ
-        self.LETTER_NUN: str = "\u0722"  # ܢ
-        self.LETTER_SEMKATH: str = "\u0723"  # ܣ
-        self.LETTER_FINAL_SEMKATH: str = "\u0724"  # ܤ
-        self.LETTER_E: str = "\u0725"  # ܥ (ʿAyn - Unicode name is "Letter E")
-        self.LETTER_PE: str = "\u0726"  # ܦ
-        self.LETTER_REVERSED_PE: str = "\u0727"  # ܧ
-        self.LETTER_SADHE: str = "\u0728"  # ܨ
-        self.LETTER_QAPH: str = "\u0729"  # ܩ
-        self.LETTER_RISH: str = "\u072a"  # ܪ
-        self.LETTER_SHIN: str = "\u072b"  # ܫ
-        self.LETTER_TAW: str = "\u072c"  # ܬ
-
-        # ---------------------------------------------------------------------
-        # 3) Garshuni (Persian and Sogdian) Letters
-        # ---------------------------------------------------------------------
-        self.LETTER_PERSIAN_BHETH: str = "\u072d"  # ܭ
-        self.LETTER_PERSIAN_GHAMAL: str = "\u072e"  # ܮ
-        self.LETTER_PERSIAN_DHALATH: str = "\u072f"  # ܯ
-        self.LETTER_SOGDIAN_ZHAIN: str = "\u074d"  # ݍ
-        self.LETTER_SOGDIAN_KHAPH: str = "\u074e"  # ݎ
-        self.LETTER_SOGDIAN_FE: str = "\u074f"  # ݏ
-
-        # ---------------------------------------------------------------------
-        # 4) Vowel Marks (Zlameh, Ptakheh, Rwasa, Esasa, Hbasa, Zqapa, Rwakha)
-        # ---------------------------------------------------------------------
-        self.PTHAHA_DOTTED: str = "\u0732"  # ܲ
-        self.ZQAPHA_DOTTED: str = "\u0735"  # ܵ
-        self.DOTTED_ZLAMA_HORIZONTAL: str = "\u0738"  # ܸ
-        self.DOTTED_ZLAMA_ANGULAR: str = "\u0739"  # ܹ
-
-        self.HBASA_ESASA_DOTTED: str = "\u073c"  # ܼ
-        self.RWAHA: str = "\u073f"  # ܿ
-
-        self.PTHAHA_ABOVE: str = "\u0730"  # ܰ
-        self.PTHAHA_BELOW: str = "\u0731"  # ܱ
-        self.ZQAPHA_ABOVE: str = "\u0733"  # ܳ
-        self.ZQAPHA_BELOW: str = "\u0734"  # ܴ
-        self.RBASA_ABOVE: str = "\u0736"  # ܶ
-        self.RBASA_BELOW: str = "\u0737"  # ܷ
-        self.HBASA_ABOVE: str = "\u073a"  # ܺ
-        self.HBASA_BELOW: str = "\u073b"  # ܻ
-        self.ESASA_ABOVE: str = "\u073d"  # ܽ
-        self.ESASA_BELOW: str = "\u073e"  # ܾ
-
-        # ---------------------------------------------------------------------
-        # 5) Other Diacritical/Grammatical Marks
-        # ---------------------------------------------------------------------
-        self.QUSHSHAYA: str = "\u0741"  # ݁
-        self.RUKKAKHA: str = "\u0742"  # ݂
-        self.TWO_VERTICAL_DOTS_ABOVE: str = "\u0743"  # ݃
-        self.TWO_VERTICAL_DOTS_BELOW: str = "\u0744"  # ݄
-        self.THREE_DOTS_ABOVE: str = "\u0745"  # ݅
-        self.THREE_DOTS_BELOW: str = "\u0746"  # ݆
-        self.OBLIQUE_LINE_ABOVE: str = "\u0747"  # ݇
-        self.OBLIQUE_LINE_BELOW: str = "\u0748"  # ݈
-        # (BARREKH and MUSIC are defined above under punctuation)
-
-        # ---------------------------------------------------------------------
-        # 6) Generic Combining Diacritical Marks (non-Syriac block)
-        # ---------------------------------------------------------------------
-        self.COMBINING_TILDE_BELOW: str = "\u0330"  # (U+0330)  ̰
-        self.COMBINING_TILDE_ABOVE: str = "\u0303"  # (U+0303)  ̃
-        self.COMBINING_MACRON_BELOW: str = "\u0331"  # (U+0331) ̱
-        self.COMBINING_MACRON: str = "\u0304"  # (U+0304) ̄
-        self.COMBINING_BREVE_BELOW: str = "\u032e"  # (U+032E)  ̮
-        self.COMBINING_DIAERESIS: str = "\u0308"  # (U+0308) ̈
-        self.COMBINING_DIAERESIS_BELOW: str = "\u0324"  # (U+0324)  ̈
-        self.COMBINING_DOT_BELOW: str = "\u0323"  # (U+0323)  ̣
-        self.COMBINING_DOT_ABOVE: str = "\u0307"  # (U+0307) ̇
-
-        # ---------------------------------------------------------------------
-        # 7) Decorative Characters (non-Syriac block)
-        # ---------------------------------------------------------------------
-        self.KASHIDA: str = "\u0640"  # ـ (U+0640)
-
-        # ---------------------------------------------------------------------
-        # 8) Useful sets for easy reference
-        # ---------------------------------------------------------------------
-        self.LETTER: Tuple[str, ...] = (
-            self.LETTER_ALAPH,
-            self.LETTER_SUPERSCRIPT_ALAPH,
-            self.LETTER_BETH,
-            self.LETTER_GAMAL,
-            self.LETTER_GAMAL_GARSHUNI,
-            self.LETTER_DALATH,
-            self.LETTER_DOTLESS_DALATH_RISH,
-            self.LETTER_HE,
-            self.LETTER_WAW,
-            self.LETTER_ZAIN,
-            self.LETTER_HETH,
-            self.LETTER_TETH,
-            self.LETTER_TETH_GARSHUNI,
-            self.LETTER_YUDH,
-            self.LETTER_YUDH_HE,
-            self.LETTER_KAPH,
-            self.LETTER_LAMADH,
-            self.LETTER_MIM,
-            self.LETTER_NUN,
-            self.LETTER_SEMKATH,
-            self.LETTER_FINAL_SEMKATH,
-            self.LETTER_E,
-            self.LETTER_PE,
-            self.LETTER_REVERSED_PE,
-            self.LETTER_SADHE,
-            self.LETTER_QAPH,
-            self.LETTER_RISH,
-            self.LETTER_SHIN,
-            self.LETTER_TAW,
-        )
-
-        self.VOWEL: Tuple[str, ...] = (
-            self.PTHAHA_ABOVE,
-            self.PTHAHA_BELOW,
-            self.PTHAHA_DOTTED,
-            self.ZQAPHA_ABOVE,
-            self.ZQAPHA_BELOW,
-            self.ZQAPHA_DOTTED,
-            self.RBASA_ABOVE,
-            self.RBASA_BELOW,
-            self.DOTTED_ZLAMA_HORIZONTAL,
-            self.DOTTED_ZLAMA_ANGULAR,
-            self.HBASA_ABOVE,
-            self.HBASA_BELOW,
-            self.HBASA_ESASA_DOTTED,
-            self.ESASA_ABOVE,
-            self.ESASA_BELOW,
-            self.RWAHA,
-        )
+    Parameters:
+        block (Iterable[int]): Codepoints that all get block_flag.
+        block_flag (int): The flag of the codepoint block.
+        classes (Iterable[Tuple[int, Iterable[str]]]): Pairs of a CLASS_*
+        flag and the characters of that class.
 
-        self.EASTERN_VOWELS: Tuple[str, ...] = (
-            self.PTHAHA_DOTTED,
-            self.ZQAPHA_DOTTED,
-            self.DOTTED_ZLAMA_HORIZONTAL,
-            self.DOTTED_ZLAMA_ANGULAR,
-        )
+    Returns:
+        Dict[str, int]: The OR-ed flags of every classified character.
+    """
+    mask: Dict[str, int] = dict.fromkeys(map(chr, block), block_flag)
+    for flag, chars in classes:
+        for c in chars:
+            mask[c] = mask.get(c, 0) | flag
+    return mask
 
-        self.WESTERN_VOWELS: Tuple[str, ...] = (
-            self.PTHAHA_ABOVE,
-            self.PTHAHA_BELOW,
-            self.ZQAPHA_ABOVE,
-            self.ZQAPHA_BELOW,
-            self.RBASA_ABOVE,
-            self.RBASA_BELOW,
-            self.HBASA_ABOVE,
-            self.HBASA_BELOW,
-            self.ESASA_ABOVE,
-            self.ESASA_BELOW,
-        )
 
-        self.NON_MATIS_VOWEL: Tuple[str, ...] = (
-            self.PTHAHA_ABOVE,
-            self.PTHAHA_BELOW,
-            self.PTHAHA_DOTTED,
-            self.ZQAPHA_ABOVE,
-            self.ZQAPHA_BELOW,
-            self.ZQAPHA_DOTTED,
-            self.RBASA_ABOVE,
-            self.RBASA_BELOW,
-            self.DOTTED_ZLAMA_HORIZONTAL,
-            self.DOTTED_ZLAMA_ANGULAR,
-            self.HBASA_ABOVE,
-            self.HBASA_BELOW,
-            self.ESASA_ABOVE,
-            self.ESASA_BELOW,
-        )
-
-        self.MATIS_VOWEL: Tuple[str, ...] = (
-            self.HBASA_ESASA_DOTTED,
-            self.RWAHA,
-        )
+def find_named_chars(
+    ranges: Iterable[Tuple[int, int]], word: str
+) -> FrozenSet[str]:
+    """
+    Find the characters whose Unicode name contains a word.
 
-        self.MAJLEANEH: Tuple[str, ...] = (
-            self.COMBINING_TILDE_BELOW,
-            self.COMBINING_TILDE_ABOVE,
-        )
+    Parameters:
+        ranges (Iterable[Tuple[int, int]]): Inclusive codepoint ranges to
+        scan.
+        word (str): The word to look for in the character names.
 
-        self.RUKAKHEH: Tuple[str, ...] = (
-            self.COMBINING_BREVE_BELOW,
-            self.RUKKAKHA,
-        )
+    Returns:
+        FrozenSet[str]: The matching characters.
+    """
+    return frozenset(
+        chr(cp)
+        for first, last in ranges
+        for cp in range(first, last + 1)
+        if word in unicodedata.name(chr(cp), "")
+    )
 
-        self.QUSHAYEH: Tuple[str, ...] = (self.QUSHSHAYA,)
 
-        self.BDOL_LETTERS: Tuple[str, ...] = (
-            self.LETTER_BETH,
-            self.LETTER_DALATH,
-            self.LETTER_WAW,
-            self.LETTER_LAMADH,
-        )
+class SyrTools:
+    """
+    A class providing various utilities and mappings for
+    processing Syriac text.
+    """
 
-        self.TALQANEH: Tuple[str, ...] = (
-            self.COMBINING_MACRON_BELOW,
-            self.COMBINING_MACRON,
-            self.OBLIQUE_LINE_ABOVE,
-            self.OBLIQUE_LINE_BELOW,
+    # -------------------------------------------------------------------------
+    # Character class flags, combined into one bitmask per character by
+    # classify() and char_class_mask.
+    # -------------------------------------------------------------------------
+    CLASS_SYRIAC_BLOCK: int = 1 << 0
+    CLASS_LETTER: int = 1 << 1
+    CLASS_VOWEL: int = 1 << 2
+    CLASS_EASTERN_VOWEL: int = 1 << 3
+    CLASS_WESTERN_VOWEL: int = 1 << 4
+    CLASS_NON_MATIS_VOWEL: int = 1 << 5
+    CLASS_MATIS_VOWEL: int = 1 << 6
+    CLASS_MAJLEANEH: int = 1 << 7
+    CLASS_RUKAKHEH: int = 1 << 8
+    CLASS_QUSHAYEH: int = 1 << 9
+    CLASS_BDOL_LETTER: int = 1 << 10
+    CLASS_TALQANEH: int = 1 << 11
+    CLASS_PUNCTUATION: int = 1 << 12
+    CLASS_QANUNEH: int = 1 << 13
+    CLASS_SIYAMEH: int = 1 << 14
+    CLASS_GARSHUNI: int = 1 << 15
+    CLASS_DIACRITIC: int = 1 << 16
+    CLASS_NON_VOWEL_DIACRITIC: int = 1 << 17
+    CLASS_DECORATIVE: int = 1 << 18
+    CLASS_VALID_NON_CODEPOINT: int = 1 << 19
+    CLASS_SYRIAC_NAMED: int = 1 << 20
+
+    # Blocks holding the characters whose Unicode name contains "SYRIAC":
+    # Syriac, Syriac Supplement and the East/West Syriac crosses.
+    SYRIAC_NAMED_RANGES: Tuple[Tuple[int, int], ...] = (
+        (0x0700, 0x074F),
+        (0x0860, 0x086F),
+        (0x2670, 0x2671),
+    )
+
+    __slots__ = ()
+
+    # Memo of is_syriac_char() for characters outside SYRIAC_NAMED_RANGES,
+    # shared by all instances: 1 Syriac, 0 other named, -1 unnamed.
+    name_class_memo: Dict[str, int] = {}
+
+    SYR_BLOCK_START: int = 0x0700
+    SYR_BLOCK_END: int = 0x074F
+
+    # -------------------------------------------------------------------------
+    # 1) Punctuation and Special Marks
+    # -------------------------------------------------------------------------
+    END_OF_PARAGRAPH: str = "\u0700"  # ܀
+    SUPRALINEAR_FULL_STOP: str = "\u0701"  # ܁
+    SUBLINEAR_FULL_STOP: str = "\u0702"  # ܂
+    SUPRALINEAR_COLON: str = "\u0703"  # ܃
+    SUBLINEAR_COLON: str = "\u0704"  # ܄
+    HORIZONTAL_COLON: str = "\u0705"  # ܅
+    COLON_SKEWED_LEFT: str = "\u0706"  # ܆
+    COLON_SKEWED_RIGHT: str = "\u0707"  # ܇
+    SUPRALINEAR_COLON_SKEWED_LEFT: str = "\u0708"  # ܈
+    SUBLINEAR_COLON_SKEWED_RIGHT: str = "\u0709"  # ܉
+    CONTRACTION: str = "\u070a"  # ܊
+    HARKLEAN_OBELUS: str = "\u070b"  # ܋
+    HARKLEAN_METOBELUS: str = "\u070c"  # ܌
+    HARKLEAN_ASTERISCUS: str = "\u070d"  # ܍
+    ABBREVIATION_MARK: str = "\u070f"  # ܏
+    BARREKH: str = "\u074a"  # ݊
+    MUSIC: str = "\u0749"  # ݉
+
+    # -------------------------------------------------------------------------
+    # 2) Letters
+    # -------------------------------------------------------------------------
+    LETTER_ALAPH: str = "\u0710"  # ܐ
+    LETTER_SUPERSCRIPT_ALAPH: str = "\u0711"  # ܑ
+    LETTER_BETH: str = "\u0712"  # ܒ
+    LETTER_GAMAL: str = "\u0713"  # ܓ
+    LETTER_GAMAL_GARSHUNI: str = "\u0714"  # ܔ
+    LETTER_DALATH: str = "\u0715"  # ܕ
+    LETTER_DOTLESS_DALATH_RISH: str = "\u0716"  # ܖ
+    LETTER_HE: str = "\u0717"  # ܗ
+    LETTER_WAW: str = "\u0718"  # ܘ
+    LETTER_ZAIN: str = "\u0719"  # ܙ
+    LETTER_HETH: str = "\u071a"  # ܚ
+    LETTER_TETH: str = "\u071b"  # ܛ
+    LETTER_TETH_GARSHUNI: str = "\u071c"  # ܜ
+    LETTER_YUDH: str = "\u071d"  # ܝ
+    LETTER_YUDH_HE: str = "\u071e"  # ܞ
+    LETTER_KAPH: str = "\u071f"  # ܟ
+    LETTER_LAMADH: str = "\u0720"  # ܠ
+    LETTER_MIM: str = "\u0721"  # ܡ
+    LETTER_NUN: str = "\u0722"  # ܢ
+    LETTER_SEMKATH: str = "\u0723"  # ܣ
+    LETTER_FINAL_SEMKATH: str = "\u0724"  # ܤ
+    LETTER_E: str = "\u0725"  # ܥ (ʿAyn - Unicode name is "Letter E")
+    LETTER_PE: str = "\u0726"  # ܦ
+    LETTER_REVERSED_PE: str = "\u0727"  # ܧ
+    LETTER_SADHE: str = "\u0728"  # ܨ
+    LETTER_QAPH: str = "\u0729"  # ܩ
+    LETTER_RISH: str = "\u072a"  # ܪ
+    LETTER_SHIN: str = "\u072b"  # ܫ
+    LETTER_TAW: str = "\u072c"  # ܬ
+
+    # -------------------------------------------------------------------------
+    # 3) Garshuni (Persian and Sogdian) Letters
+    # -------------------------------------------------------------------------
+    LETTER_PERSIAN_BHETH: str = "\u072d"  # ܭ
+    LETTER_PERSIAN_GHAMAL: str = "\u072e"  # ܮ
+    LETTER_PERSIAN_DHALATH: str = "\u072f"  # ܯ
+    LETTER_SOGDIAN_ZHAIN: str = "\u074d"  # ݍ
+    LETTER_SOGDIAN_KHAPH: str = "\u074e"  # ݎ
+    LETTER_SOGDIAN_FE: str = "\u074f"  # ݏ
+
+    # -------------------------------------------------------------------------
+    # 4) Vowel Marks (Zlameh, Ptakheh, Rwasa, Esasa, Hbasa, Zqapa, Rwakha)
+    # -------------------------------------------------------------------------
+    PTHAHA_DOTTED: str = "\u0732"  # ܲ
+    ZQAPHA_DOTTED: str = "\u0735"  # ܵ
+    DOTTED_ZLAMA_HORIZONTAL: str = "\u0738"  # ܸ
+    DOTTED_ZLAMA_ANGULAR: str = "\u0739"  # ܹ
+
+    HBASA_ESASA_DOTTED: str = "\u073c"  # ܼ
+    RWAHA: str = "\u073f"  # ܿ
+
+    PTHAHA_ABOVE: str = "\u0730"  # ܰ
+    PTHAHA_BELOW: str = "\u0731"  # ܱ
+    ZQAPHA_ABOVE: str = "\u0733"  # ܳ
+    ZQAPHA_BELOW: str = "\u0734"  # ܴ
+    RBASA_ABOVE: str = "\u0736"  # ܶ
+    RBASA_BELOW: str = "\u0737"  # ܷ
+    HBASA_ABOVE: str = "\u073a"  # ܺ
+    HBASA_BELOW: str = "\u073b"  # ܻ
+    ESASA_ABOVE: str = "\u073d"  # ܽ
+    ESASA_BELOW: str = "\u073e"  # ܾ
+
+    # -------------------------------------------------------------------------
+    # 5) Other Diacritical/Grammatical Marks
+    # -------------------------------------------------------------------------
+    QUSHSHAYA: str = "\u0741"  # ݁
+    RUKKAKHA: str = "\u0742"  # ݂
+    TWO_VERTICAL_DOTS_ABOVE: str = "\u0743"  # ݃
+    TWO_VERTICAL_DOTS_BELOW: str = "\u0744"  # ݄
+    THREE_DOTS_ABOVE: str = "\u0745"  # ݅
+    THREE_DOTS_BELOW: str = "\u0746"  # ݆
+    OBLIQUE_LINE_ABOVE: str = "\u0747"  # ݇
+    OBLIQUE_LINE_BELOW: str = "\u0748"  # ݈
+    # (BARREKH and MUSIC are defined above under punctuation)
+
+    # -------------------------------------------------------------------------
+    # 6) Generic Combining Diacritical Marks (non-Syriac block)
+    # -------------------------------------------------------------------------
+    COMBINING_TILDE_BELOW: str = "\u0330"  # (U+0330)  ̰
+    COMBINING_TILDE_ABOVE: str = "\u0303"  # (U+0303)  ̃
+    COMBINING_MACRON_BELOW: str = "\u0331"  # (U+0331) ̱
+    COMBINING_MACRON: str = "\u0304"  # (U+0304) ̄
+    COMBINING_BREVE_BELOW: str = "\u032e"  # (U+032E)  ̮
+    COMBINING_DIAERESIS: str = "\u0308"  # (U+0308) ̈
+    COMBINING_DIAERESIS_BELOW: str = "\u0324"  # (U+0324)  ̈
+    COMBINING_DOT_BELOW: str = "\u0323"  # (U+0323)  ̣
+    COMBINING_DOT_ABOVE: str = "\u0307"  # (U+0307) ̇
+
+    # -------------------------------------------------------------------------
+    # 7) Decorative Characters (non-Syriac block)
+    # -------------------------------------------------------------------------
+    KASHIDA: str = "\u0640"  # ـ (U+0640)
+
+    # -------------------------------------------------------------------------
+    # 8) Useful sets for easy reference
+    # -------------------------------------------------------------------------
+    LETTER: Tuple[str, ...] = (
+        LETTER_ALAPH,
+        LETTER_SUPERSCRIPT_ALAPH,
+        LETTER_BETH,
+        LETTER_GAMAL,
+        LETTER_GAMAL_GARSHUNI,
+        LETTER_DALATH,
+        LETTER_DOTLESS_DALATH_RISH,
+        LETTER_HE,
+        LETTER_WAW,
+        LETTER_ZAIN,
+        LETTER_HETH,
+        LETTER_TETH,
+        LETTER_TETH_GARSHUNI,
+        LETTER_YUDH,
+        LETTER_YUDH_HE,
+        LETTER_KAPH,
+        LETTER_LAMADH,
+        LETTER_MIM,
+        LETTER_NUN,
+        LETTER_SEMKATH,
+        LETTER_FINAL_SEMKATH,
+        LETTER_E,
+        LETTER_PE,
+        LETTER_REVERSED_PE,
+        LETTER_SADHE,
+        LETTER_QAPH,
+        LETTER_RISH,
+        LETTER_SHIN,
+        LETTER_TAW,
+    )
+
+    VOWEL: Tuple[str, ...] = (
+        PTHAHA_ABOVE,
+        PTHAHA_BELOW,
+        PTHAHA_DOTTED,
+        ZQAPHA_ABOVE,
+        ZQAPHA_BELOW,
+        ZQAPHA_DOTTED,
+        RBASA_ABOVE,
+        RBASA_BELOW,
+        DOTTED_ZLAMA_HORIZONTAL,
+        DOTTED_ZLAMA_ANGULAR,
+        HBASA_ABOVE,
+        HBASA_BELOW,
+        HBASA_ESASA_DOTTED,
+        ESASA_ABOVE,
+        ESASA_BELOW,
+        RWAHA,
+    )
+
+    EASTERN_VOWELS: Tuple[str, ...] = (
+        PTHAHA_DOTTED,
+        ZQAPHA_DOTTED,
+        DOTTED_ZLAMA_HORIZONTAL,
+        DOTTED_ZLAMA_ANGULAR,
+    )
+
+    WESTERN_VOWELS: Tuple[str, ...] = (
+        PTHAHA_ABOVE,
+        PTHAHA_BELOW,
+        ZQAPHA_ABOVE,
+        ZQAPHA_BELOW,
+        RBASA_ABOVE,
+        RBASA_BELOW,
+        HBASA_ABOVE,
+        HBASA_BELOW,
+        ESASA_ABOVE,
+        ESASA_BELOW,
+    )
+
+    NON_MATIS_VOWEL: Tuple[str, ...] = (
+        PTHAHA_ABOVE,
+        PTHAHA_BELOW,
+        PTHAHA_DOTTED,
+        ZQAPHA_ABOVE,
+        ZQAPHA_BELOW,
+        ZQAPHA_DOTTED,
+        RBASA_ABOVE,
+        RBASA_BELOW,
+        DOTTED_ZLAMA_HORIZONTAL,
+        DOTTED_ZLAMA_ANGULAR,
+        HBASA_ABOVE,
+        HBASA_BELOW,
+        ESASA_ABOVE,
+        ESASA_BELOW,
+    )
+
+    MATIS_VOWEL: Tuple[str, ...] = (
+        HBASA_ESASA_DOTTED,
+        RWAHA,
+    )
+
+    MAJLEANEH: Tuple[str, ...] = (
+        COMBINING_TILDE_BELOW,
+        COMBINING_TILDE_ABOVE,
+    )
+
+    RUKAKHEH: Tuple[str, ...] = (
+        COMBINING_BREVE_BELOW,
+        RUKKAKHA,
+    )
+
+    QUSHAYEH: Tuple[str, ...] = (QUSHSHAYA,)
+
+    BDOL_LETTERS: Tuple[str, ...] = (
+        LETTER_BETH,
+        LETTER_DALATH,
+        LETTER_WAW,
+        LETTER_LAMADH,
+    )
+
+    TALQANEH: Tuple[str, ...] = (
+        COMBINING_MACRON_BELOW,
+        COMBINING_MACRON,
+        OBLIQUE_LINE_ABOVE,
+        OBLIQUE_LINE_BELOW,
+    )
+
+    PUNCTUATION: Tuple[str, ...] = (
+        END_OF_PARAGRAPH,
+        SUPRALINEAR_FULL_STOP,
+        SUBLINEAR_FULL_STOP,
+        SUPRALINEAR_COLON,
+        SUBLINEAR_COLON,
+        HORIZONTAL_COLON,
+        COLON_SKEWED_LEFT,
+        COLON_SKEWED_RIGHT,
+        SUPRALINEAR_COLON_SKEWED_LEFT,
+        SUBLINEAR_COLON_SKEWED_RIGHT,
+        HARKLEAN_OBELUS,
+        HARKLEAN_METOBELUS,
+        HARKLEAN_ASTERISCUS,
+        BARREKH,
+        ".",
+        "!",
+        ";",
+        ":",
+        "،",
+        "؛",
+        "؟",
+    )
+
+    QANUNEH: Tuple[str, ...] = (
+        COMBINING_DOT_BELOW,
+        COMBINING_DOT_ABOVE,
+    )
+
+    SIYAMEH: Tuple[str, ...] = (
+        COMBINING_DIAERESIS,
+        COMBINING_DIAERESIS_BELOW,
+    )
+
+    GARSHUNI: Tuple[str, ...] = (
+        LETTER_PERSIAN_BHETH,
+        LETTER_PERSIAN_GHAMAL,
+        LETTER_PERSIAN_DHALATH,
+        LETTER_SOGDIAN_ZHAIN,
+        LETTER_SOGDIAN_KHAPH,
+        LETTER_SOGDIAN_FE,
+    )
+
+    DIACRITICS: Tuple[str, ...] = (
+        QUSHSHAYA,
+        RUKKAKHA,
+        COMBINING_TILDE_BELOW,
+        COMBINING_TILDE_ABOVE,
+        COMBINING_MACRON_BELOW,
+        COMBINING_MACRON,
+        COMBINING_BREVE_BELOW,
+        COMBINING_DIAERESIS,
+        COMBINING_DOT_BELOW,
+        COMBINING_DOT_ABOVE,
+        OBLIQUE_LINE_ABOVE,
+        OBLIQUE_LINE_BELOW,
+        PTHAHA_DOTTED,
+        ZQAPHA_DOTTED,
+        HBASA_ESASA_DOTTED,
+        DOTTED_ZLAMA_HORIZONTAL,
+        DOTTED_ZLAMA_ANGULAR,
+        RWAHA,
+        PTHAHA_ABOVE,
+        PTHAHA_BELOW,
+        ZQAPHA_ABOVE,
+        ZQAPHA_BELOW,
+        RBASA_ABOVE,
+        RBASA_BELOW,
+        HBASA_ABOVE,
+        HBASA_BELOW,
+        ESASA_ABOVE,
+        ESASA_BELOW,
+    )
+
+    DECORATIVE: Tuple[str, ...] = (KASHIDA,)
+
+    VALID_NON_CODEPOINT_SYR_CHAR: Tuple[str, ...] = (
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "٠",
+        "١",
+        "٢",
+        "٣",
+        "٤",
+        "٥",
+        "٦",
+        "٧",
+        "٨",
+        "٩",
+        ".",
+        "!",
+        ";",
+        ":",
+        "،",
+        "؛",
+        "؟",
+        " ",
+        KASHIDA,
+        COMBINING_TILDE_BELOW,
+        COMBINING_TILDE_ABOVE,
+        COMBINING_MACRON_BELOW,
+        COMBINING_MACRON,
+        COMBINING_BREVE_BELOW,
+        COMBINING_DIAERESIS,
+        COMBINING_DIAERESIS_BELOW,
+        COMBINING_DOT_BELOW,
+        COMBINING_DOT_ABOVE,
+    )
+
+    # Define NON_VOWEL_DIACRITICS as those diacritics that are not vowels.
+    NON_VOWEL_DIACRITICS: Tuple[str, ...] = tuple(set(DIACRITICS) - set(VOWEL))
+
+    # -------------------------------------------------------------------------
+    # 9) Character classification table and frozen set views
+    # -------------------------------------------------------------------------
+    SYRIAC_NAMED_CHARS: FrozenSet[str] = find_named_chars(
+        SYRIAC_NAMED_RANGES, "SYRIAC"
+    )
+
+    char_class_mask: Mapping[str, int] = MappingProxyType(
+        build_char_class_mask(
+            range(SYR_BLOCK_START, SYR_BLOCK_END + 1),
+            CLASS_SYRIAC_BLOCK,
+            (
+                (CLASS_LETTER, LETTER),
+                (CLASS_VOWEL, VOWEL),
+                (CLASS_EASTERN_VOWEL, EASTERN_VOWELS),
+                (CLASS_WESTERN_VOWEL, WESTERN_VOWELS),
+                (CLASS_NON_MATIS_VOWEL, NON_MATIS_VOWEL),
+                (CLASS_MATIS_VOWEL, MATIS_VOWEL),
+                (CLASS_MAJLEANEH, MAJLEANEH),
+                (CLASS_RUKAKHEH, RUKAKHEH),
+                (CLASS_QUSHAYEH, QUSHAYEH),
+                (CLASS_BDOL_LETTER, BDOL_LETTERS),
+                (CLASS_TALQANEH, TALQANEH),
+                (CLASS_PUNCTUATION, PUNCTUATION),
+                (CLASS_QANUNEH, QANUNEH),
+                (CLASS_SIYAMEH, SIYAMEH),
+                (CLASS_GARSHUNI, GARSHUNI),
+                (CLASS_DIACRITIC, DIACRITICS),
+                (CLASS_NON_VOWEL_DIACRITIC, NON_VOWEL_DIACRITICS),
+                (CLASS_DECORATIVE, DECORATIVE),
+                (CLASS_VALID_NON_CODEPOINT, VALID_NON_CODEPOINT_SYR_CHAR),
+                (CLASS_SYRIAC_NAMED, SYRIAC_NAMED_CHARS),
+            ),
         )
+    )
+
+    # Frozen set views of the classes, for O(1) membership tests.
+    LETTER_SET: FrozenSet[str] = frozenset(LETTER)
+    VOWEL_SET: FrozenSet[str] = frozenset(VOWEL)
+    EASTERN_VOWEL_SET: FrozenSet[str] = frozenset(EASTERN_VOWELS)
+    WESTERN_VOWEL_SET: FrozenSet[str] = frozenset(WESTERN_VOWELS)
+    PUNCTUATION_SET: FrozenSet[str] = frozenset(PUNCTUATION)
+    GARSHUNI_SET: FrozenSet[str] = frozenset(GARSHUNI)
+    DIACRITIC_SET: FrozenSet[str] = frozenset(DIACRITICS)
+    NON_VOWEL_DIACRITIC_SET: FrozenSet[str] = frozenset(NON_VOWEL_DIACRITICS)
+    SIYAMEH_SET: FrozenSet[str] = frozenset(SIYAMEH)
+    DECORATIVE_SET: FrozenSet[str] = frozenset(DECORATIVE)
+    VALID_NON_CODEPOINT_SET: FrozenSet[str] = frozenset(
+        VALID_NON_CODEPOINT_SYR_CHAR
+    )
+    decorative_removal_table: Mapping[int, None] = MappingProxyType(
+        dict.fromkeys(map(ord, DECORATIVE_SET))
+    )
+
+    # Characters counted as Syriac by ratio() and isSyr(): those with
+    # "SYRIAC" in their Unicode name and the valid non-codepoint ones.
+    SYRIAC_CHAR_SET: FrozenSet[str] = (
+        SYRIAC_NAMED_CHARS | VALID_NON_CODEPOINT_SET
+    )
+    syriac_char_pattern: "re.Pattern[str]" = re.compile(
+        "[" + re.escape("".join(sorted(SYRIAC_CHAR_SET))) + "]+"
+    )
 
-        self.PUNCTUATION: Tuple[str, ...] = (
-            self.END_OF_PARAGRAPH,
-            self.SUPRALINEAR_FULL_STOP,
-            self.SUBLINEAR_FULL_STOP,
-            self.SUPRALINEAR_COLON,
-            self.SUBLINEAR_COLON,
-            self.HORIZONTAL_COLON,
-            self.COLON_SKEWED_LEFT,
-            self.COLON_SKEWED_RIGHT,
-            self.SUPRALINEAR_COLON_SKEWED_LEFT,
-            self.SUBLINEAR_COLON_SKEWED_RIGHT,
-            self.HARKLEAN_OBELUS,
-            self.HARKLEAN_METOBELUS,
-            self.HARKLEAN_ASTERISCUS,
-            self.BARREKH,
-            ".",
-            "!",
-            ";",
-            ":",
-            "،",
-            "؛",
-            "؟",
-        )
+    def __init__(self) -> None:
+        """
+        Initialize the SyrTools class. The constants for Syriac punctuation,
+        letters, vowels, diacritics, and the classification tables are class
+        attributes built once at import and shared by every instance.
+        """
 
-        self.QANUNEH: Tuple[str, ...] = (
-            self.COMBINING_DOT_BELOW,
-            self.COMBINING_DOT_ABOVE,
-        )
+    def classify(self, ch: str) -> int:
+        """
+        Return the character class bitmask of a character.
 
-        self.SIYAMEH: Tuple[str, ...] = (
-            self.COMBINING_DIAERESIS,
-            self.COMBINING_DIAERESIS_BELOW,
-        )
+        Parameters:
+            ch (str): A single character.
 
-        self.GARSHUNI: Tuple[str, ...] = (
-            self.LETTER_PERSIAN_BHETH,
-            self.LETTER_PERSIAN_GHAMAL,
-            self.LETTER_PERSIAN_DHALATH,
-            self.LETTER_SOGDIAN_ZHAIN,
-            self.LETTER_SOGDIAN_KHAPH,
-            self.LETTER_SOGDIAN_FE,
-        )
+        Returns:
+            int: The CLASS_* flags of the character OR-ed together; 0 for
+            characters that belong to no class.
+        """
+        return self.char_class_mask.get(ch, 0)
 
-        self.DIACRITICS: Tuple[str, ...] = (
-            self.QUSHSHAYA,
-            self.RUKKAKHA,
-            self.COMBINING_TILDE_BELOW,
-            self.COMBINING_TILDE_ABOVE,
-            self.COMBINING_MACRON_BELOW,
-            self.COMBINING_MACRON,
-            self.COMBINING_BREVE_BELOW,
-            self.COMBINING_DIAERESIS,
-            self.COMBINING_DOT_BELOW,
-            self.COMBINING_DOT_ABOVE,
-            self.OBLIQUE_LINE_ABOVE,
-            self.OBLIQUE_LINE_BELOW,
-            self.PTHAHA_DOTTED,
-            self.ZQAPHA_DOTTED,
-            self.HBASA_ESASA_DOTTED,
-            self.DOTTED_ZLAMA_HORIZONTAL,
-            self.DOTTED_ZLAMA_ANGULAR,
-            self.RWAHA,
-            self.PTHAHA_ABOVE,
-            self.PTHAHA_BELOW,
-            self.ZQAPHA_ABOVE,
-            self.ZQAPHA_BELOW,
-            self.RBASA_ABOVE,
-            self.RBASA_BELOW,
-            self.HBASA_ABOVE,
-            self.HBASA_BELOW,
-            self.ESASA_ABOVE,
-            self.ESASA_BELOW,
-        )
+    def chars_of_class(self, mask: int) -> FrozenSet[str]:
+        """
+        Return every classified character that has any of the given flags.
 
-        self.DECORATIVE: Tuple[str, ...] = (self.KASHIDA,)
-
-        self.VALID_NON_CODEPOINT_SYR_CHAR: Tuple[str, ...] = (
-            "0",
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "٠",
-            "١",
-            "٢",
-            "٣",
-            "٤",
-            "٥",
-            "٦",
-            "٧",
-            "٨",
-            "٩",
-            ".",
-            "!",
-            ";",
-            ":",
-            "،",
-            "؛",
-            "؟",
-            " ",
-            self.KASHIDA,
-            self.COMBINING_TILDE_BELOW,
-            self.COMBINING_TILDE_ABOVE,
-            self.COMBINING_MACRON_BELOW,
-            self.COMBINING_MACRON,
-            self.COMBINING_BREVE_BELOW,
-            self.COMBINING_DIAERESIS,
-            self.COMBINING_DIAERESIS_BELOW,
-            self.COMBINING_DOT_BELOW,
-            self.COMBINING_DOT_ABOVE,
-        )
+        Parameters:
+            mask (int): One or more CLASS_* flags OR-ed together.
 
-        # Define NON_VOWEL_DIACRITICS as those diacritics that are not vowels.
-        self.NON_VOWEL_DIACRITICS: Tuple[str, ...] = tuple(
-            set(self.DIACRITICS) - set(self.VOWEL)
+        Returns:
+            FrozenSet[str]: The matching characters.
+        """
+        return frozenset(
+            c for c, flags in self.char_class_mask.items() if flags & mask
         )
 
     def ratio(self, text: str) -> float:
@@ -398,6 +576,9 @@ class SyrTools:
         Returns the ratio of Syriac characters to non-Syriac characters in the
         text.
 
+        Syriac characters are removed in bulk with syriac_char_pattern, and
+        only the distinct characters left over are looked up by name.
+
         Parameters:
             text (str): The text to calculate the ratio from.
 
@@ -405,28 +586,17 @@ class SyrTools:
             float: The ratio of Syriac in the text as a whole;
             otherwise, 0.
         """
-        totalCharCnt = 0
-        syrCharCnt = 0
-
         if not self.containsSyr(text):
             return 0
 
-        for char in text:
-            totalCharCnt += 1
-            try:
-                if (
-                    "SYRIAC" in unicodedata.name(char)
-                    or char in self.VALID_NON_CODEPOINT_SYR_CHAR
-                ):
-                    syrCharCnt += 1
-            except ValueError:
-                # Some characters don't have a Unicode name.
-                continue
-
-        if totalCharCnt == 0:
-            return 0
+        rest: str = self.syriac_char_pattern.sub("", text)
+        syrCharCnt: int = len(text) - len(rest)
+        if not rest.isascii():
+            for char in set(rest):
+                if self.name_class(char) == 1:
+                    syrCharCnt += rest.count(char)
 
-        return syrCharCnt / totalCharCnt
+        return syrCharCnt / len(text)
 
     def isSyr(self, text: str) -> bool:
         """
@@ -436,7 +606,7 @@ class SyrTools:
         This function ensures every character in the text either has a Unicode
         name containing "SYRIAC" or is among the valid non-codepoint Syriac
         characters. It then verifies that the text contains at least one Syriac
-        character.
+        character. Characters without a Unicode name are ignored.
 
         Parameters:
             text (str): The text to validate.
@@ -445,18 +615,36 @@ class SyrTools:
             bool: True if the text is considered valid Syriac;
             otherwise, False.
         """
-        for char in text:
-            try:
-                if (
-                    "SYRIAC" not in unicodedata.name(char)
-                    and char not in self.VALID_NON_CODEPOINT_SYR_CHAR
-                ):
-                    return False
-            except ValueError:
-                # Some characters don't have a Unicode name.
-                continue
+        for char in self.syriac_char_pattern.sub("", text):
+            if self.name_class(char) == 0:
+                return False
         return self.containsSyr(text)
 
+    def name_class(self, char: str) -> int:
+        """
+        Classify a character by its Unicode name, memoizing the result.
+
+        Parameters:
+            char (str): A single character.
+
+        Returns:
+            int: 1 if the character counts as Syriac, 0 if it has a
+            non-Syriac name, or -1 if it has no Unicode name.
+        """
+        if char in self.SYRIAC_CHAR_SET:
+            return 1
+        status = self.name_class_memo.get(char)
+        if status is None:
+            name = unicodedata.name(char, None)
+            if name is None:
+                status = -1
+            elif "SYRIAC" in name:
+                status = 1
+            else:
+                status = 0
+            self.name_class_memo[char] = status
+        return status
+
     def containsSyr(self, text: str) -> bool:
         """
         Determine if the given text contains any Syriac characters.
@@ -468,10 +656,7 @@ class SyrTools:
             bool: True if at least one character in the text is a letter;
             otherwise, False.
         """
-        for c in text:
-            if c in self.LETTER:
-                return True
-        return False
+        return not self.LETTER_SET.isdisjoint(text)
 
     def eastern(self, text: str) -> bool:
         """
@@ -487,10 +672,7 @@ class SyrTools:
         """
         if not self.isSyr(text):
             return False
-        for c in text:
-            if c in self.EASTERN_VOWELS:
-                return True
-        return False
+        return not self.EASTERN_VOWEL_SET.isdisjoint(text)
 
     def western(self, text: str) -> bool:
         """
@@ -506,10 +688,7 @@ class SyrTools:
         """
         if not self.isSyr(text):
             return False
-        for c in text:
-            if c in self.WESTERN_VOWELS:
-                return True
-        return False
+        return not self.WESTERN_VOWEL_SET.isdisjoint(text)
 
     def contains_vowels(self, text: str) -> bool:
         """
@@ -521,10 +700,7 @@ class SyrTools:
         Returns:
             bool: True if any vowel character is present; otherwise, False.
         """
-        for c in text:
-            if c in self.VOWEL:
-                return True
-        return False
+        return not self.VOWEL_SET.isdisjoint(text)
 
     def contains_garshuni(self, text: str) -> bool:
         """
@@ -536,10 +712,7 @@ class SyrTools:
         Returns:
             bool: True if any Garshuni character is found; otherwise, False.
         """
-        for c in text:
-            if c in self.GARSHUNI:
-                return True
-        return False
+        return not self.GARSHUNI_SET.isdisjoint(text)
 
     def contains_non_vowel_diacritics(self, text: str) -> bool:
         """
@@ -552,10 +725,7 @@ class SyrTools:
             bool: True if any diacritic from the NON_VOWEL_DIACRITICS set is
             present; otherwise, False.
         """
-        for c in text:
-            if c in self.NON_VOWEL_DIACRITICS:
-                return True
-        return False
+        return not self.NON_VOWEL_DIACRITIC_SET.isdisjoint(text)
 
     def remove_decorative_chars(self, text: str) -> str:
         """
@@ -567,7 +737,7 @@ class SyrTools:
         Returns:
             str: The text with decorative characters removed.
         """
-        return "".join([c for c in text if c not in self.DECORATIVE])
+        return text.translate(self.decorative_removal_table)
 
     def remove_siyame(self, text: str) -> str:
         """
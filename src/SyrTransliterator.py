@@ -14,10 +14,706 @@
 ' @copyright Assyrian Digital Language Consortium
 """
 
+import hashlib
+import itertools
 import json
-from typing import Dict, List, Tuple
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    TYPE_CHECKING,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 from SyrTools import SyrTools
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# NumPy is optional and slow to import, so load_numpy() imports it the first
+# time a text is long enough to vectorize; without it encode_ipa() never
+# vectorizes.
+np: Any = None
+numpy_tried: bool = False
+
+# Version of the compiled tables. Change it when compile_tables() changes
+# what it builds, so that table caches written by older code are rebuilt.
+ENGINE_VERSION: str = "2"
+
+# Table cache files start with this magic, the digest of the sources the
+# tables were built from, and the digest of the JSON tables that follow.
+TABLE_CACHE_MAGIC: bytes = b"SYRTBL02"
+
+
+# IPA, natural IPA and romanized forms of a span of text.
+SpanResult = Tuple[str, str, str]
+
+# Word cache key: the span itself, the span with its at_start/at_end flags
+# when it touches either end of the text, the span with its flags and a
+# known vowel system, or all of these and the number of stages run when
+# fewer than all of them were.
+WordCacheKey = Union[
+    str,
+    Tuple[str, bool, bool],
+    Tuple[str, bool, bool, str],
+    Tuple[str, bool, bool, str, int],
+]
+
+# Tables of encode_ipa_vectorized(): the codepoints of the special case and
+# abbreviation keys grouped by their first codepoint, and the IPA of every
+# cluster and separator.
+VectorTables = Tuple[Dict[int, List[Tuple[int, ...]]], Dict[str, str]]
+
+
+class ObservedDict(dict):
+    """
+    A dictionary that calls a function whenever its contents change.
+
+    SyrTransliterator stores its mapping tables in ObservedDicts so that the
+    compiled tables and word cache built from them are invalidated as soon as
+    a mapping is edited.
+    """
+
+    __slots__ = ("on_change",)
+
+    def __init__(self, data: Dict[str, str], on_change: Callable[[], None]):
+        super().__init__(data)
+        self.on_change = on_change
+
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key, value)
+        self.on_change()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.on_change()
+
+    def __ior__(self, other: Any) -> "ObservedDict":
+        super().__ior__(other)
+        self.on_change()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.on_change()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.on_change()
+        return value
+
+    def popitem(self) -> Tuple[str, str]:
+        item = super().popitem()
+        self.on_change()
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self.on_change()
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.on_change()
+
+
+class WordCacheInfo(NamedTuple):
+    """
+    Statistics of the word cache, as returned by
+    SyrTransliterator.cache_info().
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+# Start and end offsets of a token in a text.
+Offsets = Tuple[int, int]
+
+
+class TokenAlignment(NamedTuple):
+    """
+    Where a token lies in the input text and in each of its
+    transliterations, as returned by SyrTransliterator.transliterate_aligned().
+    A token is a run of text between span separators, or one separator.
+    """
+
+    source: Offsets
+    ipa: Offsets
+    natural_ipa: Offsets
+    romanized: Offsets
+    separator: bool
+
+
+def shift_alignment(
+    token: TokenAlignment, shifts: Tuple[int, int, int, int]
+) -> TokenAlignment:
+    """
+    Move a token alignment.
+
+    Parameters:
+        token (TokenAlignment): The alignment.
+        shifts (Tuple[int, int, int, int]): The amounts added to the source,
+        IPA, natural IPA and romanized offsets.
+
+    Returns:
+        TokenAlignment: The moved alignment.
+    """
+    source, ipa, natural, roman = shifts
+    return TokenAlignment(
+        (token.source[0] + source, token.source[1] + source),
+        (token.ipa[0] + ipa, token.ipa[1] + ipa),
+        (token.natural_ipa[0] + natural, token.natural_ipa[1] + natural),
+        (token.romanized[0] + roman, token.romanized[1] + roman),
+        token.separator,
+    )
+
+
+class TextEdit(NamedTuple):
+    """
+    A replacement of deleted characters at offset by the inserted text.
+    """
+
+    offset: int
+    deleted: int
+    inserted: str
+
+
+class IncrementalState(NamedTuple):
+    """
+    A transliterated text that can be edited with
+    SyrTransliterator.transliterate_edit().
+
+    The token alignments are split at the last edit, like a gap buffer: head
+    holds the tokens before it with offsets from the start of the text, and
+    tail the tokens after it, last token first, with offsets from the end of
+    the text (negative), which an edit before them leaves unchanged.
+    """
+
+    text: str
+    result: Dict[str, str]
+    head: List[TokenAlignment]
+    tail: List[TokenAlignment]
+    vowel_system: str
+
+    def tokens(self) -> List[TokenAlignment]:
+        """
+        Return the alignment of every token, as transliterate_aligned().
+
+        Returns:
+            List[TokenAlignment]: The alignments in text order.
+        """
+        lengths: Tuple[int, int, int, int] = (
+            len(self.text),
+            len(self.result["ipa"]),
+            len(self.result["natural_ipa"]),
+            len(self.result["romanized"]),
+        )
+        return self.head + [
+            shift_alignment(token, lengths) for token in reversed(self.tail)
+        ]
+
+
+class StageStats(NamedTuple):
+    """
+    Cumulative statistics of one transliteration stage, as returned by
+    StageTimer.snapshot().
+    """
+
+    calls: int
+    seconds: float
+    chars: int
+
+
+# Called with the stage name, its wall time in seconds and the number of
+# characters it processed, after every timed stage.
+StageObserver = Callable[[str, float, int], None]
+
+
+class StageTimer:
+    """
+    Collects the wall time, call count and characters processed of each
+    transliteration stage.
+
+    Timing is enabled on an engine with SyrTransliterator.enable_timing().
+    Stages are named "encode_ipa", "encode_ipa.split",
+    "encode_ipa.abbreviations", "encode_ipa.special_cases",
+    "encode_ipa.tokenize", "remove_siyame", "naturalize_ipa",
+    "ipa_to_roman", "ipa_to_roman.brackets", "ipa_to_roman.bdol",
+    "ipa_to_roman.glottals" and "ipa_to_roman.map". A timer is not
+    thread-safe; give each thread its own engine or timer.
+    """
+
+    __slots__ = ("clock", "stats", "observers")
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize an empty timer.
+
+        Parameters:
+            clock (Callable[[], float]): The clock stages are timed with.
+        """
+        self.clock: Callable[[], float] = clock
+        self.stats: Dict[str, List[Any]] = {}
+        self.observers: List[StageObserver] = []
+
+    def record(self, stage: str, seconds: float, chars: int) -> None:
+        """
+        Add one run of a stage and notify the observers.
+
+        Parameters:
+            stage (str): The stage name.
+            seconds (float): The wall time of the run.
+            chars (int): Number of characters the run processed.
+        """
+        entry = self.stats.get(stage)
+        if entry is None:
+            entry = self.stats[stage] = [0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += chars
+        for observer in self.observers:
+            observer(stage, seconds, chars)
+
+    def snapshot(self) -> Dict[str, StageStats]:
+        """
+        Return the statistics collected so far.
+
+        Returns:
+            Dict[str, StageStats]: The statistics of each stage that ran.
+        """
+        return {
+            stage: StageStats(*entry) for stage, entry in self.stats.items()
+        }
+
+    def reset(self) -> None:
+        """
+        Forget the statistics collected so far. Observers are kept.
+        """
+        self.stats.clear()
+
+    def add_observer(self, observer: StageObserver) -> None:
+        """
+        Call a function after every timed stage.
+
+        Parameters:
+            observer (StageObserver): Called with the stage name, its wall
+            time in seconds and the number of characters processed.
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: StageObserver) -> None:
+        """
+        Stop calling a function added with add_observer().
+
+        Parameters:
+            observer (StageObserver): The observer to remove.
+        """
+        self.observers.remove(observer)
+
+
+# Longest-match patterns already compiled, keyed by their set of keys, so
+# that engines built from the same maps do not write the tries out again.
+longest_match_memo: Dict[FrozenSet[str], "re.Pattern[str]"] = {}
+LONGEST_MATCH_MEMO_SIZE: int = 64
+
+
+def compile_longest_match(keys: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile keys into a pattern that matches the longest key starting at a
+    position.
+
+    The keys are arranged in a prefix trie, which is written out as nested
+    alternations, so the regular expression engine walks the trie without
+    creating any substrings. Characters that cannot start a key are skipped
+    by the engine's first-character check.
+
+    Parameters:
+        keys (Iterable[str]): The strings to match. Empty keys are ignored.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern.
+    """
+    key_set: FrozenSet[str] = frozenset(keys)
+    pattern: Optional["re.Pattern[str]"] = longest_match_memo.get(key_set)
+    if pattern is None:
+        pattern = compile_trie(key_set)
+        if len(longest_match_memo) >= LONGEST_MATCH_MEMO_SIZE:
+            del longest_match_memo[next(iter(longest_match_memo))]
+        longest_match_memo[key_set] = pattern
+    return pattern
+
+
+def compile_trie(keys: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Write keys out as a prefix trie of nested alternations and compile it.
+
+    Parameters:
+        keys (Iterable[str]): The strings to match. Empty keys are ignored.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern.
+    """
+    trie: Dict[str, Any] = {}
+    for key in keys:
+        if not key:
+            continue
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches: List[str] = [
+            re.escape(char) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        alternation: str = "(?:" + "|".join(branches) + ")"
+        return alternation + "?" if "" in node else alternation
+
+    return re.compile(emit(trie) or "(?!)")
+
+
+class RewriteRules:
+    """
+    An ordered list of (old, new) rewrite rules compiled for matching.
+
+    Applying the rules gives the same result as visiting every rule in
+    order and replacing each occurrence of its old text, but only the rules
+    whose old text occurs in the word are visited: a prefix trie finds them
+    and a longest-match pattern rejects words without any. The cost per
+    word therefore does not grow with the number of rules.
+    """
+
+    __slots__ = ("rules", "trie", "pattern")
+
+    def __init__(self, rules: Iterable[Tuple[str, str]]):
+        """
+        Compile the rules.
+
+        Parameters:
+            rules (Iterable[Tuple[str, str]]): The (old, new) pairs, in the
+            order they are applied. Pairs with an empty old text are
+            ignored.
+        """
+        self.rules: List[Tuple[str, str]] = [
+            (old, new) for old, new in rules if old
+        ]
+        # Each trie node maps a character to the next node; the "" entry
+        # lists the rules whose old text ends at the node.
+        self.trie: Dict[str, Any] = {}
+        for index, (old, _) in enumerate(self.rules):
+            node = self.trie
+            for char in old:
+                node = node.setdefault(char, {})
+            node.setdefault("", []).append(index)
+        self.pattern: "re.Pattern[str]" = compile_longest_match(
+            old for old, _ in self.rules
+        )
+
+    def occurring(self, word: str, first: int) -> List[int]:
+        """
+        Find the rules whose old text occurs in a word.
+
+        Parameters:
+            word (str): The word to search.
+            first (int): The lowest rule index to report.
+
+        Returns:
+            List[int]: The indices of the rules, in order.
+        """
+        found = set()
+        trie: Dict[str, Any] = self.trie
+        for start in range(len(word)):
+            node = trie
+            for position in range(start, len(word)):
+                node = node.get(word[position])
+                if node is None:
+                    break
+                for index in node.get("", ()):
+                    if index >= first:
+                        found.add(index)
+        return sorted(found)
+
+    def apply(self, word: str, guard: Optional[FrozenSet[str]] = None) -> str:
+        """
+        Apply the rules to a word in order.
+
+        Parameters:
+            word (str): The word to rewrite.
+            guard (Optional[FrozenSet[str]]): If given, a rule whose old
+            text is not the whole word is skipped when its first occurrence
+            is followed by one of these characters.
+
+        Returns:
+            str: The rewritten word.
+        """
+        if not self.pattern.search(word):
+            return word
+        candidates: List[int] = self.occurring(word, 0)
+        position: int = 0
+        while position < len(candidates):
+            index: int = candidates[position]
+            old, new = self.rules[index]
+            rewritten: str = word
+            if guard is None or len(old) == len(word):
+                rewritten = word.replace(old, new)
+            else:
+                end: int = word.find(old) + len(old)
+                if end >= len(word) or word[end] not in guard:
+                    rewritten = word.replace(old, new)
+            if rewritten != word:
+                word = rewritten
+                candidates = self.occurring(word, index + 1)
+                position = 0
+            else:
+                position += 1
+        return word
+
+
+class EngineConfig(NamedTuple):
+    """
+    A small picklable description of a SyrTransliterator, from which worker
+    processes build their own engine.
+
+    maps holds a snapshot of the mapping tables and prepositional_b when
+    they were edited after loading, and is None otherwise. cache_dir is
+    the table cache directory the engine was loaded with, if any.
+    """
+
+    dialect_map_filename: str = ""
+    ipa_mapping_filename: str = ""
+    word_cache_size: int = 0
+    maps: Optional[Dict[str, Any]] = None
+    cache_dir: Optional[str] = None
+
+
+def load_numpy() -> Any:
+    """
+    Import NumPy on first use.
+
+    Returns:
+        Any: The numpy module, or None if it is not installed.
+    """
+    global np, numpy_tried
+    if not numpy_tried:
+        numpy_tried = True
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            np = numpy
+    return np
+
+
+def table_cache_key(
+    dialect_map_filename: str = "", ipa_mapping_filename: str = ""
+) -> bytes:
+    """
+    Digest everything the compiled tables of an engine depend on: the
+    contents of its dialect and IPA mapping files, ENGINE_VERSION, the
+    Python version and the sources of this module and SyrTools.
+
+    Parameters:
+        dialect_map_filename (str): The dialect JSON file, or "".
+        ipa_mapping_filename (str): The IPA mapping JSON file, or "".
+
+    Returns:
+        bytes: The SHA-256 digest.
+
+    Raises:
+        OSError: If a mapping file cannot be read.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{ENGINE_VERSION}\0{sys.version}\0".encode())
+    for filename in (
+        __file__,
+        getattr(sys.modules.get(SyrTools.__module__), "__file__", ""),
+        dialect_map_filename,
+        ipa_mapping_filename,
+    ):
+        content: bytes = b""
+        if filename:
+            with open(filename, "rb") as f:
+                content = f.read()
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+    return digest.digest()
+
+
+def table_cache_path(
+    cache_dir: str, dialect_map_filename: str, ipa_mapping_filename: str
+) -> str:
+    """
+    Name the table cache file of a pair of mapping files. The name holds
+    the file names for readability and a digest of their full paths.
+
+    Parameters:
+        cache_dir (str): The cache directory.
+        dialect_map_filename (str): The dialect JSON file, or "".
+        ipa_mapping_filename (str): The IPA mapping JSON file, or "".
+
+    Returns:
+        str: The path of the cache file.
+    """
+    stems: List[str] = [
+        os.path.splitext(os.path.basename(filename))[0] or "default"
+        for filename in (dialect_map_filename, ipa_mapping_filename)
+    ]
+    paths: str = "\0".join(
+        os.path.abspath(filename) if filename else ""
+        for filename in (dialect_map_filename, ipa_mapping_filename)
+    )
+    digest: str = hashlib.sha256(paths.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{stems[0]}-{stems[1]}-{digest}.tables")
+
+
+def table_cache_dir_trusted(cache_dir: str) -> bool:
+    """
+    Check that a table cache directory can only be changed by the current
+    user: it must be owned by them and not be group or world writable.
+    Where the platform has no user ids, only the mode is checked.
+
+    Parameters:
+        cache_dir (str): The cache directory.
+
+    Returns:
+        bool: Whether the directory exists and is trusted.
+    """
+    try:
+        status: os.stat_result = os.stat(cache_dir)
+    except OSError:
+        return False
+    if hasattr(os, "getuid") and status.st_uid != os.getuid():
+        return False
+    return not status.st_mode & 0o022
+
+
+def read_table_cache(path: str, key: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Read the tables saved by write_table_cache(), if they were built from
+    the sources digested in key.
+
+    Parameters:
+        path (str): The cache file.
+        key (bytes): The table_cache_key() of the engine.
+
+    Returns:
+        Optional[Dict[str, Any]]: The tables, or None if the file is
+        missing, was built from other sources, or is damaged.
+    """
+    try:
+        with open(path, "rb") as f:
+            data: bytes = f.read()
+    except OSError:
+        return None
+    # The key and the payload digest are both SHA-256 digests.
+    key_start: int = len(TABLE_CACHE_MAGIC)
+    digest_start: int = key_start + len(key)
+    payload_start: int = digest_start + len(key)
+    if (
+        data[:key_start] != TABLE_CACHE_MAGIC
+        or data[key_start:digest_start] != key
+        or data[digest_start:payload_start]
+        != hashlib.sha256(data[payload_start:]).digest()
+    ):
+        return None
+    try:
+        state = json.loads(data[payload_start:])
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def write_table_cache(path: str, key: bytes, state: Dict[str, Any]) -> None:
+    """
+    Save tables for read_table_cache(). The file is replaced atomically,
+    so concurrent readers see either the old or the new tables.
+
+    Parameters:
+        path (str): The cache file.
+        key (bytes): The table_cache_key() of the engine.
+        state (Dict[str, Any]): The tables, from table_state().
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    payload: bytes = json.dumps(
+        state, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    temporary: str = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(TABLE_CACHE_MAGIC)
+            f.write(key)
+            f.write(hashlib.sha256(payload).digest())
+            f.write(payload)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+# Engine of the current worker process, built by init_worker().
+worker_engine: Optional["SyrTransliterator"] = None
+
+
+def init_worker(config: EngineConfig) -> None:
+    """
+    Build the engine used by transliterate_batch() in a worker process.
+
+    Parameters:
+        config (EngineConfig): The engine description.
+    """
+    global worker_engine
+    worker_engine = SyrTransliterator.from_config(config)
+
+
+def transliterate_batch(
+    texts: List[str],
+    outputs: Optional[Tuple[str, ...]] = None,
+    vowel_system: str = "auto",
+) -> List[Dict[str, str]]:
+    """
+    Transliterate a batch of texts with the worker process engine.
+
+    Parameters:
+        texts (List[str]): The input Syriac texts.
+        outputs (Optional[Tuple[str, ...]]): The forms to compute, see
+        SyrTransliterator.transliterate().
+        vowel_system (str): The vowel system of the texts, see
+        SyrTransliterator.transliterate().
+
+    Returns:
+        List[Dict[str, str]]: The transliteration of each text.
+    """
+    assert worker_engine is not None, "init_worker() was not called"
+    return [
+        worker_engine.transliterate(text, outputs, vowel_system)
+        for text in texts
+    ]
+
 
 class SyrTransliterator(SyrTools):
     """
@@ -28,17 +724,282 @@ class SyrTransliterator(SyrTools):
     specific to transliteration.
     """
 
+    # Mapping tables that the compiled tables and the word cache are built
+    # from. Assigning or editing any of them invalidates both.
+    MAP_ATTRIBUTES: Tuple[str, ...] = (
+        "rukakheh_qushayeh_ipa_map",
+        "majleaneh_ipa_map",
+        "mater_lectionis_ipa_map",
+        "consonant_ipa_map",
+        "eastern_vowel_ipa_map",
+        "western_vowel_ipa_map",
+        "ipa_to_roman_map",
+        "special_punctuation_replacements",
+        "punctuation_replacements",
+        "special_case_map",
+        "abbreviation_map",
+    )
+
+    # Default special readings, applied in order to every word by
+    # apply_special_cases(). A rule is skipped when the first occurrence of
+    # its old text is followed by a vowel, unless it is the whole word.
+    # Dialect files can add or override rules under "special_cases".
+    SPECIAL_CASES: Tuple[Tuple[str, str], ...] = (
+        ("ܗ̇ܘ", "ܐܵܘܵ"),
+        ("ܗ̇ܝ", "ܐܵܝܵ"),
+        ("ܝܠܵܗ̇", "ܝܼܠܵܗ"),
+        ("ܝܠܗ̇", "ܝܼܠܵܗ"),
+        ("ܝܠܗ", "ܝܼܠܹܗ"),
+        ("ܝܠܹܗ", "ܝܼܠܹܗ"),
+        ("ܗ̇", "ܗ"),
+        ("ܡ̇ܢ", "ܡܵܢ"),
+        ("ܡ̣ܢ", "ܡܸܢ"),
+        ("ܢܲܦ̮ܫ", "ܢܲܘܫ"),
+        ("ܟܠ", "ܟܘܼܠ"),
+        ("ܟܠܢ", "ܟܘܼܠܵܢ"),
+    )
+
+    # Default abbreviations and contractions, expanded in order in Eastern
+    # text by handle_abbreviations_and_contractions(). Dialect files can
+    # add or override them under "abbreviations".
+    ABBREVIATIONS: Tuple[Tuple[str, str], ...] = (
+        ("܏ܩܛ", "ܩܲܕ݇ܡ ܛܲܗܪܵܐ"),
+        ("܏ܒܛ", "ܒܲܬ݇ܪ ܛܲܗܪܵܐ"),
+        ("ܩܫ܊", "ܩܵܫܝܼܫܵܐ"),
+    )
+
+    # Forms returned by transliterate(), in order.
+    OUTPUTS: Tuple[str, ...] = ("ipa", "natural_ipa", "romanized")
+    OUTPUT_SET: FrozenSet[str] = frozenset(OUTPUTS)
+
+    # Vowel systems accepted by transliterate() and encode_ipa(). With
+    # "auto" each word that holds an abbreviation is classified by its own
+    # vowels; "eastern" and "western" apply to the whole text.
+    VOWEL_SYSTEMS: Tuple[str, ...] = ("auto", "eastern", "western")
+
+    # Characters that separate IPA words.
+    IPA_PUNCTUATION: Tuple[str, ...] = (
+        ",",
+        ":",
+        ";",
+        "!",
+        ".",
+        "-",
+        "<",
+        ">",
+        "?",
+        "'",
+        '"',
+    )
+    # How ipa_to_roman() reads IPA in one pass: a bracket group (up to the
+    # next closing bracket or the end) or a stray closing bracket, both
+    # dropped; a separator (group 1); or a run of other characters (group
+    # 2). Brackets are not separators, so runs on both sides of a bracket
+    # group make one word.
+    ipa_token_pattern: "re.Pattern[str]" = re.compile(
+        f"\\[[^\\]]*\\]?|\\]"
+        f"|([{re.escape(''.join(IPA_PUNCTUATION))}\\s])"
+        f"|([^{re.escape(''.join(IPA_PUNCTUATION))}\\s\\[\\]]+)"
+    )
+
+    # Rank of each cluster character in the canonical token order used by
+    # tokenize_cluster (letters, siyame, qushayeh, rukakheh, majleaneh,
+    # vowels, qanuneh); a character in several classes takes the first.
+    # Talqaneh only set the bracket flag.
+    cluster_char_rank: Dict[str, int] = {
+        c: rank
+        for rank, chars in reversed(
+            list(
+                enumerate(
+                    (
+                        SyrTools.LETTER,
+                        SyrTools.SIYAMEH,
+                        SyrTools.QUSHAYEH,
+                        SyrTools.RUKAKHEH,
+                        SyrTools.MAJLEANEH,
+                        SyrTools.VOWEL,
+                        SyrTools.QANUNEH,
+                        SyrTools.TALQANEH,
+                    )
+                )
+            )
+        )
+        for c in chars
+    }
+
+    # Every canonical cluster (letter, siyame, qushayeh/rukakheh/majleaneh
+    # mark, vowel and qanuneh, in the order used by tokenize_cluster) that
+    # compile_cluster_table() maps to IPA.
+    cluster_table_keys: Tuple[str, ...] = tuple(
+        "".join(parts)
+        for parts in itertools.chain(
+            itertools.product(
+                ("",) + SyrTools.LETTER,
+                ("",) + SyrTools.SIYAMEH,
+                ("",)
+                + SyrTools.QUSHAYEH
+                + SyrTools.RUKAKHEH
+                + SyrTools.MAJLEANEH,
+                ("",) + SyrTools.VOWEL,
+            ),
+            itertools.product(
+                SyrTools.LETTER, ("",) + SyrTools.VOWEL, SyrTools.QANUNEH
+            ),
+        )
+    )
+
+    # Cluster tables already built, keyed by the contents of the maps they
+    # were built from, so that engines with the same maps share one table.
+    cluster_table_memo: Dict[Tuple[Any, ...], Dict[str, str]] = {}
+    CLUSTER_TABLE_MEMO_SIZE: int = 16
+    # Tables of encode_ipa_vectorized(), built only once NumPy is used and
+    # memoized like the cluster tables.
+    vector_table_memo: Dict[Tuple[Any, ...], VectorTables] = {}
+
+    # Scanner used by encode_ipa: each match is either a single separator
+    # (captured in group 1) or a maximal run of word characters.
+    syriac_token_pattern: "re.Pattern[str]" = re.compile(
+        f"([{re.escape(''.join(SyrTools.PUNCTUATION))}\\s])"
+        f"|[^{re.escape(''.join(SyrTools.PUNCTUATION))}\\s]+"
+    )
+    # A cluster is the first character of a word, or a letter, followed by
+    # every non-letter up to the next letter.
+    cluster_pattern: "re.Pattern[str]" = re.compile(
+        f"(?s).[^{''.join(SyrTools.LETTER)}]*"
+    )
+    # encode_ipa() classifies and segments texts of at least this many
+    # characters with NumPy, when it is installed.
+    VECTORIZE_MIN_CHARS: int = 1 << 14
+
+    # Flags of vector_class_table: span separators of encode_ipa (whitespace
+    # and punctuation), letters, and characters that make a word need
+    # rewriting.
+    VECTOR_SEPARATOR: int = 1
+    VECTOR_LETTER: int = 2
+    VECTOR_REWRITE: int = 4
+    # The characters matched by \s, that is str.isspace(), spelled out to
+    # keep imports fast. The set has not changed since Unicode 6.3.
+    VECTOR_SPACES: str = (
+        "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+        "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+        "\u2028\u2029\u202f\u205f\u3000"
+    )
+    # Flags of every Basic Multilingual Plane codepoint, built on first use
+    # by vector_classes(); other codepoints have none.
+    vector_class_table: Optional[Any] = None
+
+    # An opening bracket and everything up to the next closing bracket.
+    bracket_pattern: "re.Pattern[str]" = re.compile(r"\[([^\]]*)\]")
+
+    # Bundled dialect and IPA mapping files, found by for_dialect().
+    DIALECTS_DIR: str = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "dialects"
+    )
+    IPA_MAPS_DIR: str = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "ipa"
+    )
+    # Frozen engines built by for_dialect(), keyed by class, dialect and IPA
+    # map name.
+    engine_registry: Dict[Tuple[type, str, str], "SyrTransliterator"] = {}
+    engine_registry_lock: threading.Lock = threading.Lock()
+
+    # Tables that compile_tables() builds from the mapping tables and that
+    # table_state() saves as they are.
+    TABLE_ATTRIBUTES: Tuple[str, ...] = (
+        "ipa_vowels",
+        "ipa_mater_lectionis",
+        "punctuation_ipa_map",
+        "roman_map_by_token",
+    )
+    # Compiled patterns that table_state() saves as their source.
+    PATTERN_ATTRIBUTES: Tuple[str, ...] = (
+        "span_separator_pattern",
+        "span_prefix_pattern",
+        "roman_pattern",
+        "word_rewrite_pattern",
+    )
+    # Everything compile_tables() sets, shared through compiled_table_memo.
+    COMPILED_ATTRIBUTES: Tuple[str, ...] = (
+        TABLE_ATTRIBUTES
+        + PATTERN_ATTRIBUTES
+        + (
+            "ipa_bdol",
+            "cluster_ipa_table",
+            "reverse_tables",
+            "special_case_rules",
+            "abbreviation_rules",
+        )
+    )
+
+    # Compiled tables keyed by class and by the contents of every mapping
+    # table, so that engines with the same maps share them.
+    compiled_table_memo: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    COMPILED_TABLE_MEMO_SIZE: int = 16
+
+    # Per-engine state; the constants above and in SyrTools are shared.
+    __slots__ = (
+        (
+            "frozen",
+            "dialect_map_filename",
+            "ipa_mapping_filename",
+            "cache_dir",
+            "maps_edited",
+            "tables_stale",
+            "word_cache_size",
+            "word_cache",
+            "cache_hits",
+            "cache_misses",
+            "cache_evictions",
+            "stage_timer",
+            "prepositional_b",
+            "cluster_ipa_table",
+            "ipa_bdol",
+            "reverse_tables",
+            "special_case_rules",
+            "abbreviation_rules",
+            "__weakref__",
+        )
+        + TABLE_ATTRIBUTES
+        + PATTERN_ATTRIBUTES
+        + MAP_ATTRIBUTES
+    )
+
     def __init__(
-        self, dialect_map_filename: str = "", ipa_mapping_filename: str = ""
+        self,
+        dialect_map_filename: str = "",
+        ipa_mapping_filename: str = "",
+        word_cache_size: int = 0,
     ) -> None:
         """
         Initialize the SyrTransliterator with IPA-to-Roman mappings,
         punctuation replacements, and various IPA vowel and consonant
         collections.
+
+        Parameters:
+            dialect_map_filename (str): Optional dialect JSON file.
+            ipa_mapping_filename (str): Optional IPA mapping JSON file.
+            word_cache_size (int): Maximum number of words whose
+            transliteration is memoized by transliterate(). 0 disables the
+            cache.
         """
         super().__init__()
 
-        self.rukakheh_qushayeh_ipa_map: Dict[str, str] = {
+        self.frozen: bool = False
+        self.dialect_map_filename: str = dialect_map_filename
+        self.ipa_mapping_filename: str = ipa_mapping_filename
+        self.cache_dir: Optional[str] = None
+        self.maps_edited: bool = False
+        self.tables_stale: bool = True
+        self.word_cache_size: int = word_cache_size
+        self.word_cache: "OrderedDict[WordCacheKey, SpanResult]" = (
+            OrderedDict()
+        )
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.cache_evictions: int = 0
+        self.stage_timer: Optional[StageTimer] = None
+
+        rukakheh_qushayeh_ipa_map: Dict[str, str] = {
             "ܒ݂": "v",
             "ܓ݂": "ɣ",
             "ܕ݂": "ð",
@@ -54,7 +1015,7 @@ class SyrTransliterator(SyrTools):
             "ܬ݁": "t",
         }
 
-        self.majleaneh_ipa_map: Dict[str, str] = {
+        majleaneh_ipa_map: Dict[str, str] = {
             "ܓ̰": "ʤ",
             "ܙ̰": "ʒ",
             "ܙ̃": "ʒ",
@@ -64,13 +1025,13 @@ class SyrTransliterator(SyrTools):
             "ܫ̰": "ʒ",
         }
 
-        self.mater_lectionis_ipa_map: Dict[str, str] = {
+        mater_lectionis_ipa_map: Dict[str, str] = {
             "ܘܼ": "u",
             "ܘܿ": "o",
             "ܝܼ": "i",
         }
 
-        self.consonant_ipa_map: Dict[str, str] = {
+        consonant_ipa_map: Dict[str, str] = {
             "ܐ": "ʔ",
             self.LETTER_SUPERSCRIPT_ALAPH: "ʔ",
             "ܒ": "b",
@@ -99,16 +1060,16 @@ class SyrTransliterator(SyrTools):
             "ܬ": "t",
         }
 
-        self.prepositional_b = "o"
+        prepositional_b = "o"
 
-        self.eastern_vowel_ipa_map: Dict[str, str] = {
+        eastern_vowel_ipa_map: Dict[str, str] = {
             self.PTHAHA_DOTTED: "a",
             self.ZQAPHA_DOTTED: "ɑ",
             self.DOTTED_ZLAMA_HORIZONTAL: "ɪ",
             self.DOTTED_ZLAMA_ANGULAR: "e",
         }
 
-        self.western_vowel_ipa_map: Dict[str, str] = {
+        western_vowel_ipa_map: Dict[str, str] = {
             self.PTHAHA_ABOVE: "a",
             self.PTHAHA_BELOW: "a",
             self.ZQAPHA_ABOVE: "o",
@@ -121,7 +1082,7 @@ class SyrTransliterator(SyrTools):
             self.ESASA_BELOW: "u",
         }
 
-        self.ipa_to_roman_map: Dict[str, str] = {
+        ipa_to_roman_map: Dict[str, str] = {
             # Rukakheh & Qushayeh
             "v": "w",
             "ɣ": "gh",
@@ -173,7 +1134,7 @@ class SyrTransliterator(SyrTools):
             "u": "u",
         }
 
-        self.special_punctuation_replacements: Dict[str, str] = {
+        special_punctuation_replacements: Dict[str, str] = {
             self.END_OF_PARAGRAPH: ".",
             self.SUPRALINEAR_FULL_STOP: ".",
             self.SUBLINEAR_FULL_STOP: ".",
@@ -190,12 +1151,15 @@ class SyrTransliterator(SyrTools):
             self.BARREKH: "",
         }
 
-        self.punctuation_replacements: Dict[str, str] = {
+        punctuation_replacements: Dict[str, str] = {
             "؟": "?",
             "،": ",",
             "؛": ";",
         }
 
+        special_case_map: Dict[str, str] = dict(self.SPECIAL_CASES)
+        abbreviation_map: Dict[str, str] = dict(self.ABBREVIATIONS)
+
         if ipa_mapping_filename != "":
             with open(ipa_mapping_filename, "r", encoding="utf-8") as f:
                 mappings = json.load(f)
@@ -206,135 +1170,1556 @@ class SyrTransliterator(SyrTools):
                 eastern_vowels = mappings["eastern_vowels"]
                 western_vowels = mappings["western_vowels"]
 
-                for key in self.consonant_ipa_map.keys():
-                    self.consonant_ipa_map[key] = consonants[key]
-                for key in self.rukakheh_qushayeh_ipa_map.keys():
-                    self.rukakheh_qushayeh_ipa_map[key] = bgdfkt[key]
-                for key in self.majleaneh_ipa_map.keys():
-                    self.majleaneh_ipa_map[key] = majleaneh[key]
-                for key in self.mater_lectionis_ipa_map.keys():
-                    self.mater_lectionis_ipa_map[key] = mater_lectionis[key]
-
-                self.eastern_vowel_ipa_map[self.PTHAHA_DOTTED] = (
-                    eastern_vowels["ptakha"]
-                )
-                self.eastern_vowel_ipa_map[self.ZQAPHA_DOTTED] = (
-                    eastern_vowels["zqappa"]
-                )
-                self.eastern_vowel_ipa_map[self.DOTTED_ZLAMA_HORIZONTAL] = (
+                for key in consonant_ipa_map.keys():
+                    consonant_ipa_map[key] = consonants[key]
+                for key in rukakheh_qushayeh_ipa_map.keys():
+                    rukakheh_qushayeh_ipa_map[key] = bgdfkt[key]
+                for key in majleaneh_ipa_map.keys():
+                    majleaneh_ipa_map[key] = majleaneh[key]
+                for key in mater_lectionis_ipa_map.keys():
+                    mater_lectionis_ipa_map[key] = mater_lectionis[key]
+
+                eastern_vowel_ipa_map[self.PTHAHA_DOTTED] = eastern_vowels[
+                    "ptakha"
+                ]
+                eastern_vowel_ipa_map[self.ZQAPHA_DOTTED] = eastern_vowels[
+                    "zqappa"
+                ]
+                eastern_vowel_ipa_map[self.DOTTED_ZLAMA_HORIZONTAL] = (
                     eastern_vowels["zlama_kirya"]
                 )
-                self.eastern_vowel_ipa_map[self.DOTTED_ZLAMA_ANGULAR] = (
+                eastern_vowel_ipa_map[self.DOTTED_ZLAMA_ANGULAR] = (
                     eastern_vowels["zlama_yarikha"]
                 )
 
-                self.western_vowel_ipa_map[self.PTHAHA_ABOVE] = western_vowels[
-                    "pthaha_above"
-                ]
-                self.western_vowel_ipa_map[self.PTHAHA_BELOW] = western_vowels[
-                    "pthaha_below"
-                ]
-                self.western_vowel_ipa_map[self.ZQAPHA_ABOVE] = western_vowels[
-                    "zqapha_above"
-                ]
-                self.western_vowel_ipa_map[self.ZQAPHA_BELOW] = western_vowels[
-                    "zqapha_below"
-                ]
-                self.western_vowel_ipa_map[self.RBASA_ABOVE] = western_vowels[
-                    "rbasa_above"
-                ]
-                self.western_vowel_ipa_map[self.RBASA_BELOW] = western_vowels[
-                    "rbasa_below"
-                ]
-                self.western_vowel_ipa_map[self.HBASA_ABOVE] = western_vowels[
-                    "hbasa_above"
-                ]
-                self.western_vowel_ipa_map[self.HBASA_BELOW] = western_vowels[
-                    "hbasa_below"
-                ]
-                self.western_vowel_ipa_map[self.ESASA_ABOVE] = western_vowels[
-                    "esasa_above"
-                ]
-                self.western_vowel_ipa_map[self.ESASA_BELOW] = western_vowels[
-                    "esasa_below"
-                ]
+                western_vowel_ipa_map[self.PTHAHA_ABOVE] = western_vowels[
+                    "pthaha_above"
+                ]
+                western_vowel_ipa_map[self.PTHAHA_BELOW] = western_vowels[
+                    "pthaha_below"
+                ]
+                western_vowel_ipa_map[self.ZQAPHA_ABOVE] = western_vowels[
+                    "zqapha_above"
+                ]
+                western_vowel_ipa_map[self.ZQAPHA_BELOW] = western_vowels[
+                    "zqapha_below"
+                ]
+                western_vowel_ipa_map[self.RBASA_ABOVE] = western_vowels[
+                    "rbasa_above"
+                ]
+                western_vowel_ipa_map[self.RBASA_BELOW] = western_vowels[
+                    "rbasa_below"
+                ]
+                western_vowel_ipa_map[self.HBASA_ABOVE] = western_vowels[
+                    "hbasa_above"
+                ]
+                western_vowel_ipa_map[self.HBASA_BELOW] = western_vowels[
+                    "hbasa_below"
+                ]
+                western_vowel_ipa_map[self.ESASA_ABOVE] = western_vowels[
+                    "esasa_above"
+                ]
+                western_vowel_ipa_map[self.ESASA_BELOW] = western_vowels[
+                    "esasa_below"
+                ]
+
+        if dialect_map_filename != "":
+            with open(dialect_map_filename, "r", encoding="utf-8") as f:
+                mappings = json.load(f)
+                romanization = mappings["romanization"]
+                prepositional_b = mappings["prepositional_b"]
+                for key in ipa_to_roman_map.keys():
+                    ipa_to_roman_map[key] = romanization[key]
+                # Dialects may also romanize IPA sequences of any length
+                # that have no default mapping.
+                ipa_to_roman_map.update(romanization)
+                # Dialect-specific readings, as an object of old: new
+                # pairs or a list of [old, new] pairs.
+                special_case_map.update(mappings.get("special_cases", {}))
+                abbreviation_map.update(mappings.get("abbreviations", {}))
+
+        # The maps are observed from here on; filling them above had nothing
+        # to invalidate.
+        for name, table in zip(
+            self.MAP_ATTRIBUTES,
+            (
+                rukakheh_qushayeh_ipa_map,
+                majleaneh_ipa_map,
+                mater_lectionis_ipa_map,
+                consonant_ipa_map,
+                eastern_vowel_ipa_map,
+                western_vowel_ipa_map,
+                ipa_to_roman_map,
+                special_punctuation_replacements,
+                punctuation_replacements,
+                special_case_map,
+                abbreviation_map,
+            ),
+        ):
+            super().__setattr__(name, ObservedDict(table, self.maps_changed))
+        super().__setattr__("prepositional_b", prepositional_b)
+        # The tables are compiled on first use, or taken from
+        # compiled_table_memo when another engine has the same maps.
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Track the mapping tables so that edits to them invalidate the
+        compiled tables and the word cache.
+        """
+        if getattr(self, "frozen", False):
+            raise AttributeError(
+                f"cannot set {name!r}: this engine is shared and frozen; "
+                "build a new SyrTransliterator to customize it"
+            )
+        if name in self.MAP_ATTRIBUTES:
+            value = ObservedDict(value, self.maps_changed)
+        super().__setattr__(name, value)
+        if name in self.MAP_ATTRIBUTES or name == "prepositional_b":
+            self.maps_changed()
+
+    def freeze(self) -> None:
+        """
+        Make the engine immutable so that it can be shared: the tables are
+        compiled now, the mapping tables become read-only views and setting
+        any attribute raises AttributeError. Timing cannot be enabled on a
+        frozen engine, as it would time every caller sharing it.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        for name in self.MAP_ATTRIBUTES:
+            super().__setattr__(
+                name, MappingProxyType(dict(getattr(self, name)))
+            )
+        self.frozen = True
+
+    def maps_changed(self) -> None:
+        """
+        Mark the compiled tables as stale and empty the word cache. The
+        tables are rebuilt on next use.
+        """
+        self.tables_stale = True
+        self.maps_edited = True
+        self.word_cache.clear()
+
+    def compile_tables(self) -> None:
+        """
+        Set every table derived from the mapping dictionaries, building
+        them with build_tables() unless an engine of the same class with
+        the same maps already has. The tables are shared and must not be
+        modified.
+        """
+        memo_key: Tuple[Any, ...] = (type(self),) + tuple(
+            tuple(getattr(self, name).items()) for name in self.MAP_ATTRIBUTES
+        )
+        compiled: Optional[Dict[str, Any]] = self.compiled_table_memo.get(
+            memo_key
+        )
+        if compiled is None:
+            self.build_tables()
+            compiled = {
+                name: getattr(self, name) for name in self.COMPILED_ATTRIBUTES
+            }
+            memo = self.compiled_table_memo
+            if len(memo) >= self.COMPILED_TABLE_MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[memo_key] = compiled
+        else:
+            for name, value in compiled.items():
+                setattr(self, name, value)
+        self.tables_stale = False
+
+    def build_tables(self) -> None:
+        """
+        Build every table derived from the mapping dictionaries: the IPA
+        vowel and bdol collections, the cluster table, the punctuation table
+        and the span separators used by the word cache.
+        """
+        self.ipa_vowels: List[str] = (
+            list(self.eastern_vowel_ipa_map.values())
+            + list(self.western_vowel_ipa_map.values())
+            + list(self.mater_lectionis_ipa_map.values())
+        )
+
+        self.ipa_bdol: Tuple[str, str] = (
+            self.consonant_ipa_map["ܒ"],
+            self.consonant_ipa_map["ܕ"],
+            self.consonant_ipa_map["ܘ"],
+            self.consonant_ipa_map["ܠ"],
+        )
+        self.ipa_mater_lectionis: List[str] = list(
+            self.mater_lectionis_ipa_map.values()
+        )
+
+        self.compile_cluster_table()
+
+        self.punctuation_ipa_map: Dict[str, str] = {
+            mark: self.replace_punctuation(mark) for mark in self.PUNCTUATION
+        }
+
+        # Separators that can split a text into independently transliterated
+        # spans: their IPA is a single IPA punctuation mark that none of the
+        # naturalization or romanization rules can touch.
+        protected: List[str] = (
+            list(self.eastern_vowel_ipa_map.values())
+            + list(self.mater_lectionis_ipa_map.values())
+            + [self.consonant_ipa_map["ܐ"], self.consonant_ipa_map["ܑ"]]
+        )
+        span_separators: str = "".join(
+            mark
+            for mark, ipa in self.punctuation_ipa_map.items()
+            if len(ipa) == 1
+            and ipa in self.IPA_PUNCTUATION
+            and ipa not in protected
+        )
+        self.span_separator_pattern: "re.Pattern[str]" = re.compile(
+            f"[{re.escape(span_separators)}\\s]"
+        )
+        # Matches text up to and including its last span separator.
+        self.span_prefix_pattern: "re.Pattern[str]" = re.compile(
+            f"(?s).*[{re.escape(span_separators)}\\s]"
+        )
+
+        # Inverted maps and their longest-match patterns used by
+        # reverse_transliterate, keyed by whether Eastern vowels are used.
+        self.reverse_tables: Dict[
+            bool, Tuple["re.Pattern[str]", Dict[str, str]]
+        ] = {}
+        for eastern in (True, False):
+            ipa_to_syriac_map: Dict[str, str] = {}
+            for original_map in [
+                self.rukakheh_qushayeh_ipa_map,
+                self.majleaneh_ipa_map,
+                self.mater_lectionis_ipa_map,
+                self.consonant_ipa_map,
+                (
+                    self.eastern_vowel_ipa_map
+                    if eastern
+                    else self.western_vowel_ipa_map
+                ),
+                self.punctuation_replacements,
+            ]:
+                for ipa, syriac in self.invert_dict(original_map).items():
+                    ipa_to_syriac_map[ipa] = syriac[0]
+            self.reverse_tables[eastern] = (
+                compile_longest_match(ipa_to_syriac_map),
+                ipa_to_syriac_map,
+            )
+
+        self.roman_pattern: "re.Pattern[str]" = compile_longest_match(
+            self.ipa_to_roman_map
+        )
+        # Romanization keys match within one IPA token unless a key of
+        # several characters holds a separator; only then must ipa_to_roman()
+        # map the whole text at once.
+        self.roman_map_by_token: bool = not any(
+            len(key) > 1
+            and any(
+                char in self.IPA_PUNCTUATION or char.isspace() for char in key
+            )
+            for key in self.ipa_to_roman_map
+        )
+
+        self.special_case_rules: RewriteRules = RewriteRules(
+            self.special_case_map.items()
+        )
+        self.abbreviation_rules: RewriteRules = RewriteRules(
+            self.abbreviation_map.items()
+        )
+        # Words containing any of these need rewriting before tokenizing.
+        self.word_rewrite_pattern: "re.Pattern[str]" = compile_longest_match(
+            list(self.DECORATIVE)
+            + [self.ABBREVIATION_MARK, self.CONTRACTION]
+            + list(self.abbreviation_map)
+        )
+
+    def vector_tables(self) -> VectorTables:
+        """
+        Return the tables of encode_ipa_vectorized(), building them on first
+        use: the codepoints of the special case and abbreviation keys,
+        grouped by their first codepoint, and the IPA of every cluster and
+        separator. Engines with the same maps share them, like the cluster
+        table, and they must not be modified.
+
+        Returns:
+            VectorTables: The grouped keys and the IPA lookup table.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        memo_key: Tuple[Any, ...] = (
+            self.cluster_maps_key(),
+            tuple(self.punctuation_ipa_map.items()),
+            tuple(self.special_case_map),
+            tuple(self.abbreviation_map),
+        )
+        tables: Optional[VectorTables] = self.vector_table_memo.get(memo_key)
+        if tables is None:
+            keys: Dict[int, List[Tuple[int, ...]]] = {}
+            for key in memo_key[2] + memo_key[3]:
+                if key:
+                    codes: Tuple[int, ...] = tuple(map(ord, key))
+                    keys.setdefault(codes[0], []).append(codes)
+            lookup: Dict[str, str] = dict(self.cluster_ipa_table)
+            lookup.update(zip(self.VECTOR_SPACES, self.VECTOR_SPACES))
+            lookup.update(self.punctuation_ipa_map)
+            tables = (keys, lookup)
+            memo = self.vector_table_memo
+            if len(memo) >= self.CLUSTER_TABLE_MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[memo_key] = tables
+        return tables
+
+    def check_vowel_system(self, vowel_system: str) -> None:
+        """
+        Check a vowel_system argument.
+
+        Parameters:
+            vowel_system (str): One of VOWEL_SYSTEMS.
+
+        Raises:
+            ValueError: If vowel_system is not one of VOWEL_SYSTEMS.
+        """
+        if vowel_system not in self.VOWEL_SYSTEMS:
+            raise ValueError(
+                f"Unknown vowel system {vowel_system!r}; expected one of "
+                f"{', '.join(self.VOWEL_SYSTEMS)}"
+            )
+
+    def handle_abbreviations_and_contractions(
+        self, text: str, vowel_system: str = "auto"
+    ) -> str:
+        """
+        Replace known abbreviations and contractions in the text with their
+        full forms.
+
+        In Eastern text the rules of abbreviation_map are applied in order;
+        the abbreviation and contraction marks are then removed.
+
+        Parameters:
+            text (str): The input Syriac text.
+            vowel_system (str): "eastern" or "western" if the vowel system
+            is known, or "auto" to test the text with eastern().
+
+        Returns:
+            str: The text with abbreviations and contractions handled.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+
+        if vowel_system == "auto":
+            is_eastern: bool = self.eastern(text)
+        else:
+            is_eastern = vowel_system == "eastern"
+        if is_eastern:
+            text = self.abbreviation_rules.apply(text)
+
+        text = text.replace(self.ABBREVIATION_MARK, "")
+        text = text.replace(self.CONTRACTION, "")
+        return text
+
+    def transliterate(
+        self,
+        text: str,
+        outputs: Optional[Iterable[str]] = None,
+        vowel_system: str = "auto",
+    ) -> Dict[str, str]:
+        """
+        Transliterate Syriac text into IPA and Romanized forms.
+
+        The process includes:
+          - Encoding Syriac to IPA.
+          - Removing specific diacritical marks.
+          - Naturalizing the IPA for pronunciation.
+          - Converting IPA to Romanized phonemes.
+
+        When the word cache is enabled, the text is transliterated span by
+        span (see transliterate_span) and each span is memoized.
+
+        Parameters:
+            text (str): The input Syriac text.
+            outputs (Optional[Iterable[str]]): The forms to return, from
+            OUTPUTS. Stages needed by none of them are skipped: "ipa" alone
+            skips naturalization and romanization, and "natural_ipa"
+            without "romanized" skips romanization. Defaults to all forms.
+            vowel_system (str): "eastern" or "western" if the vowel system
+            of the text is known, which skips its detection; abbreviations
+            are expanded only in Eastern text. With "auto" (the default)
+            the text is scanned once for Eastern vowels, and only words
+            with an abbreviation are then classified one by one.
+
+        Returns:
+            Dict[str, str]: A dictionary with keys "ipa", "natural_ipa", and
+            "romanized", or only the keys in outputs.
+
+        Raises:
+            ValueError: If outputs names an unknown form or vowel_system is
+            not one of VOWEL_SYSTEMS.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        self.check_vowel_system(vowel_system)
+
+        wanted: FrozenSet[str] = self.OUTPUT_SET
+        if outputs is not None:
+            wanted = frozenset(outputs)
+            if not wanted <= self.OUTPUT_SET:
+                raise ValueError(
+                    f"Unknown outputs {sorted(wanted - self.OUTPUT_SET)}; "
+                    f"expected some of {', '.join(self.OUTPUTS)}"
+                )
+
+        result: Dict[str, str]
+        if self.word_cache_size > 0:
+            stages: int = 1
+            if "romanized" in wanted:
+                stages = 3
+            elif "natural_ipa" in wanted:
+                stages = 2
+            ipa, natural, romanized = self.transliterate_cached(
+                text, vowel_system=vowel_system, stages=stages
+            )
+            result = {
+                "ipa": ipa,
+                "natural_ipa": natural,
+                "romanized": romanized,
+            }
+        else:
+            lossless_ipa_text: str = self.run_stage(
+                "encode_ipa", self.encode_ipa, text, vowel_system
+            )
+            lossless_ipa_text = self.run_stage(
+                "remove_siyame", self.remove_siyame, lossless_ipa_text
+            )
+            result = {"ipa": lossless_ipa_text}
+
+            if "natural_ipa" in wanted or "romanized" in wanted:
+                phonetic_ipa_text: str = self.run_stage(
+                    "naturalize_ipa", self.naturalize_ipa, lossless_ipa_text
+                )
+                result["natural_ipa"] = phonetic_ipa_text
+                if "romanized" in wanted:
+                    result["romanized"] = self.run_stage(
+                        "ipa_to_roman", self.ipa_to_roman, phonetic_ipa_text
+                    )
+
+        if wanted is not self.OUTPUT_SET:
+            result = {
+                name: result[name] for name in self.OUTPUTS if name in wanted
+            }
+        return result
+
+    def run_stage(
+        self, stage: str, func: Callable[..., str], text: str, *args: Any
+    ) -> str:
+        """
+        Run a transliteration stage, timing it if timing is enabled.
+
+        Parameters:
+            stage (str): The stage name reported to the StageTimer.
+            func (Callable[..., str]): The stage.
+            text (str): The input of the stage.
+            *args (Any): Further arguments of the stage.
+
+        Returns:
+            str: The output of the stage.
+        """
+        timer: Optional[StageTimer] = self.stage_timer
+        if timer is None:
+            return func(text, *args)
+        start: float = timer.clock()
+        result: str = func(text, *args)
+        timer.record(stage, timer.clock() - start, len(text))
+        return result
+
+    def enable_timing(self, timer: Optional[StageTimer] = None) -> StageTimer:
+        """
+        Start timing the transliteration stages.
+
+        While timing is enabled, encode_ipa() and ipa_to_roman() run their
+        steps one after another over the whole text instead of word by
+        word, so that each step can be timed. The output is unchanged.
+        When timing is disabled each stage costs one extra attribute check.
+        Worker processes of transliterate_many() are not timed.
+
+        Parameters:
+            timer (Optional[StageTimer]): The timer to record into, which
+            may be shared with other engines. Defaults to the timer already
+            enabled, or a new one.
+
+        Returns:
+            StageTimer: The timer, for snapshot(), reset() and observers.
+
+        Raises:
+            AttributeError: If the engine is frozen. Build a new
+            SyrTransliterator to time a bundled dialect.
+        """
+        if timer is None:
+            timer = self.stage_timer or StageTimer()
+        self.stage_timer = timer
+        return timer
+
+    def disable_timing(self) -> None:
+        """
+        Stop timing the transliteration stages.
+
+        Raises:
+            AttributeError: If the engine is frozen.
+        """
+        self.stage_timer = None
+
+    def transliterate_dialects(
+        self,
+        text: str,
+        dialects: Optional[Iterable[str]] = None,
+        vowel_system: str = "auto",
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Transliterate Syriac text and romanize it in several dialects.
+
+        The IPA and natural IPA are computed once with this engine's IPA
+        mapping. Only the romanization is repeated per dialect, using the
+        romanization and prepositional b of the dialect's shared engine
+        (see for_dialect); dialects that write the prepositional b alike
+        share the bdol and glottal passes as well.
+
+        Parameters:
+            text (str): The input Syriac text.
+            dialects (Optional[Iterable[str]]): Names from
+            available_dialects(). Defaults to all of them.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+
+        Returns:
+            Dict[str, Dict[str, str]]: For each dialect, a dictionary with
+            keys "ipa", "natural_ipa", and "romanized", equal to the output
+            of transliterate() on an engine built from this engine's IPA
+            mapping and the dialect.
+
+        Raises:
+            ValueError: If a dialect is not bundled or vowel_system is not
+            one of VOWEL_SYSTEMS.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        self.check_vowel_system(vowel_system)
+
+        if dialects is None:
+            dialects = self.available_dialects()
+        engines: List[Tuple[str, SyrTransliterator]] = [
+            (dialect, self.for_dialect(dialect)) for dialect in dialects
+        ]
+
+        lossless_ipa_text: str = self.remove_siyame(
+            self.encode_ipa(text, vowel_system)
+        )
+        phonetic_ipa_text: str = self.naturalize_ipa(lossless_ipa_text)
+        unbracketed: str = self.remove_bracketed_content(phonetic_ipa_text)
+
+        prepared: Dict[str, str] = {}
+        results: Dict[str, Dict[str, str]] = {}
+        for dialect, engine in engines:
+            prepositional_b: str = engine.prepositional_b
+            if prepositional_b not in prepared:
+                prepared[prepositional_b] = self.handle_glottals(
+                    self.apply_bdol_prefixes(unbracketed, prepositional_b)
+                )
+            results[dialect] = {
+                "ipa": lossless_ipa_text,
+                "natural_ipa": phonetic_ipa_text,
+                "romanized": engine.map_to_roman(prepared[prepositional_b]),
+            }
+        return results
+
+    def transliterate_span(
+        self,
+        span: str,
+        at_start: bool,
+        at_end: bool,
+        vowel_system: str = "auto",
+        stages: int = 3,
+    ) -> SpanResult:
+        """
+        Transliterate a span of text that is delimited by span separators.
+
+        Naturalization treats the start and end of the whole text specially,
+        so the span is naturalized with a space standing in for the separator
+        on each side that is not an end of the text. This makes the result
+        identical to the span's share of transliterate() on the whole text.
+        The span may itself contain span separators.
+
+        Parameters:
+            span (str): Syriac text that is cut at span separators or at the
+            ends of the text.
+            at_start (bool): Whether the span starts the text.
+            at_end (bool): Whether the span ends the text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+            stages (int): The number of forms to compute: 1 for the IPA
+            only, 2 to also naturalize it, 3 to also romanize it. The forms
+            not computed are empty.
+
+        Returns:
+            SpanResult: The IPA, natural IPA and romanized forms of the span.
+        """
+        ipa: str = self.run_stage(
+            "encode_ipa", self.encode_ipa, span, vowel_system
+        )
+        ipa = self.run_stage("remove_siyame", self.remove_siyame, ipa)
+        if stages < 2:
+            return ipa, "", ""
+        natural: str = self.run_stage(
+            "naturalize_ipa",
+            self.naturalize_ipa,
+            ("" if at_start else " ") + ipa + ("" if at_end else " "),
+        )
+        natural = natural[
+            (0 if at_start else 1) : (len(natural) if at_end else -1)
+        ]
+        if stages < 3:
+            return ipa, natural, ""
+        return (
+            ipa,
+            natural,
+            self.run_stage("ipa_to_roman", self.ipa_to_roman, natural),
+        )
+
+    def transliterate_cached(
+        self,
+        text: str,
+        at_start: bool = True,
+        at_end: bool = True,
+        vowel_system: str = "auto",
+        tokens: Optional[List[TokenAlignment]] = None,
+        origin: Tuple[int, int, int, int] = (0, 0, 0, 0),
+        stages: int = 3,
+    ) -> SpanResult:
+        """
+        Transliterate text span by span through the word cache.
+
+        With vowel_system "auto" a span is transliterated alike in any text,
+        so it is cached by itself; a known vowel system is part of the key.
+
+        Parameters:
+            text (str): The input Syriac text, cut at span separators or at
+            the ends of the whole text.
+            at_start (bool): Whether the text starts the whole text.
+            at_end (bool): Whether the text ends the whole text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+            tokens (Optional[List[TokenAlignment]]): If given, the alignment
+            of each span and separator is appended to it.
+            origin (Tuple[int, int, int, int]): Offsets of the text in the
+            source, IPA, natural IPA and romanized text, added to the
+            offsets appended to tokens.
+            stages (int): The number of forms to compute, see
+            transliterate_span(). Spans are cached separately for each
+            number below 3, and the forms not computed are empty.
+
+        Returns:
+            SpanResult: The IPA, natural IPA and romanized forms of the text.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        cache = self.word_cache
+        ipa: List[str] = []
+        natural: List[str] = []
+        romanized: List[str] = []
+        start: int = 0
+        end: int = len(text)
+        source_at, ipa_at, natural_at, roman_at = origin
+        for match in itertools.chain(
+            self.span_separator_pattern.finditer(text), [None]
+        ):
+            stop: int = end if match is None else match.start()
+            if stop > start:
+                span: str = text[start:stop]
+                first: bool = at_start and start == 0
+                last: bool = at_end and stop == end
+                key: WordCacheKey
+                if stages < 3:
+                    key = (span, first, last, vowel_system, stages)
+                elif vowel_system != "auto":
+                    key = (span, first, last, vowel_system)
+                elif first or last:
+                    key = (span, first, last)
+                else:
+                    key = span
+                result = cache.get(key)
+                if result is None:
+                    self.cache_misses += 1
+                    result = self.transliterate_span(
+                        span, first, last, vowel_system, stages
+                    )
+                    cache[key] = result
+                    if len(cache) > self.word_cache_size:
+                        cache.popitem(last=False)
+                        self.cache_evictions += 1
+                else:
+                    self.cache_hits += 1
+                    cache.move_to_end(key)
+                ipa.append(result[0])
+                natural.append(result[1])
+                romanized.append(result[2])
+                if tokens is not None:
+                    ipa_end: int = ipa_at + len(result[0])
+                    natural_end: int = natural_at + len(result[1])
+                    roman_end: int = roman_at + len(result[2])
+                    tokens.append(
+                        TokenAlignment(
+                            (source_at + start, source_at + stop),
+                            (ipa_at, ipa_end),
+                            (natural_at, natural_end),
+                            (roman_at, roman_end),
+                            False,
+                        )
+                    )
+                    ipa_at, natural_at, roman_at = (
+                        ipa_end,
+                        natural_end,
+                        roman_end,
+                    )
+            if match is not None:
+                separator: str = match.group()
+                separator = self.punctuation_ipa_map.get(separator, separator)
+                ipa.append(separator)
+                natural.append(separator)
+                romanized.append(separator)
+                start = match.end()
+                if tokens is not None:
+                    size: int = len(separator)
+                    tokens.append(
+                        TokenAlignment(
+                            (source_at + match.start(), source_at + start),
+                            (ipa_at, ipa_at + size),
+                            (natural_at, natural_at + size),
+                            (roman_at, roman_at + size),
+                            True,
+                        )
+                    )
+                    ipa_at += size
+                    natural_at += size
+                    roman_at += size
+        return (
+            "".join(ipa),
+            "".join(natural) if stages > 1 else "",
+            "".join(romanized) if stages > 2 else "",
+        )
+
+    def iter_transliterate(
+        self, chunks: Iterable[str], vowel_system: str = "auto"
+    ) -> Iterator[SpanResult]:
+        """
+        Transliterate text that arrives in chunks.
+
+        Chunks are buffered only up to their last span separator, so the
+        pieces can be transliterated independently and the document start
+        and end rules of naturalize_ipa are applied only at the real start
+        and end. Memory use is bounded by the chunk size plus the longest
+        run of text without a separator.
+
+        Parameters:
+            chunks (Iterable[str]): Consecutive pieces of the input text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+
+        Returns:
+            Iterator[SpanResult]: The IPA, natural IPA and romanized forms of
+            consecutive pieces of the text. Their concatenation equals the
+            output of transliterate() on the whole text.
+
+        Raises:
+            ValueError: If vowel_system is not one of VOWEL_SYSTEMS.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        self.check_vowel_system(vowel_system)
+
+        # Text after the last separator seen so far. It holds no separator,
+        # so only each new chunk needs to be searched for one, and the
+        # pieces are joined only when the text is cut.
+        pending: List[str] = []
+        at_start: bool = True
+        for chunk in chunks:
+            match = self.span_prefix_pattern.match(chunk)
+            if match is None:
+                if chunk:
+                    pending.append(chunk)
+                continue
+            cut: int = match.end()
+            pending.append(chunk[:cut])
+            yield self.transliterate_piece(
+                "".join(pending), at_start, False, vowel_system
+            )
+            pending = [chunk[cut:]] if cut < len(chunk) else []
+            at_start = False
+        if pending or at_start:
+            yield self.transliterate_piece(
+                "".join(pending), at_start, True, vowel_system
+            )
+
+    def transliterate_piece(
+        self,
+        text: str,
+        at_start: bool,
+        at_end: bool,
+        vowel_system: str = "auto",
+    ) -> SpanResult:
+        """
+        Transliterate a piece of a larger text, through the word cache if it
+        is enabled.
+
+        Parameters:
+            text (str): A piece of text cut at span separators or at the
+            ends of the whole text.
+            at_start (bool): Whether the piece starts the whole text.
+            at_end (bool): Whether the piece ends the whole text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+
+        Returns:
+            SpanResult: The IPA, natural IPA and romanized forms of the
+            piece.
+        """
+        if self.word_cache_size > 0:
+            return self.transliterate_cached(
+                text, at_start, at_end, vowel_system
+            )
+        return self.transliterate_span(text, at_start, at_end, vowel_system)
+
+    def transliterate_aligned(
+        self, text: str, vowel_system: str = "auto"
+    ) -> Tuple[Dict[str, str], List[TokenAlignment]]:
+        """
+        Transliterate Syriac text and report where each token of the text
+        ends up in each output.
+
+        The text is transliterated span by span, through the word cache if
+        it is enabled, and the offsets are taken from the spans as the
+        outputs are assembled, so the outputs equal those of transliterate()
+        and naturalization still sees the real start and end of the text.
+        With the word cache enabled the offsets are recorded in the same
+        loop that assembles the output of transliterate(); building an
+        alignment for every token makes this about 3 times as slow when
+        most words hit the cache. Without the cache, each span is processed
+        on its own instead of the whole text at once, which makes this
+        about twice as slow.
+
+        Parameters:
+            text (str): The input Syriac text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+
+        Returns:
+            Tuple[Dict[str, str], List[TokenAlignment]]: The output of
+            transliterate(), and the alignment of each token in text order.
+            The tokens cover the text and every output without gaps.
+
+        Raises:
+            ValueError: If vowel_system is not one of VOWEL_SYSTEMS.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        self.check_vowel_system(vowel_system)
+
+        forms, tokens = self.align_piece(text, True, True, vowel_system)
+        return dict(zip(self.OUTPUTS, forms)), tokens
+
+    def transliterate_incremental(
+        self, text: str, vowel_system: str = "auto"
+    ) -> IncrementalState:
+        """
+        Transliterate Syriac text that will be edited, e.g. in an editor or
+        input method; see transliterate_edit().
+
+        Parameters:
+            text (str): The input Syriac text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+
+        Returns:
+            IncrementalState: The text, the output of transliterate() and
+            the token alignment of transliterate_aligned().
+
+        Raises:
+            ValueError: If vowel_system is not one of VOWEL_SYSTEMS.
+        """
+        result, tokens = self.transliterate_aligned(text, vowel_system)
+        return IncrementalState(text, result, tokens, [], vowel_system)
+
+    def transliterate_edit(
+        self, state: IncrementalState, offset: int, deleted: int, inserted: str
+    ) -> Tuple[IncrementalState, Dict[str, TextEdit]]:
+        """
+        Update a transliteration after an edit of its text.
+
+        Only the tokens that overlap or touch the edit are transliterated
+        again, with one more token on each side; since the tokens on either
+        side are separators or are cut off by one, every other token keeps
+        its transliteration, including the start and end of text rules of
+        naturalize_ipa(). Apart from copying the output strings, the cost
+        grows with the size of the edit and the number of tokens between it
+        and the previous edit, not with the length of the text.
+
+        The state must come from this engine, and its mappings must not have
+        changed since. It is consumed: its token lists are reused by the
+        returned state.
+
+        Parameters:
+            state (IncrementalState): The transliteration before the edit,
+            from transliterate_incremental() or transliterate_edit().
+            offset (int): Where the edit starts in state.text.
+            deleted (int): Number of characters removed at offset.
+            inserted (str): The text inserted at offset.
+
+        Returns:
+            Tuple[IncrementalState, Dict[str, TextEdit]]: The transliteration
+            of the edited text, and for each of "ipa", "natural_ipa" and
+            "romanized" the edit that turns the old output into the new one.
+
+        Raises:
+            ValueError: If the edit does not lie within state.text.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+
+        text: str = state.text
+        edit_end: int = offset + deleted
+        if offset < 0 or deleted < 0 or edit_end > len(text):
+            raise ValueError(
+                f"Edit of {deleted} characters at {offset} is outside of a "
+                f"text of {len(text)} characters"
+            )
+        new_text: str = text[:offset] + inserted + text[edit_end:]
+        lengths: Tuple[int, int, int, int] = (
+            len(text),
+            len(state.result["ipa"]),
+            len(state.result["natural_ipa"]),
+            len(state.result["romanized"]),
+        )
+        back: Tuple[int, int, int, int] = (
+            -lengths[0],
+            -lengths[1],
+            -lengths[2],
+            -lengths[3],
+        )
+        head: List[TokenAlignment] = state.head
+        tail: List[TokenAlignment] = state.tail
+
+        # Move the gap in front of the first token that ends at or after the
+        # edit, then one token further back.
+        while head and head[-1].source[1] >= offset:
+            tail.append(shift_alignment(head.pop(), back))
+        while tail and tail[-1].source[1] + lengths[0] < offset:
+            head.append(shift_alignment(tail.pop(), lengths))
+        if head:
+            tail.append(shift_alignment(head.pop(), back))
+
+        # Take out the tokens that start at or before the end of the edit,
+        # and one more.
+        redo: List[TokenAlignment] = []
+        while tail and tail[-1].source[0] + lengths[0] <= edit_end:
+            redo.append(tail.pop())
+        if tail:
+            redo.append(tail.pop())
+
+        # Offsets of the tokens to redo in the source and in each output.
+        lows: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        highs: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        if redo:
+            first: TokenAlignment = shift_alignment(redo[0], lengths)
+            last: TokenAlignment = shift_alignment(redo[-1], lengths)
+            lows = (
+                first.source[0],
+                first.ipa[0],
+                first.natural_ipa[0],
+                first.romanized[0],
+            )
+            highs = (
+                last.source[1],
+                last.ipa[1],
+                last.natural_ipa[1],
+                last.romanized[1],
+            )
+
+        forms, middle_tokens = self.align_piece(
+            new_text[lows[0] : highs[0] + len(inserted) - deleted],
+            lows[0] == 0,
+            highs[0] == len(text),
+            state.vowel_system,
+            lows,
+        )
+        head.extend(middle_tokens)
+
+        result: Dict[str, str] = {}
+        edits: Dict[str, TextEdit] = {}
+        for index, name in enumerate(self.OUTPUTS):
+            old: str = state.result[name]
+            start: int = lows[index + 1]
+            stop: int = highs[index + 1]
+            result[name] = old[:start] + forms[index] + old[stop:]
+            edits[name] = TextEdit(start, stop - start, forms[index])
+        return (
+            IncrementalState(new_text, result, head, tail, state.vowel_system),
+            edits,
+        )
+
+    def align_piece(
+        self,
+        text: str,
+        at_start: bool,
+        at_end: bool,
+        vowel_system: str = "auto",
+        origin: Tuple[int, int, int, int] = (0, 0, 0, 0),
+    ) -> Tuple[SpanResult, List[TokenAlignment]]:
+        """
+        Transliterate a piece of a larger text token by token, recording the
+        alignment of each token.
+
+        Parameters:
+            text (str): A piece of text cut at span separators or at the
+            ends of the whole text.
+            at_start (bool): Whether the piece starts the whole text.
+            at_end (bool): Whether the piece ends the whole text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+            origin (Tuple[int, int, int, int]): Offsets of the piece in the
+            source, IPA, natural IPA and romanized text, added to the
+            offsets of its tokens.
+
+        Returns:
+            Tuple[SpanResult, List[TokenAlignment]]: The IPA, natural IPA
+            and romanized forms of the piece, and the alignment of each of
+            its tokens.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        if self.word_cache_size > 0:
+            tokens: List[TokenAlignment] = []
+            return (
+                self.transliterate_cached(
+                    text, at_start, at_end, vowel_system, tokens, origin
+                ),
+                tokens,
+            )
+
+        # Source offsets, forms and separator flag of each token.
+        parts: List[Tuple[int, int, SpanResult, bool]] = []
+        start: int = 0
+        end: int = len(text)
+        for match in itertools.chain(
+            self.span_separator_pattern.finditer(text), [None]
+        ):
+            stop: int = end if match is None else match.start()
+            if stop > start:
+                forms: SpanResult = self.transliterate_span(
+                    text[start:stop],
+                    at_start and start == 0,
+                    at_end and stop == end,
+                    vowel_system,
+                )
+                parts.append((start, stop, forms, False))
+            if match is not None:
+                separator: str = match.group()
+                separator = self.punctuation_ipa_map.get(separator, separator)
+                parts.append(
+                    (
+                        match.start(),
+                        match.end(),
+                        (separator, separator, separator),
+                        True,
+                    )
+                )
+                start = match.end()
+
+        tokens = []
+        source_at, ipa_at, natural_at, roman_at = origin
+        for source_start, source_end, forms, is_separator in parts:
+            ipa_end: int = ipa_at + len(forms[0])
+            natural_end: int = natural_at + len(forms[1])
+            roman_end: int = roman_at + len(forms[2])
+            tokens.append(
+                TokenAlignment(
+                    (source_at + source_start, source_at + source_end),
+                    (ipa_at, ipa_end),
+                    (natural_at, natural_end),
+                    (roman_at, roman_end),
+                    is_separator,
+                )
+            )
+            ipa_at, natural_at, roman_at = ipa_end, natural_end, roman_end
+
+        joined: SpanResult = (
+            "".join(forms[0] for _, _, forms, _ in parts),
+            "".join(forms[1] for _, _, forms, _ in parts),
+            "".join(forms[2] for _, _, forms, _ in parts),
+        )
+        return joined, tokens
+
+    def transliterate_stream(
+        self,
+        infile: TextIO,
+        outfiles: Dict[str, TextIO],
+        chunk_size: int = 1 << 16,
+        vowel_system: str = "auto",
+    ) -> None:
+        """
+        Transliterate a text file without reading it into memory at once.
+
+        Parameters:
+            infile (TextIO): The Syriac input, opened in text mode.
+            outfiles (Dict[str, TextIO]): Output files keyed by "ipa",
+            "natural_ipa" and/or "romanized". Forms without a file are
+            discarded.
+            chunk_size (int): Number of characters read at a time.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
+        """
+        targets: List[Tuple[int, TextIO]] = [
+            (index, outfiles[key])
+            for index, key in enumerate(("ipa", "natural_ipa", "romanized"))
+            if key in outfiles
+        ]
+        chunks: Iterator[str] = iter(lambda: infile.read(chunk_size), "")
+        for piece in self.iter_transliterate(chunks, vowel_system):
+            for index, outfile in targets:
+                outfile.write(piece[index])
+
+    def engine_config(self) -> EngineConfig:
+        """
+        Describe this engine so that an identical one can be built in
+        another process.
+
+        Returns:
+            EngineConfig: The mapping files, the word cache size, the table
+            cache directory and, if the maps were edited after loading, a
+            snapshot of the maps.
+        """
+        maps: Optional[Dict[str, Any]] = None
+        if self.maps_edited:
+            maps = {
+                name: dict(getattr(self, name)) for name in self.MAP_ATTRIBUTES
+            }
+            maps["prepositional_b"] = self.prepositional_b
+        return EngineConfig(
+            self.dialect_map_filename,
+            self.ipa_mapping_filename,
+            self.word_cache_size,
+            maps,
+            self.cache_dir,
+        )
+
+    @classmethod
+    def from_config(cls, config: EngineConfig) -> "SyrTransliterator":
+        """
+        Build an engine from an EngineConfig, through its table cache
+        directory if it has one.
+
+        Parameters:
+            config (EngineConfig): The engine description.
+
+        Returns:
+            SyrTransliterator: The new engine.
+        """
+        engine = cls.load_cached(
+            dialect_map_filename=config.dialect_map_filename,
+            ipa_mapping_filename=config.ipa_mapping_filename,
+            word_cache_size=config.word_cache_size,
+            cache_dir=config.cache_dir,
+        )
+        if config.maps is not None:
+            for name, value in config.maps.items():
+                setattr(engine, name, value)
+        return engine
+
+    def table_state(self) -> Dict[str, Any]:
+        """
+        Collect the mapping tables and compiled tables of this engine, from
+        which from_table_state() rebuilds it without compiling.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable copies of the MAP_ATTRIBUTES,
+            of prepositional_b, of the TABLE_ATTRIBUTES, ipa_bdol and the
+            inverted maps of reverse_tables, the sources of the
+            PATTERN_ATTRIBUTES and of the reverse_tables patterns, and the
+            values of cluster_ipa_table.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        state: Dict[str, Any] = {
+            name: dict(getattr(self, name)) for name in self.MAP_ATTRIBUTES
+        }
+        state["prepositional_b"] = self.prepositional_b
+        for name in self.TABLE_ATTRIBUTES:
+            state[name] = getattr(self, name)
+        state["ipa_bdol"] = list(self.ipa_bdol)
+        for name in self.PATTERN_ATTRIBUTES:
+            state[name] = getattr(self, name).pattern
+        # JSON objects only have string keys, so the tables are listed
+        # Eastern first.
+        state["reverse_tables"] = [
+            [pattern.pattern, table]
+            for pattern, table in (
+                self.reverse_tables[True],
+                self.reverse_tables[False],
+            )
+        ]
+        # The keys are class constants, and one joined string loads much
+        # faster than ten thousand small ones.
+        state["cluster_ipa_table"] = "\0".join(self.cluster_ipa_table.values())
+        return state
+
+    @classmethod
+    def from_table_state(
+        cls,
+        state: Dict[str, Any],
+        dialect_map_filename: str = "",
+        ipa_mapping_filename: str = "",
+        word_cache_size: int = 0,
+    ) -> "SyrTransliterator":
+        """
+        Build an engine from the output of table_state().
+
+        Parameters:
+            state (Dict[str, Any]): The tables.
+            dialect_map_filename (str): The dialect JSON file they were
+            built from.
+            ipa_mapping_filename (str): The IPA mapping JSON file they were
+            built from.
+            word_cache_size (int): See __init__().
+
+        Returns:
+            SyrTransliterator: The new engine.
+
+        Raises:
+            KeyError: If a table is missing from state.
+            TypeError: If a table has the wrong type.
+            ValueError: If a table has the wrong shape.
+        """
+        engine = cls.__new__(cls)
+        SyrTools.__init__(engine)
+        engine.frozen = False
+        engine.dialect_map_filename = dialect_map_filename
+        engine.ipa_mapping_filename = ipa_mapping_filename
+        engine.cache_dir = None
+        engine.word_cache_size = word_cache_size
+        engine.word_cache = OrderedDict()
+        engine.cache_hits = 0
+        engine.cache_misses = 0
+        engine.cache_evictions = 0
+        engine.stage_timer = None
+        for name in cls.MAP_ATTRIBUTES + ("prepositional_b",):
+            setattr(engine, name, state[name])
+        for name in cls.TABLE_ATTRIBUTES:
+            setattr(engine, name, state[name])
+        engine.ipa_bdol = tuple(state["ipa_bdol"])
+        for name in cls.PATTERN_ATTRIBUTES:
+            setattr(engine, name, re.compile(state[name]))
+        (eastern_pattern, eastern_map), (western_pattern, western_map) = state[
+            "reverse_tables"
+        ]
+        engine.reverse_tables = {
+            True: (re.compile(eastern_pattern), eastern_map),
+            False: (re.compile(western_pattern), western_map),
+        }
+        engine.special_case_rules = RewriteRules(
+            engine.special_case_map.items()
+        )
+        engine.abbreviation_rules = RewriteRules(
+            engine.abbreviation_map.items()
+        )
+        engine.compile_cluster_table(state["cluster_ipa_table"])
+        engine.tables_stale = False
+        engine.maps_edited = False
+        return engine
+
+    @classmethod
+    def load_cached(
+        cls,
+        dialect_map_filename: str = "",
+        ipa_mapping_filename: str = "",
+        word_cache_size: int = 0,
+        cache_dir: Optional[str] = None,
+    ) -> "SyrTransliterator":
+        """
+        Build an engine like SyrTransliterator(), loading its tables from a
+        cache file in cache_dir when the file was built from the same
+        mapping files, ENGINE_VERSION, Python version and sources. Otherwise
+        the engine is built as usual and the file is written, or rewritten
+        when stale or damaged, for the next process.
+
+        The directory is created if missing. The cache is only used when
+        the directory is owned by the current user and is not group or
+        world writable; otherwise the engine is built without it.
 
-        if dialect_map_filename != "":
-            with open(dialect_map_filename, "r", encoding="utf-8") as f:
-                mappings = json.load(f)
-                romanization = mappings["romanization"]
-                self.prepositional_b = mappings["prepositional_b"]
-                for key in self.ipa_to_roman_map.keys():
-                    self.ipa_to_roman_map[key] = romanization[key]
+        Parameters:
+            dialect_map_filename (str): Optional dialect JSON file.
+            ipa_mapping_filename (str): Optional IPA mapping JSON file.
+            word_cache_size (int): See __init__().
+            cache_dir (Optional[str]): The cache directory, or None to build
+            the engine without a cache.
 
-        self.ipa_vowels: List[str] = (
-            list(self.eastern_vowel_ipa_map.values())
-            + list(self.western_vowel_ipa_map.values())
-            + list(self.mater_lectionis_ipa_map.values())
+        Returns:
+            SyrTransliterator: The new engine.
+
+        Raises:
+            OSError: If a mapping file cannot be read.
+        """
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            except OSError:
+                pass
+        if cache_dir is None or not table_cache_dir_trusted(cache_dir):
+            return cls(
+                dialect_map_filename, ipa_mapping_filename, word_cache_size
+            )
+
+        key: bytes = table_cache_key(
+            dialect_map_filename, ipa_mapping_filename
+        )
+        path: str = table_cache_path(
+            cache_dir, dialect_map_filename, ipa_mapping_filename
         )
+        state: Optional[Dict[str, Any]] = read_table_cache(path, key)
+        engine: Optional[SyrTransliterator] = None
+        if state is not None:
+            try:
+                engine = cls.from_table_state(
+                    state,
+                    dialect_map_filename,
+                    ipa_mapping_filename,
+                    word_cache_size,
+                )
+            except (KeyError, TypeError, ValueError):
+                pass
+        if engine is None:
+            engine = cls(
+                dialect_map_filename, ipa_mapping_filename, word_cache_size
+            )
+            try:
+                write_table_cache(path, key, engine.table_state())
+            except OSError:
+                # A read-only or full cache only costs the next start its
+                # speed.
+                pass
+        # Worker processes built from engine_config() use the cache too.
+        engine.cache_dir = cache_dir
+        return engine
+
+    @classmethod
+    def available_dialects(cls) -> List[str]:
+        """
+        List the bundled dialects.
 
-        self.ipa_bdol: Tuple[str, str] = (
-            self.consonant_ipa_map["ܒ"],
-            self.consonant_ipa_map["ܕ"],
-            self.consonant_ipa_map["ܘ"],
-            self.consonant_ipa_map["ܠ"],
+        Returns:
+            List[str]: The names of the JSON files in DIALECTS_DIR, without
+            the extension.
+        """
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(cls.DIALECTS_DIR)
+            if name.endswith(".json")
         )
-        self.ipa_mater_lectionis: List[str] = list(
-            self.mater_lectionis_ipa_map.values()
+
+    @classmethod
+    def available_ipa_maps(cls) -> List[str]:
+        """
+        List the bundled IPA mappings.
+
+        Returns:
+            List[str]: The names of the JSON files in IPA_MAPS_DIR, without
+            the extension.
+        """
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(cls.IPA_MAPS_DIR)
+            if name.endswith(".json")
         )
 
-    def handle_abbreviations_and_contractions(self, text: str) -> str:
+    @classmethod
+    def for_dialect(
+        cls, dialect: str = "", ipa: str = ""
+    ) -> "SyrTransliterator":
         """
-        Replace known abbreviations and contractions in the text with their
-        full forms.
+        Return the shared engine for a bundled dialect and IPA mapping.
+
+        Each pair is loaded and compiled once; later calls return the same
+        frozen engine, so choosing a dialect per request costs a dictionary
+        lookup. The engine has no word cache and is safe to share between
+        threads.
 
         Parameters:
-            text (str): The input Syriac text.
+            dialect (str): A name from available_dialects(), or "" for the
+            default romanization.
+            ipa (str): A name from available_ipa_maps(), or "" for the
+            default IPA mapping.
 
         Returns:
-            str: The text with abbreviations and contractions handled.
+            SyrTransliterator: The frozen engine.
+
+        Raises:
+            ValueError: If the dialect or IPA mapping is not bundled.
         """
-        eastern_replacements: List[List[str]] = [
-            ["܏ܩܛ", "ܩܲܕ݇ܡ ܛܲܗܪܵܐ"],
-            ["܏ܒܛ", "ܒܲܬ݇ܪ ܛܲܗܪܵܐ"],
-            ["ܩܫ܊", "ܩܵܫܝܼܫܵܐ"],
-        ]
+        key: Tuple[type, str, str] = (cls, dialect, ipa)
+        engine = cls.engine_registry.get(key)
+        if engine is not None:
+            return engine
+
+        for name, available, kind in (
+            (dialect, cls.available_dialects(), "dialect"),
+            (ipa, cls.available_ipa_maps(), "IPA mapping"),
+        ):
+            if name and name not in available:
+                raise ValueError(
+                    f"Unknown {kind} {name!r}; "
+                    f"expected one of {', '.join(available)}"
+                )
+
+        with cls.engine_registry_lock:
+            engine = cls.engine_registry.get(key)
+            if engine is None:
+                engine = cls(
+                    dialect_map_filename=(
+                        os.path.join(cls.DIALECTS_DIR, f"{dialect}.json")
+                        if dialect
+                        else ""
+                    ),
+                    ipa_mapping_filename=(
+                        os.path.join(cls.IPA_MAPS_DIR, f"{ipa}.json")
+                        if ipa
+                        else ""
+                    ),
+                )
+                engine.freeze()
+                cls.engine_registry[key] = engine
+        return engine
+
+    def transliterate_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+        outputs: Optional[Iterable[str]] = None,
+        vowel_system: str = "auto",
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Transliterate many texts on a pool of worker processes.
 
-        if self.eastern(text):
-            for old, new in eastern_replacements:
-                text = text.replace(old, new)
+        Texts are sent to the workers in chunks of chunksize, with at most
+        two chunks per worker in flight, and the results are yielded in input
+        order. Each worker builds its own engine from engine_config().
 
-        text = text.replace(self.ABBREVIATION_MARK, "")
-        text = text.replace(self.CONTRACTION, "")
-        return text
+        Parameters:
+            texts (Iterable[str]): The input Syriac texts.
+            workers (Optional[int]): Number of worker processes. Defaults to
+            the number of CPUs; 1 transliterates in this process.
+            chunksize (int): Number of texts sent to a worker at a time.
+            outputs (Optional[Iterable[str]]): The forms to compute, see
+            transliterate(). Defaults to all forms.
+            vowel_system (str): The vowel system of the texts, see
+            transliterate().
+
+        Returns:
+            Iterator[Dict[str, str]]: The result of transliterate() for each
+            text, in order.
 
-    def transliterate(self, text: str) -> Dict[str, str]:
+        Raises:
+            ValueError: If outputs names an unknown form, vowel_system is
+            not one of VOWEL_SYSTEMS or chunksize is not positive.
         """
-        Transliterate Syriac text into IPA and Romanized forms.
+        # Checked here rather than in the generator, so that bad arguments
+        # raise at the call and not on the first next().
+        self.check_vowel_system(vowel_system)
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        forms: Optional[Tuple[str, ...]] = None
+        if outputs is not None:
+            forms = tuple(outputs)
+            if not self.OUTPUT_SET.issuperset(forms):
+                raise ValueError(
+                    f"Unknown outputs {sorted(set(forms) - self.OUTPUT_SET)}"
+                    f"; expected some of {', '.join(self.OUTPUTS)}"
+                )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        return self.generate_many(
+            texts, workers, chunksize, forms, vowel_system
+        )
 
-        The process includes:
-          - Encoding Syriac to IPA.
-          - Removing specific diacritical marks.
-          - Naturalizing the IPA for pronunciation.
-          - Converting IPA to Romanized phonemes.
+    def generate_many(
+        self,
+        texts: Iterable[str],
+        workers: int,
+        chunksize: int,
+        forms: Optional[Tuple[str, ...]],
+        vowel_system: str,
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Yield the results of transliterate_many(), whose arguments it takes
+        already checked.
 
         Parameters:
-            text (str): The input Syriac text.
+            texts (Iterable[str]): The input Syriac texts.
+            workers (int): Number of worker processes.
+            chunksize (int): Number of texts sent to a worker at a time.
+            forms (Optional[Tuple[str, ...]]): The forms to compute.
+            vowel_system (str): The vowel system of the texts.
 
         Returns:
-            Dict[str, str]: A dictionary with keys "ipa", "natural_ipa", and
-            "romanized".
+            Iterator[Dict[str, str]]: The result of transliterate() for each
+            text, in order.
         """
-        lossless_ipa_text: str = self.encode_ipa(text)
-        lossless_ipa_text = self.remove_siyame(lossless_ipa_text)
+        if workers <= 1:
+            for text in texts:
+                yield self.transliterate(text, forms, vowel_system)
+            return
+
+        remaining: Iterator[str] = iter(texts)
+        batches: Iterator[List[str]] = iter(
+            lambda: list(itertools.islice(remaining, chunksize)), []
+        )
+        # Imported here, as it pulls in multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(self.engine_config(),),
+        ) as pool:
+            in_flight: "deque[Future[List[Dict[str, str]]]]" = deque()
+            for batch in batches:
+                in_flight.append(
+                    pool.submit(
+                        transliterate_batch, batch, forms, vowel_system
+                    )
+                )
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
 
-        phonetic_ipa_text: str = self.naturalize_ipa(lossless_ipa_text)
+    def cache_info(self) -> WordCacheInfo:
+        """
+        Report the hit, miss and eviction counts of the word cache.
 
-        return {
-            "ipa": lossless_ipa_text,
-            "natural_ipa": phonetic_ipa_text,
-            "romanized": self.ipa_to_roman(phonetic_ipa_text),
-        }
+        Returns:
+            WordCacheInfo: The cache statistics.
+        """
+        return WordCacheInfo(
+            self.cache_hits,
+            self.cache_misses,
+            self.cache_evictions,
+            self.word_cache_size,
+            len(self.word_cache),
+        )
+
+    def cache_clear(self) -> None:
+        """
+        Empty the word cache and reset its statistics.
+        """
+        self.word_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
 
     def get_subtoken_of_type(
         self, token: str, set_type: Tuple[str, ...]
@@ -356,34 +2741,71 @@ class SyrTransliterator(SyrTools):
                 s += t
         return s
 
-    def tokenize_cluster(self, cluster: str) -> str:
+    def compile_cluster_table(self, values: Optional[str] = None) -> None:
         """
-        Tokenize a cluster of Syriac characters into an ordered token string.
+        Precompute the IPA of every letter and mark combination into
+        cluster_ipa_table.
 
-        The token is constructed by extracting parts in a specific order:
-        letters, siyame, qushayeh, rukakheh, majleaneh, vowels, and qanuneh.
-        Additional mappings for maternal lectionis, rukakheh/qushayeh,
-        majleaneh, and consonants are then applied.
+        Each entry is keyed on one of cluster_table_keys and holds exactly
+        what the chained map replacements produce for it. Engines whose
+        Syriac to IPA maps are equal share the same table, which must not be
+        modified. Call this again after modifying any of those maps.
 
         Parameters:
-            cluster (str): A cluster of Syriac characters.
+            values (Optional[str]): The IPA of every key, joined with NULs,
+            as saved by table_state(). Computed from the maps when None.
+        """
+        memo_key: Tuple[Any, ...] = self.cluster_maps_key()
+        table: Optional[Dict[str, str]] = self.cluster_table_memo.get(memo_key)
+        if table is None:
+            keys: Tuple[str, ...] = self.cluster_table_keys
+            # The maps only ever match Syriac characters, so joining every
+            # key with a NUL lets one pass of replacements map the whole
+            # table. Fall back to one key at a time if a map value contains
+            # the separator.
+            if values is None:
+                values = self.apply_cluster_maps("\0".join(keys))
+            ipa: List[str] = values.split("\0")
+            if len(ipa) != len(keys):
+                ipa = [self.apply_cluster_maps(key) for key in keys]
+            table = dict(zip(keys, ipa))
+            memo = self.cluster_table_memo
+            if len(memo) >= self.CLUSTER_TABLE_MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[memo_key] = table
+
+        self.cluster_ipa_table: Dict[str, str] = table
+
+    def cluster_maps_key(self) -> Tuple[Any, ...]:
+        """
+        Return the contents of the maps the cluster table is built from, as
+        the key of the shared table memos.
 
         Returns:
-            str: The tokenized representation of the cluster.
+            Tuple[Any, ...]: The items of each of those maps.
         """
-        token_str: str = (
-            self.get_subtoken_of_type(cluster, self.LETTER)
-            + self.get_subtoken_of_type(cluster, self.SIYAMEH)
-            + self.get_subtoken_of_type(cluster, self.QUSHAYEH)
-            + self.get_subtoken_of_type(cluster, self.RUKAKHEH)
-            + self.get_subtoken_of_type(cluster, self.MAJLEANEH)
-            + self.get_subtoken_of_type(cluster, self.VOWEL)
-            + self.get_subtoken_of_type(cluster, self.QANUNEH)
+        return tuple(
+            tuple(ipa_map.items())
+            for ipa_map in (
+                self.mater_lectionis_ipa_map,
+                self.rukakheh_qushayeh_ipa_map,
+                self.majleaneh_ipa_map,
+                self.consonant_ipa_map,
+                self.eastern_vowel_ipa_map,
+            )
         )
 
-        if len(self.get_subtoken_of_type(cluster, self.TALQANEH)) > 0:
-            token_str = f"[{token_str}]"
+    def apply_cluster_maps(self, token_str: str) -> str:
+        """
+        Apply the mater lectionis, rukakheh/qushayeh, majleaneh, consonant
+        and Eastern vowel maps, in that order, to an ordered token string.
+
+        Parameters:
+            token_str (str): An ordered token string of Syriac characters.
 
+        Returns:
+            str: The token string with every mapped sequence replaced.
+        """
         for key in self.mater_lectionis_ipa_map:
             token_str = token_str.replace(
                 key, self.mater_lectionis_ipa_map[key]
@@ -405,6 +2827,52 @@ class SyrTransliterator(SyrTools):
 
         return token_str
 
+    def tokenize_cluster(self, cluster: str) -> str:
+        """
+        Tokenize a cluster of Syriac characters into an ordered token string.
+
+        The token is constructed by extracting parts in a specific order:
+        letters, siyame, qushayeh, rukakheh, majleaneh, vowels, and qanuneh.
+        Additional mappings for maternal lectionis, rukakheh/qushayeh,
+        majleaneh, and consonants are then applied.
+
+        Clusters are resolved through cluster_ipa_table, first as written and
+        then by their canonical order. Combinations missing from the table
+        are mapped directly.
+
+        Parameters:
+            cluster (str): A cluster of Syriac characters.
+
+        Returns:
+            str: The tokenized representation of the cluster.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+
+        ipa = self.cluster_ipa_table.get(cluster)
+        if ipa is not None:
+            return ipa
+
+        # Bucket the characters by their canonical rank in a single pass.
+        buckets: List[str] = ["", "", "", "", "", "", ""]
+        bracketed: bool = False
+        for c in cluster:
+            rank = self.cluster_char_rank.get(c)
+            if rank is None:
+                continue
+            if rank == 7:
+                bracketed = True
+            else:
+                buckets[rank] += c
+        token_str: str = "".join(buckets)
+
+        ipa = self.cluster_ipa_table.get(token_str)
+        if ipa is None:
+            ipa = self.apply_cluster_maps(token_str)
+        if bracketed:
+            ipa = f"[{ipa}]"
+        return ipa
+
     def naturalize_ipa(self, ipa: str) -> str:
         """
         Convert an IPA transcription to a naturalized pronunciation by applying
@@ -477,16 +2945,17 @@ class SyrTransliterator(SyrTools):
         Returns:
             str: The tokenized version of the word.
         """
-        ret_tokens: str = ""
-        cluster: List[str] = [word[0]]
-        for c in word[1:]:
-            if c not in self.LETTER:
-                cluster.append(c)
-            else:
-                ret_tokens += self.tokenize_cluster("".join(cluster))
-                cluster = [c]
-        ret_tokens += self.tokenize_cluster("".join(cluster))
-        return ret_tokens
+        if self.tables_stale:
+            self.compile_tables()
+
+        table: Dict[str, str] = self.cluster_ipa_table
+        ret_tokens: List[str] = []
+        for cluster in self.cluster_pattern.findall(word):
+            ipa = table.get(cluster)
+            if ipa is None:
+                ipa = self.tokenize_cluster(cluster)
+            ret_tokens.append(ipa)
+        return "".join(ret_tokens)
 
     def split_syriac_text(self, text: str) -> List[str]:
         """
@@ -499,19 +2968,9 @@ class SyrTransliterator(SyrTools):
             List[str]: A list where each element is a word or a punctuation
             mark.
         """
-        result: List[str] = []
-        word: str = ""
-        for char in text:
-            if char in self.PUNCTUATION or char.isspace():
-                if word:
-                    result.append(word)
-                    word = ""
-                result.append(char)
-            else:
-                word += char
-        if word:
-            result.append(word)
-        return result
+        return [
+            match.group() for match in self.syriac_token_pattern.finditer(text)
+        ]
 
     def split_ipa_text(self, text: str) -> List[str]:
         """
@@ -525,21 +2984,8 @@ class SyrTransliterator(SyrTools):
         """
         result: List[str] = []
         word: str = ""
-        punctuations: List[str] = [
-            ",",
-            ":",
-            ";",
-            "!",
-            ".",
-            "-",
-            "<",
-            ">",
-            "?",
-            "'",
-            '"',
-        ]
         for char in text:
-            if char in punctuations or char.isspace():
+            if char in self.IPA_PUNCTUATION or char.isspace():
                 if word:
                     result.append(word)
                     word = ""
@@ -550,7 +2996,7 @@ class SyrTransliterator(SyrTools):
             result.append(word)
         return result
 
-    def encode_ipa(self, text: str) -> str:
+    def encode_ipa(self, text: str, vowel_system: str = "auto") -> str:
         """
         Encode Syriac text into an IPA transcription.
 
@@ -558,25 +3004,256 @@ class SyrTransliterator(SyrTools):
         decorations, abbreviations, special cases, tokenizing, and replacing
         punctuation.
 
+        The text is scanned once: word and punctuation boundaries come from
+        syriac_token_pattern and cluster boundaries from cluster_pattern, and
+        every IPA piece is appended to a single output buffer.
+
         Parameters:
             text (str): The input Syriac text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
 
         Returns:
             str: The IPA transcription.
+
+        Raises:
+            ValueError: If vowel_system is not one of VOWEL_SYSTEMS.
         """
-        words: List[str] = self.split_syriac_text(text)
-        ipastr: str = ""
-        for word in words:
-            if word not in self.PUNCTUATION and not word.isspace():
+        if self.tables_stale:
+            self.compile_tables()
+        self.check_vowel_system(vowel_system)
+        # A word is Eastern only if it has an Eastern vowel, so text without
+        # any needs no word to be classified.
+        if vowel_system == "auto" and self.EASTERN_VOWEL_SET.isdisjoint(text):
+            vowel_system = "western"
+        if self.stage_timer is not None:
+            return self.encode_ipa_timed(text, self.stage_timer, vowel_system)
+        if len(text) >= self.VECTORIZE_MIN_CHARS and load_numpy() is not None:
+            return self.encode_ipa_vectorized(text, vowel_system)
+
+        table: Dict[str, str] = self.cluster_ipa_table
+        punctuation_ipa: Dict[str, str] = self.punctuation_ipa_map
+        find_clusters = self.cluster_pattern.findall
+        needs_rewrite = self.word_rewrite_pattern.search
+
+        out: List[str] = []
+        append = out.append
+        for match in self.syriac_token_pattern.finditer(text):
+            separator = match.group(1)
+            if separator is not None:
+                append(punctuation_ipa.get(separator, separator))
+                continue
+
+            word: str = match.group()
+            if needs_rewrite(word):
                 word = self.remove_decorative_chars(word)
-                word = self.handle_abbreviations_and_contractions(word)
+                word = self.handle_abbreviations_and_contractions(
+                    word, vowel_system
+                )
+            word = self.apply_special_cases(word)
+            for cluster in find_clusters(word):
+                ipa = table.get(cluster)
+                if ipa is None:
+                    ipa = self.tokenize_cluster(cluster)
+                append(ipa)
+        return "".join(out)
+
+    @classmethod
+    def vector_classes(cls) -> Any:
+        """
+        Return the flags of every Basic Multilingual Plane codepoint as a
+        NumPy array, building it on first use. Requires NumPy.
+
+        Returns:
+            Any: The uint8 array of VECTOR_SEPARATOR, VECTOR_LETTER and
+            VECTOR_REWRITE flags, indexed by codepoint.
+        """
+        table = SyrTransliterator.vector_class_table
+        if table is None:
+            load_numpy()
+            table = np.zeros(0x10000, dtype=np.uint8)
+            for chars, flag in [
+                (cls.VECTOR_SPACES, cls.VECTOR_SEPARATOR),
+                (cls.PUNCTUATION, cls.VECTOR_SEPARATOR),
+                (cls.LETTER, cls.VECTOR_LETTER),
+                (cls.DECORATIVE, cls.VECTOR_REWRITE),
+                ([cls.ABBREVIATION_MARK, cls.CONTRACTION], cls.VECTOR_REWRITE),
+            ]:
+                table[[ord(char) for char in chars]] |= flag
+            SyrTransliterator.vector_class_table = table
+        return table
+
+    def encode_ipa_vectorized(
+        self, text: str, vowel_system: str = "auto"
+    ) -> str:
+        """
+        Encode Syriac text into IPA like encode_ipa(), finding the word and
+        cluster boundaries with NumPy.
+
+        The codepoints of the text are classified with vector_classes(), and
+        the words holding a character or key that needs rewriting or a
+        special case key are found with array operations. Only those words
+        go through the rewriting steps one by one; every other cluster and
+        separator is cut out by its offsets and looked up in a single pass.
+        encode_ipa() calls this for texts of at least VECTORIZE_MIN_CHARS
+        characters when NumPy is installed. Requires NumPy.
+
+        Parameters:
+            text (str): The input Syriac text.
+            vowel_system (str): The vowel system of the text, see
+            transliterate(). "auto" classifies each rewritten word.
+
+        Returns:
+            str: The IPA transcription.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        length: int = len(text)
+        if not length:
+            return ""
+
+        classes = self.vector_classes()
+        # Lone surrogates are kept as their own codepoints.
+        codes = np.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"), dtype="<u4"
+        )
+        flags = classes[np.minimum(codes, 0xFFFF)]
+        separator = (flags & self.VECTOR_SEPARATOR) != 0
+        word_start = ~separator
+        word_start[1:] &= separator[:-1]
+        # The number of the word each character is in or follows; -1 before
+        # the first word, which indexes the spare last entry of rewrite.
+        word_of = np.cumsum(word_start) - 1
+        rewrite = np.zeros(int(word_of[-1]) + 2, dtype=bool)
+
+        kinds = flags & (self.VECTOR_SEPARATOR | self.VECTOR_REWRITE)
+        rewrite[word_of[kinds == self.VECTOR_REWRITE]] = True
+        # Words with an occurrence of a key are rewritten too; keys holding
+        # a separator never occur inside a word, so flagging the word around
+        # such a match is harmless.
+        vector_keys, vector_lookup = self.vector_tables()
+        for first, keys in vector_keys.items():
+            starts = np.flatnonzero(codes == first)
+            for key in keys:
+                found = starts[starts <= length - len(key)]
+                for offset in range(1, len(key)):
+                    found = found[codes[found + offset] == key[offset]]
+                rewrite[word_of[found]] = True
+
+        # Pieces start at separators, at words, and at the letters of words
+        # that are not rewritten, so each rewritten word is one piece.
+        rewritten = rewrite[word_of] & ~separator
+        starts = np.flatnonzero(
+            separator
+            | word_start
+            | ((flags & self.VECTOR_LETTER) != 0) & ~rewritten
+        )
+        offsets: List[int] = starts.tolist()
+        pieces: List[str] = list(
+            map(
+                text.__getitem__,
+                map(slice, offsets, offsets[1:] + [length]),
+            )
+        )
+
+        out: List[Optional[str]] = list(map(vector_lookup.get, pieces))
+        # Rewritten words repeat, so each distinct one is encoded once.
+        encoded: Dict[str, str] = {}
+        for index in np.flatnonzero(rewritten[starts]).tolist():
+            word: str = pieces[index]
+            ipa: Optional[str] = encoded.get(word)
+            if ipa is None:
+                if self.word_rewrite_pattern.search(word):
+                    word = self.remove_decorative_chars(word)
+                    word = self.handle_abbreviations_and_contractions(
+                        word, vowel_system
+                    )
                 word = self.apply_special_cases(word)
-                word = self.tokenize_word(word)
-            word = self.replace_punctuation(word)
-            ipastr += word
-        return ipastr
+                ipa_pieces: List[str] = []
+                for cluster in self.cluster_pattern.findall(word):
+                    ipa = self.cluster_ipa_table.get(cluster)
+                    if ipa is None:
+                        ipa = self.tokenize_cluster(cluster)
+                    ipa_pieces.append(ipa)
+                ipa = encoded[pieces[index]] = "".join(ipa_pieces)
+            out[index] = ipa
+        if None in out:
+            for index, ipa in enumerate(out):
+                if ipa is None:
+                    out[index] = self.tokenize_cluster(pieces[index])
+        return "".join(out)  # type: ignore[arg-type]
+
+    def encode_ipa_timed(
+        self, text: str, timer: StageTimer, vowel_system: str = "auto"
+    ) -> str:
+        """
+        Encode Syriac text into IPA like encode_ipa(), but run each step
+        over every word before the next step, recording the time of each
+        step in timer.
+
+        Parameters:
+            text (str): The input Syriac text.
+            timer (StageTimer): The timer to record into.
+            vowel_system (str): The vowel system of the text, see
+            transliterate().
 
-    def apply_bdol_prefixes(self, text: str) -> str:
+        Returns:
+            str: The IPA transcription.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        clock: Callable[[], float] = timer.clock
+        table: Dict[str, str] = self.cluster_ipa_table
+        punctuation_ipa: Dict[str, str] = self.punctuation_ipa_map
+
+        # Separators are replaced by their IPA right away; the positions of
+        # the words are kept for the later steps.
+        start: float = clock()
+        pieces: List[str] = []
+        words: List[int] = []
+        for match in self.syriac_token_pattern.finditer(text):
+            separator = match.group(1)
+            if separator is None:
+                words.append(len(pieces))
+                pieces.append(match.group())
+            else:
+                pieces.append(punctuation_ipa.get(separator, separator))
+        now: float = clock()
+        timer.record("encode_ipa.split", now - start, len(text))
+
+        start = now
+        chars: int = sum(len(pieces[index]) for index in words)
+        for index in words:
+            if self.word_rewrite_pattern.search(pieces[index]):
+                pieces[index] = self.handle_abbreviations_and_contractions(
+                    self.remove_decorative_chars(pieces[index]), vowel_system
+                )
+        now = clock()
+        timer.record("encode_ipa.abbreviations", now - start, chars)
+
+        start = now
+        chars = sum(len(pieces[index]) for index in words)
+        for index in words:
+            pieces[index] = self.apply_special_cases(pieces[index])
+        now = clock()
+        timer.record("encode_ipa.special_cases", now - start, chars)
+
+        start = now
+        chars = sum(len(pieces[index]) for index in words)
+        for index in words:
+            ipa: List[str] = []
+            for cluster in self.cluster_pattern.findall(pieces[index]):
+                cluster_ipa = table.get(cluster)
+                if cluster_ipa is None:
+                    cluster_ipa = self.tokenize_cluster(cluster)
+                ipa.append(cluster_ipa)
+            pieces[index] = "".join(ipa)
+        timer.record("encode_ipa.tokenize", clock() - start, chars)
+        return "".join(pieces)
+
+    def apply_bdol_prefixes(
+        self, text: str, prepositional_b: Optional[str] = None
+    ) -> str:
         """
         Apply bdol prefixes to IPA tokens. If a token starts with a bdol
         consonant and is not followed by a vowel, an apostrophe is inserted
@@ -584,10 +3261,18 @@ class SyrTransliterator(SyrTools):
 
         Parameters:
             text (str): The IPA text.
+            prepositional_b (Optional[str]): What a prepositional waw is
+            written as. Defaults to the engine's prepositional_b.
 
         Returns:
             str: The IPA text with bdol prefixes applied.
         """
+        if self.tables_stale:
+            self.compile_tables()
+
+        if prepositional_b is None:
+            prepositional_b = self.prepositional_b
+
         split_ipa: List[str] = self.split_ipa_text(text)
         bdolized_str: str = ""
         for tok in split_ipa:
@@ -598,7 +3283,7 @@ class SyrTransliterator(SyrTools):
             ):
                 bdol = tok[0]
                 if tok[0] == self.consonant_ipa_map["ܘ"]:
-                    bdol = self.prepositional_b
+                    bdol = prepositional_b
                 bdolized_str += f"{bdol}'{tok[1:]}"
             else:
                 bdolized_str += tok
@@ -664,40 +3349,21 @@ class SyrTransliterator(SyrTools):
         Apply special phonetic replacements to handle specific edge cases in
         the word.
 
+        The rules of special_case_map are applied in order, each replacing
+        every occurrence of its old text. A rule is skipped when the first
+        occurrence is followed by a vowel, unless the old text is the whole
+        word.
+
         Parameters:
             word (str): The input word.
 
         Returns:
             str: The word after special phonetic replacements.
         """
-        special_phonetic_replacements: List[List[str]] = [
-            ["ܗ̇ܘ", "ܐܵܘܵ"],
-            ["ܗ̇ܝ", "ܐܵܝܵ"],
-            ["ܝܠܵܗ̇", "ܝܼܠܵܗ"],
-            ["ܝܠܗ̇", "ܝܼܠܵܗ"],
-            ["ܝܠܗ", "ܝܼܠܹܗ"],
-            ["ܝܠܹܗ", "ܝܼܠܹܗ"],
-            ["ܗ̇", "ܗ"],
-            ["ܡ̇ܢ", "ܡܵܢ"],
-            ["ܡ̣ܢ", "ܡܸܢ"],
-            ["ܢܲܦ̮ܫ", "ܢܲܘܫ"],
-            ["ܟܠ", "ܟܘܼܠ"],
-            ["ܟܠܢ", "ܟܘܼܠܵܢ"],
-        ]
-        for old, new in special_phonetic_replacements:
-            index: int = word.find(old)
-            if old in word:
-                if len(old) == len(word):
-                    word = word.replace(old, new)
-                elif len(word) >= index + len(old):
-                    if (
-                        len(word) > index + len(old)
-                        and word[index + len(old)] in self.VOWEL
-                    ):
-                        pass
-                    else:
-                        word = word.replace(old, new)
-        return word
+        if self.tables_stale:
+            self.compile_tables()
+
+        return self.special_case_rules.apply(word, self.VOWEL_SET)
 
     def remove_bracketed_content(self, ipa_text: str) -> str:
         """
@@ -729,7 +3395,12 @@ class SyrTransliterator(SyrTools):
           - Removing bracketed content.
           - Applying bdol prefixes.
           - Handling glottal stop adjustments.
-          - Mapping IPA segments to their Romanized equivalents.
+          - Mapping IPA segments to their Romanized equivalents, taking the
+            longest romanization key at each position.
+
+        The text is read once with ipa_token_pattern, and each distinct
+        token is romanized once with romanize_token(); the result is the
+        same as running the steps one after another over the whole text.
 
         Parameters:
             ipa_text (str): The IPA transcription.
@@ -737,26 +3408,113 @@ class SyrTransliterator(SyrTools):
         Returns:
             str: The Romanized transcription.
         """
-        ipa_text = self.remove_bracketed_content(ipa_text)
-        ipa_text = self.apply_bdol_prefixes(ipa_text)
-        ipa_text = self.handle_glottals(ipa_text)
+        if self.tables_stale:
+            self.compile_tables()
+
+        timer: Optional[StageTimer] = self.stage_timer
+        if timer is not None:
+            for stage, step in (
+                ("ipa_to_roman.brackets", self.remove_bracketed_content),
+                ("ipa_to_roman.bdol", self.apply_bdol_prefixes),
+                ("ipa_to_roman.glottals", self.handle_glottals),
+                ("ipa_to_roman.map", self.map_to_roman),
+            ):
+                start: float = timer.clock()
+                chars: int = len(ipa_text)
+                ipa_text = step(ipa_text)
+                timer.record(stage, timer.clock() - start, chars)
+            return ipa_text
+
+        if not self.roman_map_by_token:
+            ipa_text = self.remove_bracketed_content(ipa_text)
+            ipa_text = self.apply_bdol_prefixes(ipa_text)
+            ipa_text = self.handle_glottals(ipa_text)
+            return self.map_to_roman(ipa_text)
+
+        romanized: Dict[str, str] = {}
+        out: List[str] = []
+        append = out.append
+        romanize_token = self.romanize_token
+
+        def emit(token: str) -> None:
+            roman: Optional[str] = romanized.get(token)
+            if roman is None:
+                roman = romanized[token] = romanize_token(token)
+            append(roman)
 
-        result: List[str] = []
-        i: int = 0
-        while i < len(ipa_text):
-            found: bool = False
-            for length in [3, 2, 1]:
-                if i + length <= len(ipa_text):
-                    segment: str = ipa_text[i : i + length]
-                    if segment in self.ipa_to_roman_map:
-                        result.append(self.ipa_to_roman_map[segment])
-                        i += length
-                        found = True
-                        break
-            if not found:
-                result.append(ipa_text[i])
-                i += 1
-        return "".join(result)
+        word: str = ""
+        for match in self.ipa_token_pattern.finditer(ipa_text):
+            kind: Optional[int] = match.lastindex
+            if kind == 2:
+                word += match.group(2)
+            elif kind == 1:
+                if word:
+                    emit(word)
+                    word = ""
+                emit(match.group(1))
+        if word:
+            emit(word)
+        return "".join(out)
+
+    def romanize_token(self, token: str) -> str:
+        """
+        Romanize one IPA word or separator the way ipa_to_roman() does:
+        apply the bdol prefix, trim glottal stops and map the segments.
+
+        Parameters:
+            token (str): A separator, or a word without brackets or
+            separators.
+
+        Returns:
+            str: The Romanized token.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+        glottals: Tuple[str, str] = (
+            self.consonant_ipa_map["ܐ"],
+            self.consonant_ipa_map["ܑ"],
+        )
+        if (
+            len(token) > 1
+            and token[0] in self.ipa_bdol
+            and token[1] not in self.ipa_vowels
+        ):
+            bdol: str = token[0]
+            if bdol == self.consonant_ipa_map["ܘ"]:
+                bdol = self.prepositional_b
+            # The apostrophe is a separator, so the glottals of the parts on
+            # each side of it are trimmed separately.
+            token = self.handle_glottals(f"{bdol}'{token[1:]}")
+        elif token[0] in glottals:
+            token = token[1:]
+        elif token[-1] in glottals:
+            token = token[:-1]
+
+        ipa_to_roman_map: Dict[str, str] = self.ipa_to_roman_map
+        return self.roman_pattern.sub(
+            lambda match: ipa_to_roman_map[match.group()], token
+        )
+
+    def map_to_roman(self, ipa_text: str) -> str:
+        """
+        Map IPA segments to their Romanized equivalents, the last step of
+        ipa_to_roman(). The longest romanization key is taken at each
+        position; characters that start no key are copied unchanged.
+
+        Parameters:
+            ipa_text (str): IPA text with brackets, bdol prefixes and
+            glottals already handled.
+
+        Returns:
+            str: The Romanized text.
+        """
+        if self.tables_stale:
+            self.compile_tables()
+
+        ipa_to_roman_map: Dict[str, str] = self.ipa_to_roman_map
+        return self.roman_pattern.sub(
+            lambda match: ipa_to_roman_map[match.group()], ipa_text
+        )
 
     def invert_dict(self, d: Dict[str, str]) -> Dict[str, List[str]]:
         """
@@ -788,6 +3546,9 @@ class SyrTransliterator(SyrTools):
         Eastern or Western vowel rules) and then scans the IPA text for
         multi-character segments to reconstruct the Syriac text.
 
+        The inverted maps are compiled once, together with a longest-match
+        pattern over their keys, and rebuilt only when the maps change.
+
         Parameters:
             ipa_text (str): The IPA transcription.
             eastern (bool, optional): Whether to use Eastern vowel mappings.
@@ -799,57 +3560,40 @@ class SyrTransliterator(SyrTools):
         if not ipa_text:
             return ""
 
-        ipa_to_syriac_map: Dict[str, List[str]] = {}
-        if eastern:
-            for original_map in [
-                self.rukakheh_qushayeh_ipa_map,
-                self.majleaneh_ipa_map,
-                self.mater_lectionis_ipa_map,
-                self.consonant_ipa_map,
-                self.eastern_vowel_ipa_map,
-                self.punctuation_replacements,
-            ]:
-                ipa_to_syriac_map.update(self.invert_dict(original_map))
-        else:
-            for original_map in [
-                self.rukakheh_qushayeh_ipa_map,
-                self.majleaneh_ipa_map,
-                self.mater_lectionis_ipa_map,
-                self.consonant_ipa_map,
-                self.western_vowel_ipa_map,
-                self.punctuation_replacements,
-            ]:
-                ipa_to_syriac_map.update(self.invert_dict(original_map))
+        if self.tables_stale:
+            self.compile_tables()
 
-        result: List[str] = []
-        i: int = 0
-        while i < len(ipa_text):
-            found: bool = False
-            for length in [3, 2, 1]:
-                if i + length <= len(ipa_text):
-                    segment: str = ipa_text[i : i + length]
-                    if segment in ipa_to_syriac_map:
-                        result.append(ipa_to_syriac_map[segment][0])
-                        i += length
-                        found = True
-                        break
-            if not found:
-                result.append(ipa_text[i])
-                i += 1
-
-        syr_text: str = "".join(result)
+        pattern, ipa_to_syriac_map = self.reverse_tables[eastern]
+        syr_text: str = pattern.sub(
+            lambda match: ipa_to_syriac_map[match.group()], ipa_text
+        )
 
         # Process bracketed content: remove brackets and add an oblique line
         # above if necessary.
-        final_result: List[str] = []
-        inside_brackets: bool = False
-        for char in syr_text:
-            if char == "[":
-                inside_brackets = True
-            elif char == "]":
-                if inside_brackets:
-                    final_result.append(self.OBLIQUE_LINE_ABOVE)
-                inside_brackets = False
-            else:
-                final_result.append(char)
-        return "".join(final_result)
+        if "[" in syr_text or "]" in syr_text:
+            syr_text = self.bracket_pattern.sub(
+                lambda match: match.group(1).replace("[", "")
+                + self.OBLIQUE_LINE_ABOVE,
+                syr_text,
+            )
+            syr_text = syr_text.replace("[", "").replace("]", "")
+        return syr_text
+
+    def reverse_transliterate_many(
+        self, ipa_texts: Iterable[str], eastern: bool = True
+    ) -> List[str]:
+        """
+        Reverse the transliteration of many IPA transcriptions.
+
+        Parameters:
+            ipa_texts (Iterable[str]): The IPA transcriptions.
+            eastern (bool, optional): Whether to use Eastern vowel mappings.
+            Defaults to True.
+
+        Returns:
+            List[str]: The reconstructed Syriac text of each transcription.
+        """
+        return [
+            self.reverse_transliterate(ipa_text, eastern)
+            for ipa_text in ipa_texts
+        ]
@@ -0,0 +1,63 @@
+import collections
+import json
+import sys
+import os
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+benchmarks_dir = f'{script_dir}/../benchmarks/'
+
+sys.path.insert(1, benchmarks_dir)
+
+from syriac_corpus import generate_corpus, make_vocabulary
+from run_benchmarks import run_benchmarks
+from load_test import main as load_test_main
+from SyrTools import SyrTools
+
+s = SyrTools()
+
+
+def test_corpus_is_reproducible():
+    """
+    Tests that the corpus depends only on its seed.
+    """
+    assert generate_corpus(50, seed=3) == generate_corpus(50, seed=3)
+    assert generate_corpus(50, seed=3) != generate_corpus(50, seed=4)
+
+
+def test_corpus_is_zipfian_syriac():
+    """
+    Tests that corpus words come from the vocabulary, most frequent first.
+    """
+    vocabulary = make_vocabulary(200, seed=1)
+    assert len(set(vocabulary)) == 200
+
+    corpus = generate_corpus(400, seed=1, vocabulary_size=200)
+    assert all(s.isSyr(line) for line in corpus)
+    counts = collections.Counter(
+        word.rstrip(".؟!܀") for line in corpus for word in line.split()
+    )
+    assert counts[vocabulary[0]] > counts[vocabulary[50]]
+
+
+def test_run_benchmarks():
+    """
+    Tests that a small benchmark run reports every stage.
+    """
+    report = run_benchmarks(lines=10, repeat=1)
+    assert report["meta"]["lines"] == 10
+    for name in ("encode_ipa", "naturalize_ipa", "ipa_to_roman",
+                 "reverse_transliterate", "SyrTools.isSyr"):
+        assert report["results"][name]["best_s"] >= 0
+    assert report["results"]["construct.default"]["best_ms"] > 0
+
+
+def test_load_test(capsys):
+    """
+    Tests that a small load test against a spawned server succeeds.
+    """
+    assert load_test_main(["--spawn", "--requests", "40",
+                           "--connections", "3", "--pipeline", "4"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["client"]["errors"] == 0
+    assert report["server"]["requests"] == 40
@@ -0,0 +1,181 @@
+import io
+import json
+import sys
+import os
+import pytest
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f'{script_dir}/../src/'
+
+sys.path.insert(1, src_dir)
+
+import SyrCli
+from SyrCli import format_record, main, read_records
+from SyrTransliterator import SyrTransliterator
+
+s = SyrTransliterator(dialect_map_filename=f'{src_dir}/dialects/urmi.json',
+                      ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json')
+
+lines = [
+    "ܐܲܒܵܐ",
+    "ܒܨܲܦܪܵܐ ܟܹܐ ܟܵܬ݂ܒ݂ܹܢ ܐܸܓܪ̈ܵܬ݂ܵܐ",
+    "",
+    "ܫܘܼܐܵܠܵܐ ܡܸܨܝܵܐ ܝܠܹܗ؟",
+]
+
+
+def run(tmp_path, text, *args):
+    """
+    Runs the command line on a text and returns its output.
+    """
+    infile = tmp_path / "in.txt"
+    outfile = tmp_path / "out.txt"
+    infile.write_text(text, encoding="utf-8")
+    status = main([str(infile), "-o", str(outfile), *args])
+    assert status == 0
+    return outfile.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_line_mode(tmp_path, jobs):
+    """
+    Tests that line mode writes the selected fields of each line, in order.
+    """
+    output = run(tmp_path, "\n".join(lines) + "\n", "-d", "urmi",
+                 "-i", "intermediate", "-f", "ipa,romanized",
+                 "-j", jobs, "--chunksize", "1")
+    expected = "".join(
+        f"{s.transliterate(line)['ipa']}\t"
+        f"{s.transliterate(line)['romanized']}\n"
+        for line in lines
+    )
+    assert output == expected
+
+
+@pytest.mark.parametrize("mode", ["line", "paragraph"])
+def test_crlf_records(mode):
+    """
+    Tests that Windows line endings are not left on the records.
+    """
+    infile = io.StringIO("ܐܲܒܵܐ\r\nܫܠܵܡܵܐ\r\n", newline="")
+    records = [text for _, text in read_records(infile, mode, "text", "id")]
+    if mode == "line":
+        assert records == ["ܐܲܒܵܐ", "ܫܠܵܡܵܐ"]
+    else:
+        assert records == ["ܐܲܒܵܐ\r\nܫܠܵܡܵܐ"]
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("line", "a\\tb\\\\c\\r\\nd\tipa\n"),
+    ("paragraph", "a\\tb\\\\c\\r\nd\tipa\n\n"),
+])
+def test_format_record_escapes(mode, expected):
+    """
+    Tests that text output escapes the separators inside its fields.
+    """
+    result = {"romanized": "a\tb\\c\r\nd", "ipa": "ipa"}
+    assert format_record(None, result, mode, ["romanized", "ipa"],
+                         "id") == expected
+
+
+def test_paragraph_mode(tmp_path):
+    """
+    Tests that paragraph mode transliterates blank-line separated records.
+    """
+    output = run(tmp_path, "ܐܲܒܵܐ\nܫܠܵܡܵܐ\n\n\nܒܫܸܡܵܐ",
+                 "-m", "paragraph", "-d", "urmi", "-i", "intermediate")
+    assert output == (
+        s.transliterate("ܐܲܒܵܐ\nܫܠܵܡܵܐ")["romanized"] + "\n\n"
+        + s.transliterate("ܒܫܸܡܵܐ")["romanized"] + "\n\n"
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_jsonl_mode(tmp_path, jobs):
+    """
+    Tests that JSONL mode passes ids through and keeps the input order.
+    """
+    records = [{"id": i, "text": line} for i, line in enumerate(lines)]
+    records.append({"text": "ܐܲܒܵܐ", "other": 1})
+    text = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+    output = run(tmp_path, text, "-m", "jsonl", "-f", "natural_ipa",
+                 "-d", "urmi", "-i", "intermediate", "-j", jobs,
+                 "--chunksize", "2")
+    expected = [
+        {"id": r["id"],
+         "natural_ipa": s.transliterate(r["text"])["natural_ipa"]}
+        if "id" in r
+        else {"natural_ipa": s.transliterate(r["text"])["natural_ipa"]}
+        for r in records
+    ]
+    assert [json.loads(line) for line in output.splitlines()] == expected
+
+
+def test_jsonl_errors(tmp_path, capsys):
+    """
+    Tests that malformed JSONL input is reported with its line number.
+    """
+    infile = tmp_path / "in.jsonl"
+    infile.write_text('{"text": "ܐ"}\n{"id": 1}\n', encoding="utf-8")
+    status = main([str(infile), "-o", str(tmp_path / "out.txt"),
+                   "-m", "jsonl"])
+    assert status == 1
+    assert "line 2" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("args", [
+    ["-f", "syriac"],
+    ["-d", "klingon"],
+    ["-j", "0"],
+])
+def test_bad_arguments(tmp_path, args):
+    """
+    Tests that invalid options are rejected.
+    """
+    with pytest.raises(SystemExit):
+        run(tmp_path, "ܐ\n", *args)
+
+
+def test_open_failure_closes_files(tmp_path, monkeypatch):
+    """
+    Tests that the files already opened are closed when a later one cannot
+    be opened.
+    """
+    opened = []
+    open_text = SyrCli.open_text
+
+    def recording_open_text(name, mode):
+        handle = open_text(name, mode)
+        opened.append(handle)
+        return handle
+
+    monkeypatch.setattr(SyrCli, "open_text", recording_open_text)
+    infile = tmp_path / "in.txt"
+    infile.write_text("ܐ\n", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main([str(infile), str(infile), str(tmp_path / "missing.txt"),
+              "-o", str(tmp_path / "out.txt")])
+    assert len(opened) == 2
+    assert all(handle.closed for handle in opened)
+
+
+def test_vowel_system(tmp_path):
+    """
+    Tests that --vowel-system is passed to the engine.
+    """
+    assert run(tmp_path, "ܩܫ܊\n") == "qsh\n"
+    assert run(tmp_path, "ܩܫ܊\n", "-V", "eastern") == "qashisha\n"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_table_cache(tmp_path, jobs):
+    """
+    Tests that --table-cache writes the compiled tables and reuses them,
+    also in worker processes.
+    """
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        assert run(tmp_path, "ܐܲܒܵܐ\nܫܠܵܡܵܐ\n", "--jobs", jobs,
+                   "--table-cache", str(cache_dir)) == "aba\nshlama\n"
+        assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,103 @@
+import sys
+import os
+import pytest
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f'{script_dir}/../src/'
+
+sys.path.insert(1, src_dir)
+
+from SyrCorpus import (CorpusReader, index_path, iter_records, main,
+                       transliterate_corpus)
+from SyrTransliterator import SyrTransliterator
+
+s = SyrTransliterator()
+
+records = [
+    "ܐܲܒܵܐ",
+    "ܒܨܲܦܪܵܐ ܟܹܐ ܟܵܬ݂ܒ݂ܹܢ ܐܸܓܪ̈ܵܬ݂ܵܐ",
+    "",
+    "ܫܘܼܐܵܠܵܐ ܡܸܨܝܵܐ ܝܠܹܗ؟\nܐܲܒܵܐ",
+]
+
+
+@pytest.mark.parametrize("delimiter,jobs", [
+    ("\n\n", 1),
+    ("\u0000", 2),
+    ("܀", 1),
+])
+def test_transliterate_corpus(tmp_path, delimiter, jobs):
+    """
+    Tests that every record can be read back from the index in any order.
+    """
+    infile = tmp_path / "in.txt"
+    infile.write_bytes(delimiter.join(records).encode("utf-8"))
+    prefix = str(tmp_path / "out")
+    count = transliterate_corpus(s, str(infile), prefix, delimiter=delimiter,
+                                 jobs=jobs, chunksize=1)
+    assert count == len(records)
+
+    with CorpusReader(prefix) as reader:
+        assert len(reader) == len(records)
+        assert reader.fields == list(SyrTransliterator.OUTPUTS)
+        for index in reversed(range(len(records))):
+            expected = s.transliterate(records[index])
+            for field in SyrTransliterator.OUTPUTS:
+                assert reader.get(index, field) == expected[field], (
+                    f"Record {index} {field}"
+                )
+        assert reader.get(-1) == s.transliterate(records[-1])["romanized"]
+        with pytest.raises(IndexError):
+            reader.get(len(records))
+        with pytest.raises(ValueError):
+            reader.get(0, "syriac")
+
+
+def test_iter_records(tmp_path):
+    """
+    Tests that a trailing delimiter does not add an empty record.
+    """
+    infile = tmp_path / "in.txt"
+    infile.write_text("a\nb\n\nc\n", encoding="utf-8")
+    assert list(iter_records(str(infile))) == ["a", "b", "", "c"]
+    infile.write_text("", encoding="utf-8")
+    assert list(iter_records(str(infile))) == []
+
+
+def test_corpus_fields_and_errors(tmp_path):
+    """
+    Tests writing some of the forms, and that damaged indexes are rejected.
+    """
+    infile = tmp_path / "in.txt"
+    infile.write_text("\n".join(records[:2]), encoding="utf-8")
+    prefix = str(tmp_path / "out")
+    transliterate_corpus(s, str(infile), prefix, ["ipa"])
+    with CorpusReader(prefix) as reader:
+        assert reader.fields == ["ipa"]
+        assert reader.get(1, "ipa") == s.transliterate(records[1])["ipa"]
+    assert not os.path.exists(f"{prefix}.romanized")
+
+    with open(index_path(prefix), "r+b") as f:
+        f.truncate(os.path.getsize(index_path(prefix)) - 1)
+    with pytest.raises(ValueError):
+        CorpusReader(prefix)
+    with pytest.raises(ValueError):
+        transliterate_corpus(s, str(infile), prefix, ["syriac"])
+
+
+def test_corpus_command_line(tmp_path, capsys):
+    """
+    Tests the build and get commands.
+    """
+    infile = tmp_path / "in.txt"
+    infile.write_text("\n".join(records) + "\n", encoding="utf-8")
+    prefix = str(tmp_path / "out")
+    assert main(["build", str(infile), prefix, "-f", "romanized"]) == 0
+    capsys.readouterr()
+    assert main(["get", prefix, "1", "0"]) == 0
+    assert capsys.readouterr().out == (
+        s.transliterate(records[1])["romanized"] + "\n"
+        + s.transliterate(records[0])["romanized"] + "\n"
+    )
+    assert main(["get", prefix, "9"]) == 1
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import socket
+import sys
+import os
+import pytest
+
+script_path = os.path.realpath(__file__)
+script_dir = os.path.dirname(script_path)
+src_dir = f'{script_dir}/../src/'
+
+sys.path.insert(1, src_dir)
+
+from SyrServer import TransliterationServer, percentile
+from SyrTransliterator import SyrTransliterator
+
+texts = [
+    "ܐܲܒܵܐ",
+    "ܒܨܲܦܪܵܐ ܟܹܐ ܟܵܬ݂ܒ݂ܹܢ ܐܸܓܪ̈ܵܬ݂ܵܐ",
+    "ܫܘܼܐܵܠܵܐ ܡܸܨܝܵܐ ܝܠܹܗ؟",
+    "",
+]
+
+
+async def exchange(server, connect, requests):
+    """
+    Sends request lines on one connection and returns the response objects.
+    """
+    reader, writer = await connect()
+    for request in requests:
+        line = request if isinstance(request, str) else json.dumps(request)
+        writer.write(line.encode() + b"\n")
+    await writer.drain()
+    responses = [
+        json.loads(await reader.readline()) for _ in range(len(requests))
+    ]
+    writer.close()
+    return responses
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_server_tcp(workers):
+    """
+    Tests that pipelined requests are answered in order with the output of
+    the matching engine, and that bad requests get errors.
+    """
+    requests = [
+        {"id": i, "text": text, "dialect": dialect, "ipa": "intermediate"}
+        for i, text in enumerate(texts)
+        for dialect in ("urmi", "koine")
+    ]
+    requests += [
+        {"id": "a", "text": texts[1], "outputs": ["romanized"]},
+        {"id": "b", "text": texts[1], "dialect": "klingon"},
+        {"id": "c", "text": 5},
+        "not json",
+        {"op": "stats"},
+    ]
+
+    async def run():
+        server = TransliterationServer(
+            workers=workers, batch_window=0.005,
+            preload=[("urmi", "intermediate")],
+        )
+        await server.start()
+        listener = await server.listen_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            return await exchange(
+                server,
+                lambda: asyncio.open_connection("127.0.0.1", port),
+                requests,
+            )
+        finally:
+            listener.close()
+            await server.close()
+
+    responses = asyncio.run(run())
+    for request, response in zip(requests[:8], responses):
+        engine = SyrTransliterator.for_dialect(request["dialect"],
+                                               "intermediate")
+        assert response == {"id": request["id"],
+                            **engine.transliterate(request["text"])}
+    assert responses[8] == {
+        "id": "a",
+        "romanized": SyrTransliterator().transliterate(texts[1])["romanized"],
+    }
+    assert "klingon" in responses[9]["error"]
+    assert responses[10]["id"] == "c" and "error" in responses[10]
+    assert "error" in responses[11]
+    stats = responses[12]
+    assert stats["requests"] >= 10
+    assert stats["errors"] >= 1
+    assert 1 <= stats["mean_batch_size"] <= 64
+    assert stats["latency_ms"]["p50"] <= stats["latency_ms"]["max"]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"),
+                    reason="Unix sockets are not available")
+def test_server_unix(tmp_path):
+    """
+    Tests that the server answers on a Unix socket.
+    """
+    path = str(tmp_path / "syr.sock")
+
+    async def run():
+        server = TransliterationServer(batch_window=0)
+        await server.start()
+        listener = await server.listen_unix(path)
+        try:
+            return await exchange(
+                server,
+                lambda: asyncio.open_unix_connection(path),
+                [{"text": text} for text in texts],
+            )
+        finally:
+            listener.close()
+            await server.close()
+
+    responses = asyncio.run(run())
+    assert responses == [SyrTransliterator().transliterate(t) for t in texts]
+
+
+def test_server_bad_preload():
+    """
+    Tests that unknown preloaded engines are rejected.
+    """
+    with pytest.raises(ValueError):
+        TransliterationServer(preload=[("klingon", "")])
+
+
+@pytest.mark.parametrize("fraction,expected", [
+    (0.5, 5),
+    (0.9, 9),
+    (0.99, 10),
+    (0.0, 1),
+])
+def test_percentile(fraction, expected):
+    """
+    Tests nearest-rank percentiles.
+    """
+    assert percentile(list(range(1, 11)), fraction) == expected
+    assert percentile([], fraction) == 0.0
@@ -60,6 +60,13 @@ test_cases = {
     "Welcome!": {'containsSyr': False, 'isSyr': False, 'ratio': 0.0},
     "!!!!!!!": {'containsSyr': False, 'isSyr': False, 'ratio': 0.0},
     "!!!ܐ!!!": {'containsSyr': True, 'isSyr': True, 'ratio': 1.0},
+
+    # ## Characters without a Unicode name and Syriac outside the main block
+    "ܐ\n": {'containsSyr': True, 'isSyr': True, 'ratio': 0.5},
+    "ܐ\ue000": {'containsSyr': True, 'isSyr': True, 'ratio': 0.5},
+    "ܐ♰": {'containsSyr': True, 'isSyr': True, 'ratio': 1.0},
+    "ࡠܐ": {'containsSyr': True, 'isSyr': True, 'ratio': 1.0},
+    "ܫܠܵܡܵܐ 😀": {'containsSyr': True, 'isSyr': False, 'ratio': 0.875},
 }
 
 @pytest.mark.parametrize("syriac_text,expected", list(test_cases.items()))
@@ -94,4 +101,49 @@ def test_isSyr(syriac_text, expected):
         f"Text: {syriac_text}\n"
         f"Expected: {expected['ratio']}\n"
         f"Got:      {ratio}"
-    )
\ No newline at end of file
+    )
+
+@pytest.mark.parametrize("char,flags,not_flags", [
+    ("ܒ", s.CLASS_LETTER | s.CLASS_BDOL_LETTER | s.CLASS_SYRIAC_BLOCK,
+     s.CLASS_VOWEL),
+    ("ܲ", s.CLASS_VOWEL | s.CLASS_EASTERN_VOWEL | s.CLASS_DIACRITIC,
+     s.CLASS_WESTERN_VOWEL),
+    ("݂", s.CLASS_RUKAKHEH | s.CLASS_NON_VOWEL_DIACRITIC, s.CLASS_VOWEL),
+    ("̈", s.CLASS_SIYAMEH | s.CLASS_VALID_NON_CODEPOINT, s.CLASS_SYRIAC_BLOCK),
+    ("؟", s.CLASS_PUNCTUATION | s.CLASS_VALID_NON_CODEPOINT, s.CLASS_LETTER),
+    ("a", 0, ~0),
+])
+def test_classify(char, flags, not_flags):
+    """
+    Tests the character class bitmask of classify().
+    """
+    assert s.classify(char) & flags == flags
+    assert s.classify(char) & not_flags == 0
+
+
+def test_class_sets():
+    """
+    Tests that the frozen set views match the character tuples.
+    """
+    assert s.LETTER_SET == frozenset(s.LETTER)
+    assert s.VOWEL_SET == frozenset(s.VOWEL)
+    assert s.EASTERN_VOWEL_SET == frozenset(s.EASTERN_VOWELS)
+    assert s.PUNCTUATION_SET == frozenset(s.PUNCTUATION)
+    assert s.NON_VOWEL_DIACRITIC_SET == frozenset(s.NON_VOWEL_DIACRITICS)
+    assert s.chars_of_class(s.CLASS_MATIS_VOWEL) == frozenset(s.MATIS_VOWEL)
+
+
+@pytest.mark.parametrize("text,eastern,western,vowels,garshuni", [
+    ("ܐܲܒܵܐ", True, False, True, False),
+    ("ܐܰܒܳܐ", False, True, True, False),
+    ("ܐܒܐ ܭ", False, False, False, True),
+    ("Welcome ܐܲ", False, False, True, False),
+])
+def test_predicates(text, eastern, western, vowels, garshuni):
+    """
+    Tests the vowel system and Garshuni predicates.
+    """
+    assert s.eastern(text) == eastern
+    assert s.western(text) == western
+    assert s.contains_vowels(text) == vowels
+    assert s.contains_garshuni(text) == garshuni
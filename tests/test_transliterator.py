@@ -1,3 +1,5 @@
+import io
+import json
 import sys
 import os
 import pytest
@@ -8,7 +10,11 @@ src_dir = f'{script_dir}/../src/'
 
 sys.path.insert(1, src_dir)
 
-from SyrTransliterator import SyrTransliterator
+from SyrTransliterator import (
+    SyrTransliterator,
+    StageTimer,
+    compile_longest_match,
+)
 
 s = SyrTransliterator(dialect_map_filename=f'{src_dir}/dialects/koine.json',
                       ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json')
@@ -99,4 +105,707 @@ def test_syriac_transliteration(syriac_text, expected):
         f"Text: {syriac_text}\n"
         f"Expected Reverse: {reverse_expected}\n"
         f"Got:              {revipa}"
-    )
\ No newline at end of file
+    )
+
+@pytest.mark.parametrize("ipa_file", ["", f"{src_dir}/ipa/intermediate.json"])
+def test_cluster_table_matches_maps(ipa_file):
+    """
+    Tests that every precompiled cluster resolves to the same IPA as applying
+    the Syriac to IPA maps directly.
+    """
+    t = SyrTransliterator(ipa_mapping_filename=ipa_file)
+    t.compile_tables()
+    for cluster, ipa in t.cluster_ipa_table.items():
+        ranks = [t.cluster_char_rank[c] for c in cluster]
+        assert ranks == sorted(ranks), f"Cluster not canonical: {cluster}"
+        assert ipa == t.apply_cluster_maps(cluster), (
+            f"\n[Cluster Table Mismatch]\n"
+            f"Cluster: {cluster}\n"
+            f"Expected: {t.apply_cluster_maps(cluster)}\n"
+            f"Got:      {ipa}"
+        )
+
+
+def test_shared_cluster_table():
+    """
+    Tests that engines with equal maps share one cluster table and that
+    editing one engine's maps leaves the other's table alone.
+    """
+    a = SyrTransliterator()
+    b = SyrTransliterator()
+    a.compile_tables()
+    b.compile_tables()
+    assert a.cluster_ipa_table is b.cluster_ipa_table
+    assert not hasattr(a, "__dict__")
+
+    assert a.vector_tables() is b.vector_tables()
+
+    a.consonant_ipa_map["ܒ"] = "B"
+    assert a.transliterate("ܒ")["ipa"] == "B"
+    assert b.transliterate("ܒ")["ipa"] == "b"
+    assert a.cluster_ipa_table is not b.cluster_ipa_table
+    assert a.vector_tables()[1]["ܒ"] == "B"
+    assert b.vector_tables()[1]["ܒ"] == "b"
+
+
+def test_construction_shares_tables():
+    """
+    Tests that constructing an engine compiles nothing, and that a second
+    engine with the same mappings reuses every compiled table of the first.
+    """
+    files = dict(dialect_map_filename=f'{src_dir}/dialects/urmi.json',
+                 ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json')
+    a = SyrTransliterator(**files)
+    expected = a.transliterate("ܫܠܵܡܵܐ")
+    b = SyrTransliterator(**files)
+    assert b.tables_stale
+    for name in SyrTransliterator.COMPILED_ATTRIBUTES:
+        assert not hasattr(b, name), name
+    assert b.transliterate("ܫܠܵܡܵܐ") == expected
+    for name in SyrTransliterator.COMPILED_ATTRIBUTES:
+        assert getattr(b, name) is getattr(a, name), name
+
+
+@pytest.mark.parametrize("cluster,expected", [
+    ("ܒ݂ܹ", "ve"),     # canonical order
+    ("ܒܹ݂", "ve"),     # vowel before rukakha
+    ("ܬ݂ܵ", "θɑ"),     # vowel before rukakha
+    ("ܐ݇", "[ʔ]"),     # talqana
+    ("ܗܹ̇", "hė"),     # qanuneh before vowel
+    ("ܐܲܲ", "ʔaa"),    # not in the table
+])
+def test_tokenize_cluster_order(cluster, expected):
+    """
+    Tests that clusters are tokenized the same regardless of mark order.
+    """
+    assert s.tokenize_cluster(cluster) == expected
+
+
+@pytest.mark.parametrize("syriac_text,expected", [
+    ("ܐܲܒܵܐ ـ ܐܲܒܵܐ", "ʔabɑʔ  ʔabɑʔ"),          # decorative-only word
+    ("ܐܲـܒܵܐ", "ʔabɑʔ"),                         # kashida inside a word
+    ("܏ܩܛ", "qtˤ"),                               # abbreviation mark
+    ("ܐܲܒܵܐ܁ܐܲܒܵܐ܋ܐܲܒܵܐ", "ʔabɑʔ.ʔabɑʔʔabɑʔ"),  # unspaced punctuation
+    ("ܫܠܵܡܵܐ! Welcome!", "ʃlɑmɑʔ! !"),
+])
+def test_encode_ipa(syriac_text, expected):
+    """
+    Tests that encode_ipa() handles word, cluster and punctuation boundaries
+    in a single scan.
+    """
+    assert s.encode_ipa(syriac_text) == expected
+
+
+cached = SyrTransliterator(
+    dialect_map_filename=f'{src_dir}/dialects/koine.json',
+    ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json',
+    word_cache_size=8,
+)
+
+
+@pytest.mark.parametrize("syriac_text", list(test_cases))
+def test_word_cache_transliteration(syriac_text):
+    """
+    Tests that transliterate() returns the same result with the word cache
+    enabled, including when the words are served from the cache.
+    """
+    expected = s.transliterate(syriac_text)
+    assert cached.transliterate(syriac_text) == expected
+    assert cached.transliterate(syriac_text) == expected
+
+
+def test_word_cache_info_and_invalidation():
+    """
+    Tests the word cache statistics, eviction and invalidation when a map
+    changes.
+    """
+    t = SyrTransliterator(word_cache_size=2)
+    t.transliterate(" ܐܲܒܵܐ ܐܲܒܵܐ ܐܲܒܵܐ ")
+    assert t.cache_info() == (2, 1, 0, 2, 1)
+
+    t.transliterate(" ܟܹܐ! ܟܹܐ. ܡܵܐ ")
+    assert t.cache_info() == (3, 3, 1, 2, 2)
+
+    t.consonant_ipa_map["ܟ"] = "c"
+    assert t.cache_info().currsize == 0
+    assert t.transliterate(" ܟܹܐ ")["ipa"] == " ceʔ "
+
+    t.cache_clear()
+    assert t.cache_info() == (0, 0, 0, 2, 0)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_transliterate_stream(chunk_size):
+    """
+    Tests that streaming a document in chunks produces the same output as
+    transliterating it at once.
+    """
+    document = "\n".join(test_cases) + "\n"
+    expected = s.transliterate(document)
+
+    outfiles = {key: io.StringIO() for key in expected}
+    s.transliterate_stream(io.StringIO(document), outfiles, chunk_size)
+    for key, outfile in outfiles.items():
+        assert outfile.getvalue() == expected[key]
+
+
+def test_iter_transliterate_cuts():
+    """
+    Tests that text without separators is held until one arrives, and that
+    each piece is cut after the last separator of its chunk.
+    """
+    chunks = ["ܐܲ", "ܒܵ", "", "ܐ ܫܠܵ", "ܡܵܐ", ". ܐܲ", "ܒܵܐ"]
+    pieces = list(s.iter_transliterate(chunks))
+    expected = s.transliterate("".join(chunks))
+    assert len(pieces) == 3
+    for index, name in enumerate(s.OUTPUTS):
+        assert "".join(piece[index] for piece in pieces) == expected[name]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_transliterate_many(workers):
+    """
+    Tests that batch transliteration on a process pool returns the same
+    results as transliterate(), in input order.
+    """
+    texts = list(test_cases) * 3
+    results = list(s.transliterate_many(texts, workers=workers, chunksize=4))
+    assert results == [s.transliterate(text) for text in texts]
+
+
+def test_transliterate_many_edited_maps():
+    """
+    Tests that workers pick up maps edited after loading.
+    """
+    t = SyrTransliterator()
+    t.ipa_to_roman_map["ʃ"] = "š"
+    results = list(t.transliterate_many(["ܫܠܵܡܵܐ"] * 3, workers=2))
+    assert [r["romanized"] for r in results] == ["šlama"] * 3
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"vowel_system": "bad"},
+    {"outputs": ["ipa", "bad"]},
+    {"chunksize": 0},
+])
+def test_transliterate_many_checks_at_call(kwargs):
+    """
+    Tests that invalid arguments raise when transliterate_many() is called,
+    before any text is consumed.
+    """
+    consumed = []
+
+    def texts():
+        consumed.append(True)
+        yield "ܫܠܵܡܵܐ"
+
+    with pytest.raises(ValueError):
+        s.transliterate_many(texts(), workers=2, **kwargs)
+    assert consumed == []
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("tʃa", ["tʃ", "a"]),
+    ("tˤtx", ["tˤ", "t"]),
+    ("abcd", ["abcd"]),
+    ("abce", ["ab", "c"]),
+    ("", []),
+])
+def test_compile_longest_match(text, expected):
+    """
+    Tests that the compiled pattern matches the longest key at each
+    position, for keys of any length.
+    """
+    pattern = compile_longest_match(["t", "tˤ", "tʃ", "a", "ab", "abcd", "c"])
+    assert pattern.findall(text) == expected
+
+
+def test_reverse_transliterate_many():
+    """
+    Tests the batch reverse transliteration and that the inverted maps
+    follow edits to the maps.
+    """
+    ipa_texts = [s.transliterate(text)["ipa"] for text in test_cases]
+    assert s.reverse_transliterate_many(ipa_texts) == [
+        s.reverse_transliterate(ipa_text) for ipa_text in ipa_texts
+    ]
+
+    t = SyrTransliterator()
+    assert t.reverse_transliterate("ʃlɑmɑʔ") == "ܫܠܵܡܵܐ"
+    t.consonant_ipa_map["ܫ"] = "š"
+    assert t.reverse_transliterate("šlɑmɑʔ") == "ܫܠܵܡܵܐ"
+
+
+def test_dialect_romanization_long_keys(tmp_path):
+    """
+    Tests that dialect files can add romanization keys longer than three
+    characters, and that the longest key wins.
+    """
+    with open(f'{src_dir}/dialects/koine.json', encoding="utf-8") as f:
+        dialect = json.load(f)
+    dialect["romanization"]["ʃlɑm"] = "SHLAM"
+    dialect_file = tmp_path / "dialect.json"
+    dialect_file.write_text(json.dumps(dialect), encoding="utf-8")
+
+    t = SyrTransliterator(dialect_map_filename=str(dialect_file))
+    assert t.transliterate("ܫܠܵܡܵܐ ܫܠܵܐ")["romanized"] == "SHLAMa shla"
+
+
+@pytest.mark.parametrize("ipa_text", [
+    "ʔabɑʔ bʃɪmɑʔ, wlʔɑ-ʔ",
+    "ʃl[ɑ ʔ]ɑmɑʔ] d[xʔ",
+    "ʔ ' bʔ lɑ\n\nwʃ",
+    "",
+])
+def test_ipa_to_roman_one_pass(ipa_text):
+    """
+    Tests that romanizing in one pass matches running the steps in turn,
+    also when a romanization key spans a separator.
+    """
+    t = SyrTransliterator()
+    for key in [None, "ɑ ʔ", "ɑ'"]:
+        if key is not None:
+            t.ipa_to_roman_map[key] = "X"
+        steps = t.map_to_roman(t.handle_glottals(t.apply_bdol_prefixes(
+            t.remove_bracketed_content(ipa_text))))
+        assert t.ipa_to_roman(ipa_text) == steps, f"With key {key!r}"
+        assert t.roman_map_by_token == (key is None)
+
+
+@pytest.mark.parametrize("dialect", SyrTransliterator.available_dialects())
+def test_for_dialect(dialect):
+    """
+    Tests that for_dialect() returns one shared, frozen engine per dialect
+    that transliterates like an engine built from the same files.
+    """
+    engine = SyrTransliterator.for_dialect(dialect, ipa="intermediate")
+    assert SyrTransliterator.for_dialect(dialect, "intermediate") is engine
+
+    built = SyrTransliterator(
+        dialect_map_filename=f'{src_dir}/dialects/{dialect}.json',
+        ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json',
+    )
+    for syriac_text in test_cases:
+        assert engine.transliterate(syriac_text) == built.transliterate(
+            syriac_text
+        ), f"Text: {syriac_text}"
+
+    with pytest.raises(TypeError):
+        engine.ipa_to_roman_map["a"] = "A"
+    with pytest.raises(AttributeError):
+        engine.prepositional_b = "b"
+
+
+def test_for_dialect_unknown():
+    """
+    Tests that for_dialect() rejects names that are not bundled.
+    """
+    with pytest.raises(ValueError):
+        SyrTransliterator.for_dialect("klingon")
+    with pytest.raises(ValueError):
+        SyrTransliterator.for_dialect("koine", ipa="klingon")
+
+
+def test_load_cached(tmp_path, monkeypatch):
+    """
+    Tests that cached tables give the same engine without compiling, and
+    that the cache is rebuilt when the sources change or it is damaged.
+    """
+    cache_dir = str(tmp_path / "cache")
+    dialect_file = tmp_path / "dialect.json"
+    with open(f'{src_dir}/dialects/koine.json', encoding="utf-8") as f:
+        dialect = json.load(f)
+    dialect_file.write_text(json.dumps(dialect), encoding="utf-8")
+    ipa_file = f'{src_dir}/ipa/intermediate.json'
+    text = " ".join(test_cases)
+
+    def load():
+        return SyrTransliterator.load_cached(str(dialect_file), ipa_file,
+                                             cache_dir=cache_dir)
+
+    expected = load().transliterate(text)
+    assert expected == s.transliterate(text)
+    [name] = os.listdir(cache_dir)
+    path = os.path.join(cache_dir, name)
+
+    def no_compile(self):
+        raise AssertionError("tables compiled")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SyrTransliterator, "compile_tables", no_compile)
+        engine = load()
+        assert engine.transliterate(text) == expected
+        assert (engine.reverse_transliterate(expected["ipa"])
+                == s.reverse_transliterate(expected["ipa"]))
+        assert engine.engine_config() == s.engine_config()._replace(
+            dialect_map_filename=str(dialect_file), cache_dir=cache_dir)
+        assert (SyrTransliterator.from_config(engine.engine_config())
+                .transliterate(text) == expected)
+
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
+    assert load().transliterate(text) == expected
+    with open(path, "r+b") as f:
+        f.truncate(10)
+    assert load().transliterate(text) == expected
+    assert os.path.getsize(path) > 10
+
+    dialect["romanization"]["ʃlɑm"] = "SHLAM"
+    dialect_file.write_text(json.dumps(dialect), encoding="utf-8")
+    assert load().transliterate("ܫܠܵܡܵܐ")["romanized"] == "SHLAMa"
+    assert os.listdir(cache_dir) == [name]
+
+    engine = SyrTransliterator.load_cached(str(dialect_file), ipa_file, 7)
+    assert engine.word_cache_size == 7
+    assert os.listdir(cache_dir) == [name]
+
+    # A directory others can write to is not trusted.
+    os.remove(path)
+    os.chmod(cache_dir, 0o777)
+    assert load().transliterate(text) == expected
+    assert os.listdir(cache_dir) == []
+
+
+@pytest.mark.parametrize("syriac_text", list(test_cases))
+def test_transliterate_dialects(syriac_text):
+    """
+    Tests that transliterate_dialects() matches transliterate() on an engine
+    built for each dialect.
+    """
+    results = s.transliterate_dialects(syriac_text)
+    assert sorted(results) == SyrTransliterator.available_dialects()
+    for dialect, result in results.items():
+        engine = SyrTransliterator(
+            dialect_map_filename=f'{src_dir}/dialects/{dialect}.json',
+            ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json',
+        )
+        expected = engine.transliterate(syriac_text)
+        assert result == expected, (
+            f"\n[Dialect Mismatch]\n"
+            f"Text: {syriac_text}\n"
+            f"Dialect: {dialect}\n"
+            f"Expected: {expected}\n"
+            f"Got:      {result}"
+        )
+
+
+def test_stage_timing():
+    """
+    Tests that timing records every stage without changing the output, and
+    that snapshots, resets and observers work.
+    """
+    t = SyrTransliterator(dialect_map_filename=f'{src_dir}/dialects/koine.json',
+                          ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json')
+    assert t.stage_timer is None
+
+    timer = t.enable_timing()
+    observed = []
+    timer.add_observer(lambda stage, seconds, chars: observed.append(stage))
+    for syriac_text in test_cases:
+        assert t.transliterate(syriac_text) == s.transliterate(syriac_text)
+
+    snapshot = timer.snapshot()
+    for stage in ("encode_ipa", "encode_ipa.split", "encode_ipa.abbreviations",
+                  "encode_ipa.special_cases", "encode_ipa.tokenize",
+                  "remove_siyame", "naturalize_ipa", "ipa_to_roman",
+                  "ipa_to_roman.brackets", "ipa_to_roman.bdol",
+                  "ipa_to_roman.glottals", "ipa_to_roman.map"):
+        assert snapshot[stage].calls == len(test_cases), stage
+        assert snapshot[stage].seconds >= 0
+    assert snapshot["encode_ipa"].chars == sum(map(len, test_cases))
+    assert len(observed) == sum(stats.calls for stats in snapshot.values())
+
+    timer.reset()
+    assert timer.snapshot() == {}
+
+    shared = StageTimer()
+    engine = SyrTransliterator(dialect_map_filename=f'{src_dir}/dialects/koine.json',
+                               ipa_mapping_filename=f'{src_dir}/ipa/intermediate.json')
+    assert engine.enable_timing(shared) is shared
+    engine.transliterate("ܐܲܒܵܐ")
+    engine.disable_timing()
+    engine.transliterate("ܐܲܒܵܐ")
+    assert shared.snapshot()["encode_ipa"].calls == 1
+
+
+def test_frozen_timing():
+    """
+    Tests that timing cannot be enabled on a shared frozen engine.
+    """
+    engine = SyrTransliterator.for_dialect("koine", "intermediate")
+    with pytest.raises(AttributeError):
+        engine.enable_timing()
+    with pytest.raises(AttributeError):
+        engine.stage_timer = StageTimer()
+    assert engine.stage_timer is None
+
+
+def test_tokenize_word_timed():
+    """
+    Tests that tokenize_word() gives the same IPA while timing is enabled.
+    """
+    t = SyrTransliterator()
+    expected = t.tokenize_word("ܟܵܬ݂ܒ݂ܹܢ")
+    t.enable_timing()
+    assert t.tokenize_word("ܟܵܬ݂ܒ݂ܹܢ") == expected == "kɑθven"
+
+
+@pytest.mark.parametrize("engine", [s, cached])
+@pytest.mark.parametrize("outputs", [
+    ["ipa"],
+    ["natural_ipa"],
+    ["romanized"],
+    ["romanized", "ipa"],
+    ("ipa", "natural_ipa", "romanized"),
+])
+def test_selective_outputs(engine, outputs):
+    """
+    Tests that transliterate() returns only the requested forms, in the
+    usual key order, with the same values as the full result.
+    """
+    for syriac_text in test_cases:
+        full = engine.transliterate(syriac_text)
+        result = engine.transliterate(syriac_text, outputs=outputs)
+        assert result == {key: full[key] for key in full if key in outputs}
+        assert list(result) == [k for k in SyrTransliterator.OUTPUTS
+                                if k in outputs]
+
+
+def test_selective_outputs_unknown():
+    """
+    Tests that unknown output names are rejected.
+    """
+    with pytest.raises(ValueError):
+        s.transliterate("ܐܲܒܵܐ", outputs=["syriac"])
+
+
+def test_selective_outputs_skip_stages():
+    """
+    Tests that stages no requested form needs are not run.
+    """
+    t = SyrTransliterator()
+    timer = t.enable_timing()
+    t.transliterate("ܐܲܒܵܐ", outputs=["natural_ipa"])
+    assert "naturalize_ipa" in timer.snapshot()
+    assert "ipa_to_roman" not in timer.snapshot()
+    t.transliterate("ܐܲܒܵܐ", outputs=["ipa"])
+    assert timer.snapshot()["naturalize_ipa"].calls == 1
+
+
+def test_selective_outputs_skip_stages_cached(monkeypatch):
+    """
+    Tests that stages no requested form needs are not run when the words
+    are cached, and that the cached forms of each request are right.
+    """
+    text = "ܐܲܒܵܐ ܫܠܵܡܵܐ"
+    expected = s.transliterate(text)
+    calls = []
+    for stage in ("naturalize_ipa", "ipa_to_roman"):
+        original = getattr(SyrTransliterator, stage)
+
+        def spy(self, text, original=original, stage=stage):
+            calls.append(stage)
+            return original(self, text)
+
+        monkeypatch.setattr(SyrTransliterator, stage, spy)
+
+    t = SyrTransliterator(word_cache_size=100)
+    assert t.transliterate(text, outputs=["ipa"]) == {
+        "ipa": expected["ipa"]}
+    assert calls == []
+    assert t.transliterate(text, outputs=["natural_ipa"]) == {
+        "natural_ipa": expected["natural_ipa"]}
+    assert "naturalize_ipa" in calls and "ipa_to_roman" not in calls
+    assert t.transliterate(text) == expected
+    assert "ipa_to_roman" in calls
+
+
+@pytest.mark.parametrize("word,expected", [
+    ("ܗ̇ܘ", "ܐܵܘܵ"),          # whole word
+    ("ܕܗ̇ܝ", "ܕܐܵܝܵ"),        # inside a word
+    ("ܟܠܵܐ", "ܟܠܵܐ"),        # followed by a vowel
+    ("ܟܠܢ", "ܟܘܼܠܢ"),        # earlier rule wins
+    ("ܟܠܟܠܵ", "ܟܘܼܠܟܘܼܠܵ"),    # the first occurrence decides for all
+    ("ܟܠܵܟܠ", "ܟܠܵܟܠ"),
+    ("ܟܠܟܠ", "ܟܘܼܠܟܘܼܠ"),
+])
+def test_apply_special_cases(word, expected):
+    """
+    Tests the order and vowel guard of the special case rules.
+    """
+    assert s.apply_special_cases(word) == expected
+
+
+def test_dialect_special_cases(tmp_path):
+    """
+    Tests that dialect files can add special cases and abbreviations, and
+    that editing the rules takes effect.
+    """
+    with open(f'{src_dir}/dialects/koine.json', encoding="utf-8") as f:
+        dialect = json.load(f)
+    dialect["special_cases"] = {"ܫܠܡ": "ܫܠܵܡܵܐ"}
+    dialect["abbreviations"] = [["ܡܪܝ", "ܡܵܪܝ"]]
+    dialect_file = tmp_path / "dialect.json"
+    dialect_file.write_text(json.dumps(dialect), encoding="utf-8")
+
+    t = SyrTransliterator(dialect_map_filename=str(dialect_file))
+    assert list(t.special_case_map)[-1] == "ܫܠܡ"
+    assert t.transliterate("ܫܠܡ")["romanized"] == "shlama"
+    assert t.transliterate("ܫܠܡܲ")["romanized"] == "shlma"
+    assert t.transliterate("ܡܪܝܵ")["romanized"] == "marya"
+    assert t.transliterate("ܡܪܝ")["romanized"] == "mry"  # not Eastern
+
+    t.special_case_map["ܫܠܡ"] = "ܫܠܵܡ"
+    assert t.transliterate("ܫܠܡ")["romanized"] == "shlam"
+    del t.abbreviation_map["ܡܪܝ"]
+    assert t.transliterate("ܡܪܝܵ")["romanized"] == "mrya"
+
+
+@pytest.mark.parametrize("engine", [s, cached])
+@pytest.mark.parametrize("vowel_system,expected", [
+    ("auto", "qsh aba"),        # the abbreviation has no Eastern vowel
+    ("eastern", "qashisha aba"),
+    ("western", "qsh aba"),
+])
+def test_vowel_system(engine, vowel_system, expected):
+    """
+    Tests that a known vowel system decides for every word of the text.
+    """
+    text = "ܩܫ܊ ܐܲܒܵܐ"
+    result = engine.transliterate(text, vowel_system=vowel_system)
+    assert result["romanized"] == expected, (
+        f"Expected {expected}, got {result['romanized']}"
+    )
+    pieces = engine.iter_transliterate(text, vowel_system)
+    assert "".join(piece[2] for piece in pieces) == expected
+    assert engine.transliterate_dialects(
+        text, ["koine"], vowel_system
+    )["koine"]["ipa"] == result["ipa"]
+
+
+def test_vowel_system_unknown():
+    """
+    Tests that an unknown vowel system is rejected.
+    """
+    for call in (s.transliterate, s.encode_ipa, s.transliterate_dialects):
+        with pytest.raises(ValueError):
+            call("ܐܲܒܵܐ", vowel_system="syriac")
+
+
+@pytest.mark.parametrize("engine", [s, cached])
+@pytest.mark.parametrize("syriac_text", list(test_cases))
+def test_transliterate_aligned(engine, syriac_text):
+    """
+    Tests that the aligned tokens tile the text and every output, and that
+    the outputs equal those of transliterate().
+    """
+    result, tokens = engine.transliterate_aligned(syriac_text)
+    assert result == engine.transliterate(syriac_text)
+    sources = "".join(syriac_text[slice(*t.source)] for t in tokens)
+    assert sources == syriac_text
+    for name in engine.OUTPUTS:
+        pieces = [result[name][slice(*getattr(t, name))] for t in tokens]
+        assert "".join(pieces) == result[name], f"{name} is not tiled"
+    for token in tokens:
+        if token.separator:
+            assert token.source[1] - token.source[0] == 1
+
+
+def test_transliterate_aligned_words():
+    """
+    Tests that each word is aligned with its own transliteration.
+    """
+    text = "ܐܲܒܵܐ ܘܫܠܵܡܵܐ"
+    result, tokens = s.transliterate_aligned(text)
+    words = [
+        (text[slice(*t.source)], result["romanized"][slice(*t.romanized)])
+        for t in tokens
+        if not t.separator
+    ]
+    assert words == [
+        (word, s.transliterate(word)["romanized"]) for word in text.split()
+    ]
+
+
+@pytest.mark.parametrize("engine", [s, cached])
+def test_transliterate_edit(engine):
+    """
+    Tests that edits give the same result as transliterating the edited
+    text, and that the returned output edits turn the old outputs into the
+    new ones.
+    """
+    state = engine.transliterate_incremental("ܐܲܒܵܐ ܫܠܵܡܵܐ.")
+    edits = [
+        (6, 0, "ܘ"),            # prefix a word
+        (0, 0, "ܩܫ܊ "),         # insert at the start
+        (5, 6, ""),             # delete across a word boundary
+        (3, 1, "\n"),           # replace a separator
+        (len(state.text) - 1, 1, ""),   # delete at the end
+        (0, 0, ""),
+    ]
+    for offset, deleted, inserted in edits:
+        offset = min(offset, len(state.text))
+        deleted = min(deleted, len(state.text) - offset)
+        new_state, changes = engine.transliterate_edit(
+            state, offset, deleted, inserted
+        )
+        text = state.text[:offset] + inserted + state.text[offset + deleted:]
+        result, tokens = engine.transliterate_aligned(text)
+        assert new_state.text == text
+        assert new_state.result == result, f"Edit {offset} of {text!r}"
+        assert new_state.tokens() == tokens
+        for name, change in changes.items():
+            old = state.result[name]
+            assert (
+                old[:change.offset]
+                + change.inserted
+                + old[change.offset + change.deleted:]
+            ) == result[name]
+        state = new_state
+
+
+def test_transliterate_edit_out_of_range():
+    """
+    Tests that an edit outside of the text is rejected.
+    """
+    state = s.transliterate_incremental("ܐܲܒܵܐ")
+    for offset, deleted in [(-1, 0), (4, 2), (6, 0)]:
+        with pytest.raises(ValueError):
+            s.transliterate_edit(state, offset, deleted, "")
+
+
+@pytest.mark.parametrize("engine", ["default", "koine"])
+@pytest.mark.parametrize("vowel_system", SyrTransliterator.VOWEL_SYSTEMS)
+def test_encode_ipa_vectorized(engine, vowel_system, monkeypatch):
+    """
+    Tests that the NumPy path gives the same IPA as the scalar one, and that
+    encode_ipa() switches to it for long texts.
+    """
+    pytest.importorskip("numpy")
+    engine = SyrTransliterator() if engine == "default" else s
+    text = " ".join(
+        list(test_cases) + [
+            "ܡܪܝ ܏ܩ ܟܬܒܐ܊ ܒـܫܡܐ",
+            "\n\t. ، ؟",
+            "ܐ\U0001F600ܒ x\ud800",
+        ]
+    )
+    expected = engine.encode_ipa(text, vowel_system)
+    if vowel_system == "auto" and engine.EASTERN_VOWEL_SET.isdisjoint(text):
+        vowel_system = "western"
+    assert engine.encode_ipa_vectorized(text, vowel_system) == expected
+    assert engine.encode_ipa_vectorized("", vowel_system) == ""
+
+    calls = []
+    monkeypatch.setattr(
+        SyrTransliterator, "encode_ipa_vectorized",
+        lambda self, *args: calls.append(args) or "",
+    )
+    monkeypatch.setattr(SyrTransliterator, "VECTORIZE_MIN_CHARS", len(text))
+    engine.encode_ipa(text[1:])
+    assert calls == []
+    engine.encode_ipa(text)
+    assert len(calls) == 1